@@ -34,14 +34,16 @@ import configparser
 import json
 import logging
 import os
+import urllib.parse
 from typing import Any
 
-import boto3
 from botocore.exceptions import ClientError
 
 # === SHARED CONFIGURATION IMPORTS ===
 # SHARED_CONFIG_IMPORT: Development-only imports replaced in deployment
 from .shared_configuration import (
+    OAuthConfigSnapshot,
+    OAuthConfigSnapshotCache,
     OAuthConfigurationManager,
     OAuthRequestProcessor,
     OAuthSecurityValidator,
@@ -49,11 +51,20 @@ from .shared_configuration import (
     RateLimiter,
     SecurityEventLogger,
     SecurityValidator,
+    bind_correlation_id,
+    create_aws_client,
+    create_distributed_rate_limit_backend,
+    create_oauth_refresh_coalescer,
     create_structured_logger,
     create_warmup_response,
     extract_correlation_id,
+    get_oauth_connection_pool,
     handle_warmup_request,
+    is_deep_warmup_request,
     load_configuration_as_configparser,
+    run_warmup_phases,
+    trace_span,
+    warm_connection,
 )
 
 # ╰─────────────────── IMPORT_BLOCK_END ───────────────────╯
@@ -66,18 +77,23 @@ _debug = bool(os.environ.get("DEBUG"))
 # Security Guard logging setup
 _logger = create_structured_logger("CloudFlareSecurityGateway")
 _logger.setLevel(logging.DEBUG if _debug else logging.INFO)
+# Shared operations log through the same structured handler
+create_structured_logger("SharedConfiguration")
 
-# Initialize AWS SSM client for configuration access
-client = boto3.client("ssm")  # pyright: ignore[reportUnknownMemberType]
+# AWS SSM client for configuration access, created on first use (cold start)
+_ssm_client: Any = None
 _default_app_config_path = os.environ.get("APP_CONFIG_PATH", "/alexa/auth/")
 
 # Initialize security components for visitor screening
-_rate_limiter = RateLimiter()
+_rate_limiter = RateLimiter(distributed_backend=create_distributed_rate_limit_backend())
 _security_validator = SecurityValidator()
 _security_logger = SecurityEventLogger()
 
+# Duplicate refresh grants within a short window share one Home Assistant call
+_refresh_coalescer = create_oauth_refresh_coalescer()
+
 # Initialize performance monitoring for security operations
-_performance_optimizer = PerformanceMonitor()
+_performance_optimizer = PerformanceMonitor(service_name="cloudflare_security_gateway")
 
 log = logging.getLogger("werkzeug")
 log.setLevel(logging.WARNING)
@@ -104,10 +120,13 @@ def load_config(ssm_parameter_path: str) -> configparser.ConfigParser:
     :param ssm_parameter_path: Path to app config in SSM Parameter Store
     :return: ConfigParser holding loaded config
     """
+    global _ssm_client  # pylint: disable=global-statement
     configuration = configparser.ConfigParser()
     try:
+        if _ssm_client is None:
+            _ssm_client = create_aws_client("ssm")
         # Get all parameters for this app
-        param_details = client.get_parameters_by_path(
+        param_details = _ssm_client.get_parameters_by_path(
             Path=ssm_parameter_path, Recursive=False, WithDecryption=True
         )
 
@@ -214,28 +233,45 @@ def _validate_oauth_security(
     return True, None, client_ip
 
 
-def _load_and_validate_oauth_configuration(
-    correlation_id: str,
-) -> tuple[dict[str, str] | None, dict[str, Any] | None]:
+def _load_oauth_configuration(correlation_id: str) -> tuple[dict[str, str], list[str]]:
     """
-    Load and validate OAuth configuration parameters.
+    Load OAuth configuration from the shared loaders and validate it.
+
+    Only runs to build the container's configuration snapshot, not per request.
 
     Args:
         correlation_id: Request correlation ID for logging
 
     Returns:
-        Tuple of (oauth_config_if_valid, error_response_if_any)
+        Tuple of (oauth_config, validation_errors)
     """
     app = get_app_config()
     app_config = app.get_config()["appConfig"]
 
-    (oauth_config, validation_errors) = (
-        OAuthConfigurationManager.load_and_validate_oauth_config(
-            dict(app_config), correlation_id
-        )
+    return OAuthConfigurationManager.load_and_validate_oauth_config(
+        dict(app_config), correlation_id
     )
 
-    if validation_errors:
+
+# Validated OAuth configuration, built once per container and refreshed when stale
+_oauth_config_snapshots = OAuthConfigSnapshotCache(_load_oauth_configuration)
+
+
+def _load_and_validate_oauth_configuration(
+    correlation_id: str,
+) -> tuple[OAuthConfigSnapshot | None, dict[str, Any] | None]:
+    """
+    Get the validated OAuth configuration snapshot for this request.
+
+    Args:
+        correlation_id: Request correlation ID for logging
+
+    Returns:
+        Tuple of (oauth_config_if_valid, error_response_if_any)
+    """
+    oauth_config, validation_errors = _oauth_config_snapshots.get(correlation_id)
+
+    if validation_errors or oauth_config is None:
         errors_str = ", ".join(validation_errors)
         error_message = f"Configuration validation failed: {errors_str}"
         return None, {
@@ -307,11 +343,14 @@ def _process_oauth_request_body(
 
 
 def _execute_oauth_token_exchange(
-    oauth_config: dict[str, str], req_body: bytes, correlation_id: str
+    oauth_config: OAuthConfigSnapshot, req_body: bytes, correlation_id: str
 ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
     """
     Execute OAuth token exchange with Home Assistant.
 
+    Refresh grants are coalesced: duplicates of a recent or in-flight refresh
+    share its result instead of calling Home Assistant again.
+
     Args:
         oauth_config: Validated OAuth configuration
         req_body: Validated request body
@@ -320,12 +359,51 @@ def _execute_oauth_token_exchange(
     Returns:
         Tuple of (success_response, error_response)
     """
-    return OAuthRequestProcessor.execute_oauth_request(
-        oauth_config["destination_url"],
-        oauth_config["cf_client_id"],
-        oauth_config["cf_client_secret"],
-        req_body,
-        correlation_id,
+
+    def exchange() -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        return OAuthRequestProcessor.execute_oauth_request(
+            oauth_config.destination_url,
+            oauth_config.cf_client_id,
+            oauth_config.cf_client_secret,
+            req_body,
+            correlation_id,
+            performance_monitor=_performance_optimizer,
+        )
+
+    cache_key = _refresh_coalescer.cache_key(
+        req_body, oauth_config.destination_url, oauth_config.cf_client_secret
+    )
+    if cache_key is None:
+        return exchange()
+    return _refresh_coalescer.execute(cache_key, exchange, correlation_id)
+
+
+def _run_deep_warmup(correlation_id: str) -> dict[str, Any]:
+    """
+    Deep warmup: build the OAuth configuration snapshot and open the pooled
+    connection token exchanges use, ahead of the first account linking request.
+    """
+
+    def warm_oauth_connection() -> None:
+        oauth_config, _ = _oauth_config_snapshots.get(correlation_id)
+        if oauth_config is None:
+            raise ValueError("OAuth configuration not available")
+        # Probe the destination host, not a path under its token endpoint
+        destination = urllib.parse.urlsplit(oauth_config.destination_url)
+        warm_connection(
+            f"{destination.scheme}://{destination.netloc}",
+            {
+                "CF-Access-Client-Id": oauth_config.cf_client_id,
+                "CF-Access-Client-Secret": oauth_config.cf_client_secret,
+            },
+            get_oauth_connection_pool(oauth_config.destination_url),
+        )
+
+    return run_warmup_phases(
+        [
+            ("configuration", lambda: _oauth_config_snapshots.get(correlation_id)),
+            ("oauth_connection", warm_oauth_connection),
+        ]
     )
 
 
@@ -349,59 +427,73 @@ def lambda_handler(event: dict[str, Any], context: Any = None) -> dict[str, Any]
     # Initialize request processing and correlation tracking
     correlation_id = extract_correlation_id(context)
     request_start = _performance_optimizer.start_timing("total_request")
+    request_logger = bind_correlation_id(_logger, correlation_id)
+
+    request_logger.debug("=== OAUTH LAMBDA START ===")
+    request_logger.debug("Event: %s", event)
+
+    # Root span: config_load, oauth_token_exchange, ... nest under it
+    with (
+        _performance_optimizer.flush_when_due(),
+        trace_span("cloudflare_security_gateway", correlation_id=correlation_id),
+    ):
+        # 🔥 CONTAINER WARMING: Handle warmup requests from configuration manager
+        if handle_warmup_request(event, correlation_id, "cloudflare_security_gateway"):
+            deep_warmup = (
+                _run_deep_warmup(correlation_id)
+                if is_deep_warmup_request(event)
+                else None
+            )
+            return create_warmup_response(
+                "cloudflare_security_gateway", correlation_id, deep_warmup
+            )
 
-    _logger.info("=== OAUTH LAMBDA START (correlation: %s) ===", correlation_id)
-    _logger.debug("Event: %s", event)
-
-    # 🔥 CONTAINER WARMING: Handle warmup requests from configuration manager
-    if handle_warmup_request(event, correlation_id, "cloudflare_security_gateway"):
-        return create_warmup_response("cloudflare_security_gateway", correlation_id)
-
-    # 1. Security validation
-    (is_secure, security_error, _) = _validate_oauth_security(event, correlation_id)
-    if not is_secure:
-        _performance_optimizer.end_timing("total_request", request_start)
-        return security_error  # type: ignore[return-value]  # Guaranteed non-None when is_secure is False
+        # 1. Security validation
+        is_secure, security_error, _ = _validate_oauth_security(event, correlation_id)
+        if not is_secure:
+            _performance_optimizer.end_timing("total_request", request_start)
+            return security_error  # type: ignore[return-value]  # Guaranteed non-None when is_secure is False
 
-    # 2. Configuration loading and validation
-    oauth_config, config_error = _load_and_validate_oauth_configuration(correlation_id)
-    if config_error or oauth_config is None:
-        _performance_optimizer.end_timing("total_request", request_start)
-        return config_error or {"error": "Configuration loading failed"}
+        # 2. Configuration loading and validation
+        oauth_config, config_error = _load_and_validate_oauth_configuration(
+            correlation_id
+        )
+        if config_error or oauth_config is None:
+            _performance_optimizer.end_timing("total_request", request_start)
+            return config_error or {"error": "Configuration loading failed"}
 
-    # 3. Request body processing and OAuth parameter validation
-    req_body, body_error = _process_oauth_request_body(
-        event, oauth_config["wrapper_secret"], correlation_id
-    )
-    if body_error or req_body is None:
-        _performance_optimizer.end_timing("total_request", request_start)
-        return body_error or {"error": "Request body processing failed"}
+        # 3. Request body processing and OAuth parameter validation
+        req_body, body_error = _process_oauth_request_body(
+            event, oauth_config.wrapper_secret, correlation_id
+        )
+        if body_error or req_body is None:
+            _performance_optimizer.end_timing("total_request", request_start)
+            return body_error or {"error": "Request body processing failed"}
+
+        # 4. Badge Issuance: OAuth token exchange execution
+        with trace_span("oauth_token_exchange"):
+            success_response, oauth_error = _execute_oauth_token_exchange(
+                oauth_config, req_body, correlation_id
+            )
 
-    # 4. Badge Issuance: OAuth token exchange execution
-    success_response, oauth_error = _execute_oauth_token_exchange(
-        oauth_config, req_body, correlation_id
-    )
+        # 5. Incident Logging: Security documentation and monitoring
+        total_duration = _performance_optimizer.end_timing(
+            "total_request", request_start
+        )
 
-    # 5. Incident Logging: Security documentation and monitoring
-    total_duration = _performance_optimizer.end_timing("total_request", request_start)
+        if oauth_error:
+            request_logger.warning(
+                "Security Guard: Authentication failed in %.1fms", total_duration * 1000
+            )
+            return oauth_error
 
-    if oauth_error:
-        _logger.warning(
-            "Security Guard: Authentication failed in %.1fms (correlation: %s)",
-            total_duration * 1000,
-            correlation_id,
+        request_logger.info(
+            "Security Guard: Authentication completed in %.1fms", total_duration * 1000
         )
-        return oauth_error
-
-    _logger.info(
-        "Security Guard: Authentication completed in %.1fms (correlation: %s)",
-        total_duration * 1000,
-        correlation_id,
-    )
-    _logger.debug("Response: %s (correlation: %s)", success_response, correlation_id)
-    _logger.info("=== OAUTH LAMBDA END (correlation: %s) ===", correlation_id)
+        request_logger.debug("Response: %s", success_response)
+        request_logger.debug("=== OAUTH LAMBDA END ===")
 
-    return success_response or {"error": "Unknown OAuth processing error"}
+        return success_response or {"error": "Unknown OAuth processing error"}
 
 
 # ╰─────────────────── FUNCTION_BLOCK_END ───────────────────╯
@@ -132,16 +132,20 @@ and unified methodology
 # pylint: disable=duplicate-code  # Lambda functions must be standalone - no shared modules
 
 # ╭─────────────────── IMPORT_BLOCK_START ───────────────────╮
+import hashlib
 import json
+import math
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
-import boto3
 from botocore.exceptions import BotoCoreError, ClientError
 
 # === SHARED CONFIGURATION IMPORTS ===
 from .shared_configuration import (  # SHARED_CONFIG_IMPORT; SSM Path Constants
+    CONFIG_EPOCH_KEY,
+    CONFIG_SNAPSHOT_TTL,
     SSM_ALEXA_CONFIG_PATH,
     SSM_AWS_RUNTIME_PATH,
     SSM_BASE_HOME_ASSISTANT,
@@ -150,9 +154,14 @@ from .shared_configuration import (  # SHARED_CONFIG_IMPORT; SSM Path Constants
     SSM_OAUTH_CONFIG_PATH,
     SSM_SECURITY_POLICIES_PATH,
     SSM_SMART_HOME_BRIDGE_ARN,
+    NegativeCache,
     RateLimiter,
     SecurityEventLogger,
+    config_fingerprint_attribute,
+    create_aws_client,
     create_structured_logger,
+    encode_shared_cache_item,
+    shared_cache_key,
 )
 
 # Type imports for better type hinting
@@ -165,6 +174,8 @@ if TYPE_CHECKING:
 
 # Initialize structured logger
 logger = create_structured_logger(__name__)
+# Shared operations log through the same structured handler
+create_structured_logger("SharedConfiguration")
 
 # === STANDARDIZED CONFIGURATION CONSTANTS ===
 # These values can be overridden by environment variables or SSM parameters
@@ -199,13 +210,39 @@ OAUTH_TOKEN_CACHE_TABLE = os.environ.get(
     "ha-external-connector-oauth-cache",  # nosec B105
 )
 
+# SSM path the Lambdas load their configuration from (their APP_CONFIG_PATH)
+LAMBDA_APP_CONFIG_PATH = os.environ.get("APP_CONFIG_PATH") or SSM_ALEXA_CONFIG_PATH
+
+# Warming pipeline: concurrent SSM path reads, DynamoDB batch request limits
+WARM_SSM_MAX_WORKERS = int(os.environ.get("WARM_SSM_MAX_WORKERS", "4"))
+DYNAMODB_BATCH_GET_SIZE = 100  # BatchGetItem keys per request
+DYNAMODB_BATCH_WRITE_SIZE = 25  # BatchWriteItem items per request
+
+# Container warming fan-out: concurrent warm invocations per target, either a
+# fixed count or "auto" (peak ConcurrentExecutions over the metric window)
+CONTAINER_WARM_CONCURRENCY = os.environ.get("CONTAINER_WARM_CONCURRENCY", "1")
+CONTAINER_WARM_MAX_CONCURRENCY = int(
+    os.environ.get("CONTAINER_WARM_MAX_CONCURRENCY", "10")
+)
+CONTAINER_WARM_METRIC_WINDOW = int(
+    os.environ.get("CONTAINER_WARM_METRIC_WINDOW", "3600")
+)  # 1 hour
+CONTAINER_WARM_HOLD_MS = int(os.environ.get("CONTAINER_WARM_HOLD_MS", "100"))
+# Deep warmups also load config, open the HA connection and prime the parser
+CONTAINER_WARM_DEEP = os.environ.get("CONTAINER_WARM_DEEP", "true").lower() == "true"
+LAMBDA_ARN_CACHE_TTL = int(os.environ.get("LAMBDA_ARN_CACHE_TTL", "3600"))  # 1 hour
+
 # Container-level cache and AWS clients for configuration management
 _manager_config_cache: dict[str, Any] = {}
 _config_ssm_client: Any = None  # Lazy initialization for SSM client
 _manager_dynamodb_client: Any = None
+_manager_lambda_client: Any = None
+_manager_cloudwatch_client: Any = None
+_lambda_arn_cache: dict[str, tuple[str | None, float]] = {}  # key: (arn, loaded_at)
 
 # Security infrastructure (Phase 2c) - Medium security for background service
 _rate_limiter = RateLimiter()  # Shared rate limiter for API calls
+_missing_ssm_paths = NegativeCache()  # SSM paths with no parameters (short TTL)
 
 
 def load_standardized_configuration() -> dict[str, Any]:
@@ -334,7 +371,8 @@ def lambda_handler(
     configs_to_warm = [
         {
             "cache_key": "alexa_bridge_config",
-            "ssm_path": SSM_ALEXA_CONFIG_PATH,  # Gen3: /home-assistant/alexa/config
+            # Gen3: the path the bridge and gateway read (rows keyed by path)
+            "ssm_path": LAMBDA_APP_CONFIG_PATH,
             "fallback_path": f"{SSM_GEN2_BASE_PATH}/appConfig",  # Gen2 fallback
             "description": "Smart Home Bridge configuration (Gen2/Gen3 compatible)",
             "priority": "high",  # High priority: Core Alexa functionality
@@ -368,14 +406,31 @@ def lambda_handler(
         },
     ]
 
-    # Process each configuration with multi-generation fallback support
+    # Warm all Gen3 paths in one pipeline pass, then Gen2 fallbacks for failures
+    outcomes = warm_configurations(configs_to_warm)
+    fallback_configs = [
+        {
+            "cache_key": f"{config['cache_key']}_gen2_fallback",
+            "ssm_path": config["fallback_path"],
+            "description": f"{config['description']} (Gen2 fallback)",
+        }
+        for config in configs_to_warm
+        if not outcomes.get(str(config["cache_key"])) and config.get("fallback_path")
+    ]
+    if fallback_configs:
+        # The Gen3 pass already checked the cache table for this invocation
+        outcomes.update(warm_configurations(fallback_configs, ensure_table=False))
+
+    # Account for each configuration with multi-generation fallback support
     for config in configs_to_warm:
         results["configs_attempted"] += 1
-        _warm_single_configuration(config, results)
+        _record_warming_outcome(config, outcomes, results)
 
     # 🔥 CONTAINER WARMING: Keep Lambda functions warm to prevent cold starts
     _warm_lambda_containers(results)
 
+    results["ssm_negative_cache"] = _missing_ssm_paths.get_stats()
+
     # 📊 SIMPLIFIED RESULTS: Focus on container warming success only
     container_success = results.get("containers_warmed", 0) > 0
 
@@ -413,11 +468,13 @@ def lambda_handler(
     return {"statusCode": 200, "body": json.dumps(results)}
 
 
-def _warm_single_configuration(config: dict[str, Any], results: dict[str, Any]) -> None:
+def _record_warming_outcome(
+    config: dict[str, Any], outcomes: dict[str, bool], results: dict[str, Any]
+) -> None:
     """
     🔧 MULTI-GENERATION CONFIGURATION WARMING
 
-    Warm a single configuration with support for:
+    Account for a single configuration warmed by the pipeline, with support for:
     - Gen3 SSM paths (primary)
     - Gen2 SSM fallback (secondary)
     - Environment variable overrides (user customization)
@@ -433,14 +490,8 @@ def _warm_single_configuration(config: dict[str, Any], results: dict[str, Any])
     that counts as success.
     """
     try:
-        # Step 1: Try warming from Gen3 SSM path (fastest when available)
-        ssm_success = warm_configuration(
-            str(config["cache_key"]),
-            str(config["ssm_path"]),
-            str(config["description"]),
-        )
-
-        if ssm_success:
+        # Step 1: Warmed from Gen3 SSM path (fastest when available)
+        if outcomes.get(str(config["cache_key"])):
             results["configs_warmed"] += 1
             logger.info(
                 "Configuration warmed from SSM (Gen3)",
@@ -452,34 +503,25 @@ def _warm_single_configuration(config: dict[str, Any], results: dict[str, Any])
             )
             return
 
-        # Step 2: Try Gen2 fallback if available
+        # Step 2: Warmed from the Gen2 fallback
         fallback_path = config.get("fallback_path")
-        if fallback_path:
-            fallback_success = warm_configuration(
-                str(config["cache_key"]) + "_gen2_fallback",
-                fallback_path,
-                f"{config['description']} (Gen2 fallback)",
+        if fallback_path and outcomes.get(f"{config['cache_key']}_gen2_fallback"):
+            results["configs_warmed"] += 1
+            logger.info(
+                "Configuration warmed from SSM (Gen2 fallback)",
+                extra={
+                    "description": config["description"],
+                    "priority": config.get("priority", "unknown"),
+                    "source": "gen2_ssm_fallback",
+                    "fallback_path": fallback_path,
+                },
             )
-
-            if fallback_success:
-                results["configs_warmed"] += 1
-                logger.info(
-                    "Configuration warmed from SSM (Gen2 fallback)",
-                    extra={
-                        "description": config["description"],
-                        "priority": config.get("priority", "unknown"),
-                        "source": "gen2_ssm_fallback",
-                        "fallback_path": fallback_path,
-                    },
-                )
-                return
+            return
 
         # Step 3: Check if configuration is functionally available via env vars
         # and code defaults. This is the key fix: SSM failure doesn't mean
         # configuration failure!
-        functional_success = _check_functional_availability(config)
-
-        if functional_success:
+        if _check_functional_availability(config):
             results["configs_warmed"] += 1
             logger.info(
                 "Configuration available via environment variables and code defaults",
@@ -487,15 +529,13 @@ def _warm_single_configuration(config: dict[str, Any], results: dict[str, Any])
                     "description": config["description"],
                     "priority": config.get("priority", "unknown"),
                     "source": "env_vars_code_defaults",
-                    "message": "SSM not available but system fully functional",
+                    "note": "SSM not available but system fully functional",
                 },
             )
             return
 
         # Step 4: Handle truly unavailable configurations
-        is_optional = config.get("optional", False)
-
-        if is_optional:
+        if config.get("optional", False):
             # Optional configs: Log as info, don't count as failure
             logger.info(
                 "Optional configuration not available",
@@ -518,9 +558,9 @@ def _warm_single_configuration(config: dict[str, Any], results: dict[str, Any])
             )
 
     except Exception as e:  # pylint: disable=broad-exception-caught
-        is_optional = config.get("optional", False)
-
-        if is_optional:
+        # One configuration's accounting must never stop the others or the
+        # container warming that follows
+        if config.get("optional", False):
             logger.info(
                 "Optional configuration error (acceptable)",
                 extra={
@@ -576,12 +616,17 @@ def _get_lambda_arn_from_ssm(function_key: str) -> str | None:
         function_key: Key identifying the function
             (cloudflare_security_gateway, smart_home_bridge)
 
+    Lookups (including "not found") are cached per container for
+    LAMBDA_ARN_CACHE_TTL seconds; failed lookups are retried next run.
+
     Returns:
         Lambda function ARN or None if not found
     """
-    ssm_client = boto3.client(  # pyright: ignore[reportArgumentType, reportUnknownMemberType]
-        "ssm"
-    )
+    cached = _lambda_arn_cache.get(function_key)
+    if cached is not None and time.monotonic() - cached[1] < LAMBDA_ARN_CACHE_TTL:
+        return cached[0]
+
+    ssm_client = _get_config_ssm_client()
 
     # Define SSM parameter paths for Lambda ARNs using centralized constants
     ssm_paths = {
@@ -605,6 +650,7 @@ def _get_lambda_arn_from_ssm(function_key: str) -> str | None:
     try:
         response = ssm_client.get_parameter(Name=ssm_path, WithDecryption=False)
         arn = response.get("Parameter", {}).get("Value")
+        _lambda_arn_cache[function_key] = (arn or None, time.monotonic())
         if arn:
             logger.info(
                 "Lambda ARN loaded from SSM",
@@ -631,6 +677,7 @@ def _get_lambda_arn_from_ssm(function_key: str) -> str | None:
         logger.info(
             "SSM parameter not found", extra={"ssm_path": ssm_path, "service": "ssm"}
         )
+        _lambda_arn_cache[function_key] = (None, time.monotonic())
         return None
 
     except (BotoCoreError, ClientError) as e:
@@ -660,6 +707,15 @@ def _warm_lambda_containers(results: dict[str, Any]) -> None:
     - Smart Home Bridge: Invoke with ping to keep voice command processing ready
     - Result: Sub-100ms response times instead of 400-600ms cold starts
 
+    **FAN-OUT:**
+    One invocation warms at most one container. With a fan-out of N (see
+    CONTAINER_WARM_CONCURRENCY) each target gets N concurrent synchronous
+    invocations that hold their container for CONTAINER_WARM_HOLD_MS, so they
+    land on N distinct containers; the container IDs in the warmup responses
+    give the per-target coverage. A fan-out of 1 keeps the single async
+    invocation. Targets with provisioned concurrency are already warm and
+    are skipped.
+
     **PERFORMANCE BENEFITS:**
     - Eliminates cold start delays during voice commands
     - Maintains consistent sub-500ms response times
@@ -670,88 +726,57 @@ def _warm_lambda_containers(results: dict[str, Any]) -> None:
             "function_name": os.environ.get("CLOUDFLARE_SECURITY_GATEWAY_FUNCTION_ARN")
             or _get_lambda_arn_from_ssm("cloudflare_security_gateway")
             or "CloudFlare-Security-Gateway",
-            "payload": {
-                "warmup": True,
-                "source": "configuration_manager",
-                "timestamp": int(time.time()),
-            },
             "description": "CloudFlare Security Gateway Container",
         },
         {
             "function_name": os.environ.get("SMART_HOME_BRIDGE_FUNCTION_ARN")
             or _get_lambda_arn_from_ssm("smart_home_bridge")
             or "HomeAssistant",
-            "payload": {
-                "warmup": True,
-                "source": "configuration_manager",
-                "timestamp": int(time.time()),
-            },
             "description": "Smart Home Bridge Container",
         },
     ]
 
+    results["containers_warmed"] = 0
+    results["containers_attempted"] = 0
+    results["container_coverage"] = {}
+
     # Initialize Lambda client for container warming
     try:
-        lambda_client: Any = boto3.client(  # pyright: ignore
-            "lambda", region_name=os.environ.get("AWS_REGION", "us-east-1")
-        )
-
-        results["containers_warmed"] = 0
-        results["containers_attempted"] = 0
+        lambda_client = _get_manager_lambda_client()
 
+        # Plan every target's fan-out, then run all invocations on one pool
+        plans: list[dict[str, Any]] = []
         for function_config in lambda_functions_to_warm:
             results["containers_attempted"] += 1
-
-            try:
-                # Asynchronous invocation for warming (don't wait for response)
-                lambda_client.invoke(
-                    FunctionName=function_config["function_name"],
-                    InvocationType="Event",  # Async invocation
-                    Payload=json.dumps(function_config["payload"]),
-                )
-
+            function_name = function_config["function_name"]
+            provisioned = _get_provisioned_concurrency(lambda_client, function_name)
+            coverage: dict[str, Any] = {
+                "function_name": function_name,
+                "requested": 0,
+                "invoked": 0,
+                "distinct_containers": None,
+                "coverage": None,
+                "provisioned_concurrency": provisioned,
+            }
+            results["container_coverage"][function_config["description"]] = coverage
+            if provisioned:
                 results["containers_warmed"] += 1
+                coverage["skipped"] = "provisioned_concurrency"
                 logger.info(
-                    "Container warmed successfully",
+                    "Container warming skipped, provisioned concurrency",
                     extra={
                         "description": function_config["description"],
-                        "function_name": function_config["function_name"],
+                        "function_name": function_name,
+                        "provisioned_concurrency": provisioned,
                         "service": "lambda",
                         "operation": "container_warming",
                     },
                 )
+                continue
+            coverage["requested"] = _resolve_warm_concurrency(function_name)
+            plans.append({**function_config, "coverage": coverage})
 
-                # 🛡️ SECURITY LOGGING: Track container warming for monitoring
-                SecurityEventLogger.log_security_event(
-                    "container_warm_success",
-                    "configuration-manager",
-                    f"Successfully warmed container: {function_config['description']}",
-                    "INFO",
-                )
-
-            except (ClientError, BotoCoreError) as e:
-                error_msg = f"Failed to warm {function_config['description']}: {str(e)}"
-                results["errors"].append(error_msg)
-                logger.error(
-                    "Container warming failed",
-                    extra={
-                        "description": function_config["description"],
-                        "function_name": function_config["function_name"],
-                        "error": str(e),
-                        "error_type": type(e).__name__,
-                        "service": "lambda",
-                        "operation": "container_warming",
-                    },
-                )
-
-                # 🛡️ SECURITY LOGGING: Track warming failures
-                SecurityEventLogger.log_security_event(
-                    "container_warm_failure",
-                    "configuration-manager",
-                    f"Container warming failed: {function_config['description']} - "
-                    f"{str(e)}",
-                    "WARNING",
-                )
+        _invoke_warm_plans(lambda_client, plans, results)
 
     except (ClientError, BotoCoreError, KeyError, ValueError) as e:
         error_msg = f"Lambda client initialization failed: {str(e)}"
@@ -771,10 +796,258 @@ def _warm_lambda_containers(results: dict[str, Any]) -> None:
         results["containers_attempted"] = 0
 
 
+def _invoke_warm_plans(
+    lambda_client: Any, plans: list[dict[str, Any]], results: dict[str, Any]
+) -> None:
+    """Send every planned warm invocation concurrently and record coverage."""
+    tasks = [plan for plan in plans for _ in range(plan["coverage"]["requested"])]
+    if not tasks:
+        return
+    max_workers = max(1, min(CONTAINER_WARM_MAX_CONCURRENCY, len(tasks)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            (
+                plan,
+                executor.submit(
+                    _invoke_warm_container,
+                    lambda_client,
+                    plan["function_name"],
+                    plan["coverage"]["requested"],
+                ),
+            )
+            for plan in tasks
+        ]
+
+    container_ids: dict[str, set[str]] = {}
+    failures: dict[str, list[Exception]] = {}
+    for plan, future in futures:
+        try:
+            warmup = future.result()
+        except (ClientError, BotoCoreError) as e:
+            failures.setdefault(plan["description"], []).append(e)
+            continue
+        plan["coverage"]["invoked"] += 1
+        if warmup.get("container_id"):
+            container_ids.setdefault(plan["description"], set()).add(
+                str(warmup["container_id"])
+            )
+        # Deep warmup phase timings: keep the slowest container's per phase
+        phases_ms = plan["coverage"].setdefault("phases_ms", {})
+        for phase, elapsed_ms in (warmup.get("phases_ms") or {}).items():
+            phases_ms[phase] = max(phases_ms.get(phase, 0.0), elapsed_ms)
+
+    for plan in plans:
+        coverage = plan["coverage"]
+        if coverage["requested"] > 1:
+            distinct = len(container_ids.get(plan["description"], set()))
+            coverage["distinct_containers"] = distinct
+            coverage["coverage"] = round(distinct / coverage["requested"], 2)
+
+        if coverage["invoked"]:
+            results["containers_warmed"] += 1
+            logger.info(
+                "Container warmed successfully",
+                extra={
+                    "description": plan["description"],
+                    "function_name": plan["function_name"],
+                    "requested": coverage["requested"],
+                    "distinct_containers": coverage["distinct_containers"],
+                    "service": "lambda",
+                    "operation": "container_warming",
+                },
+            )
+
+            # 🛡️ SECURITY LOGGING: Track container warming for monitoring
+            SecurityEventLogger.log_security_event(
+                "container_warm_success",
+                "configuration-manager",
+                f"Successfully warmed container: {plan['description']}",
+                "INFO",
+            )
+
+        errors = failures.get(plan["description"])
+        if errors:
+            error_msg = f"Failed to warm {plan['description']}: {str(errors[0])}"
+            results["errors"].append(error_msg)
+            logger.error(
+                "Container warming failed",
+                extra={
+                    "description": plan["description"],
+                    "function_name": plan["function_name"],
+                    "failed_invocations": len(errors),
+                    "error": str(errors[0]),
+                    "error_type": type(errors[0]).__name__,
+                    "service": "lambda",
+                    "operation": "container_warming",
+                },
+            )
+
+            # 🛡️ SECURITY LOGGING: Track warming failures
+            SecurityEventLogger.log_security_event(
+                "container_warm_failure",
+                "configuration-manager",
+                f"Container warming failed: {plan['description']} - "
+                f"{str(errors[0])}",
+                "WARNING",
+            )
+
+
+def _invoke_warm_container(
+    lambda_client: Any, function_name: str, concurrency: int
+) -> dict[str, Any]:
+    """
+    Send one warm invocation.
+
+    A fan-out of 1 is a fire-and-forget async invocation. Larger fan-outs
+    invoke synchronously with a hold, so concurrent invocations occupy
+    distinct containers, and return the warmup response body (container ID
+    and, for deep warmups, per-phase timings).
+    """
+    payload: dict[str, Any] = {
+        "warmup": True,
+        "deep": CONTAINER_WARM_DEEP,
+        "source": "configuration_manager",
+        "timestamp": int(time.time()),
+    }
+    if concurrency <= 1:
+        # Asynchronous invocation for warming (don't wait for response)
+        lambda_client.invoke(
+            FunctionName=function_name,
+            InvocationType="Event",  # Async invocation
+            Payload=json.dumps(payload),
+        )
+        return {}
+
+    payload.update({"concurrency": concurrency, "hold_ms": CONTAINER_WARM_HOLD_MS})
+    response = lambda_client.invoke(
+        FunctionName=function_name,
+        InvocationType="RequestResponse",
+        Payload=json.dumps(payload),
+    )
+    try:
+        body = json.loads(json.loads(response["Payload"].read())["body"])
+    except (KeyError, TypeError, ValueError):
+        return {}  # Counts as invoked, but not as a confirmed container
+    return body if isinstance(body, dict) else {}
+
+
+def _resolve_warm_concurrency(function_name: str) -> int:
+    """
+    Number of concurrent warm invocations for a target.
+
+    "auto" uses the target's peak ConcurrentExecutions over the last
+    CONTAINER_WARM_METRIC_WINDOW seconds; either way the result is clamped
+    to 1..CONTAINER_WARM_MAX_CONCURRENCY.
+    """
+    if CONTAINER_WARM_CONCURRENCY.strip().lower() != "auto":
+        try:
+            requested = int(CONTAINER_WARM_CONCURRENCY)
+        except ValueError:
+            requested = 1
+        return max(1, min(requested, CONTAINER_WARM_MAX_CONCURRENCY))
+
+    name, _ = _split_function_qualifier(function_name)
+    window = max(60, CONTAINER_WARM_METRIC_WINDOW // 60 * 60)  # Period: 60s steps
+    end_time = time.time()
+    try:
+        response = _get_manager_cloudwatch_client().get_metric_statistics(
+            Namespace="AWS/Lambda",
+            MetricName="ConcurrentExecutions",
+            Dimensions=[{"Name": "FunctionName", "Value": name}],
+            StartTime=end_time - window,
+            EndTime=end_time,
+            Period=window,
+            Statistics=["Maximum"],
+        )
+    except (ClientError, BotoCoreError) as e:
+        logger.warning(
+            "Concurrency metrics unavailable, warming one container",
+            extra={
+                "function_name": function_name,
+                "error": str(e),
+                "service": "cloudwatch",
+                "operation": "container_warming",
+            },
+        )
+        return 1
+    peak = max(
+        (point.get("Maximum", 0.0) for point in response.get("Datapoints", [])),
+        default=1.0,
+    )
+    return max(1, min(math.ceil(peak), CONTAINER_WARM_MAX_CONCURRENCY))
+
+
+def _get_provisioned_concurrency(lambda_client: Any, function_name: str) -> int:
+    """
+    Provisioned concurrency allocated to the invoked version or alias.
+
+    Unqualified names invoke $LATEST, which cannot have provisioned
+    concurrency, so only qualified targets cost an API call.
+    """
+    name, qualifier = _split_function_qualifier(function_name)
+    if not qualifier or qualifier == "$LATEST":
+        return 0
+    try:
+        response = lambda_client.get_provisioned_concurrency_config(
+            FunctionName=name, Qualifier=qualifier
+        )
+    except (ClientError, BotoCoreError):
+        return 0  # Not configured (or not visible): warm it normally
+    if response.get("Status") != "READY":
+        return 0
+    return int(response.get("AllocatedProvisionedConcurrentExecutions", 0))
+
+
+def _split_function_qualifier(function_name: str) -> tuple[str, str | None]:
+    """Split a function name or ARN into (name or unqualified ARN, qualifier)."""
+    parts = function_name.split(":")
+    if function_name.startswith("arn:"):
+        # arn:aws:lambda:region:account:function:name[:qualifier]
+        if len(parts) == 8:
+            return ":".join(parts[:7]), parts[7]
+        return function_name, None
+    if len(parts) == 2:
+        return parts[0], parts[1]
+    return function_name, None
+
+
+def _get_manager_lambda_client() -> Any:
+    """Get the container's Lambda client with lazy initialization."""
+    global _manager_lambda_client  # pylint: disable=global-statement
+    if _manager_lambda_client is None:
+        _manager_lambda_client = create_aws_client("lambda")
+    return _manager_lambda_client
+
+
+def _get_manager_cloudwatch_client() -> Any:
+    """Get the container's CloudWatch client with lazy initialization."""
+    global _manager_cloudwatch_client  # pylint: disable=global-statement
+    if _manager_cloudwatch_client is None:
+        _manager_cloudwatch_client = create_aws_client("cloudwatch")
+    return _manager_cloudwatch_client
+
+
 def warm_configuration(cache_key: str, ssm_path: str, description: str) -> bool:
     """
     🔧 SYSTEMATIC CONFIGURATION MANAGEMENT
 
+    Warm a single configuration; see warm_configurations for the pipeline.
+
+    Returns:
+        bool: True if configuration management completed successfully,
+              False otherwise.
+    """
+    return warm_configurations(
+        [{"cache_key": cache_key, "ssm_path": ssm_path, "description": description}]
+    )[cache_key]
+
+
+def warm_configurations(
+    configs: list[dict[str, Any]], ensure_table: bool = True
+) -> dict[str, bool]:
+    """
+    🔧 SYSTEMATIC CONFIGURATION MANAGEMENT
+
     Like a professional IT administrator performing comprehensive system
     maintenance, this function manages configuration data for independent Lambda
     functions that can operate without dependencies but benefit from centralized
@@ -790,123 +1063,93 @@ def warm_configuration(cache_key: str, ssm_path: str, description: str) -> bool:
     5. 🗗️ **Backup System**: Provides configuration redundancy for reliability
     6. ✅ **Health Monitoring**: Tracks configuration availability per function
 
-    **CONFIGURATION INDEPENDENCE DESIGN:**
-    - cloudflare_security_gateway.py: Works standalone with env vars/SSM, enhanced with
-      centralized config management
-    - smart_home_bridge.py: Works standalone with env vars/SSM, enhanced with
-      centralized config management
-    - configuration_manager.py: Provides optimization AND standardization
-      without creating dependencies
+    **BATCH PIPELINE:**
+    Warming runs on a schedule, so every call here is billed around the clock.
+    One pass covers all configurations with container-reused clients:
+    1. Check the cache table once (skipped with ensure_table=False, for a
+       follow-up pass in the same invocation)
+    2. Read all SSM paths concurrently (parameter versions are the change signal)
+    3. Read every freshness marker (row TTLs, published fingerprints) with
+       BatchGetItem
+    4. Write only stale rows with BatchWriteItem
+    5. Stamp the config epoch with a single UpdateItem
 
     Returns:
-        bool: True if configuration management completed successfully,
-              False otherwise.
+        {cache_key: True if configuration management completed successfully}
     """
-    try:
-        # 🛡️ INPUT VALIDATION (Phase 2c): Basic security for configuration parameters
-        if not cache_key or not ssm_path or not description:
-            SecurityEventLogger.log_validation_failure(
-                "configuration-manager",
-                "parameter_validation",
-                f"Missing required parameters: cache_key={bool(cache_key)}, "
-                f"ssm_path={bool(ssm_path)}, description={bool(description)}",
-            )
-            return False
-
-        # Validate SSM path format (basic security against path injection)
-        # Accept Gen2 (/ha-alexa/) and Gen3 (/home-assistant/) path formats
-        valid_prefixes = ["/ha-alexa/", SSM_BASE_HOME_ASSISTANT + "/"]
-        if not any(ssm_path.startswith(prefix) for prefix in valid_prefixes):
-            SecurityEventLogger.log_validation_failure(
-                "configuration-manager",
-                "ssm_path_validation",
-                f"Invalid SSM path format: {ssm_path}. "
-                f"Must start with /ha-alexa/ or {SSM_BASE_HOME_ASSISTANT}/",
-            )
-            return False
-        # Initialize DynamoDB client
-        dynamodb: Any = boto3.client(  # pyright: ignore
-            "dynamodb", region_name=os.environ.get("AWS_REGION", "us-east-1")
-        )
-
-        # Initialize SSM client
-        ssm: Any = boto3.client(  # pyright: ignore
-            "ssm", region_name=os.environ.get("AWS_REGION", "us-east-1")
+    outcomes = {str(config["cache_key"]): False for config in configs}
+    paths_by_key = {
+        str(config["cache_key"]): str(config["ssm_path"])
+        for config in configs
+        if _is_valid_warm_request(
+            str(config["cache_key"]),
+            str(config["ssm_path"]),
+            str(config["description"]),
         )
+    }
+    if not paths_by_key:
+        return outcomes
+    descriptions = {
+        str(config["cache_key"]): config["description"] for config in configs
+    }
 
-        # Create cache table if it doesn't exist
-        table_name = "ha-external-connector-config-cache"
-        ensure_cache_table_exists(dynamodb, table_name)
-
-        # Check if cache is already warm and valid
-        if is_cache_warm(dynamodb, table_name, cache_key):
-            logger.info(
-                "Configuration cache already warm",
-                extra={
-                    "description": description,
-                    "cache_key": cache_key,
-                    "service": "dynamodb",
-                    "operation": "cache_check",
-                },
-            )
-            return True
+    try:
+        dynamodb = _get_manager_dynamodb_client()
+        table_name = SHARED_CACHE_TABLE
+        if ensure_table:
+            ensure_cache_table_exists(dynamodb, table_name)
 
-        # Load configuration from SSM
+        # Load configuration and parameter versions from SSM
         logger.info(
             "Loading fresh configuration from SSM",
             extra={
-                "ssm_path": ssm_path,
-                "description": description,
+                "ssm_paths": sorted(set(paths_by_key.values())),
                 "service": "ssm",
                 "operation": "parameter_loading",
             },
         )
-        config_data = load_from_ssm(ssm, ssm_path)
-
-        if not config_data:
-            logger.info(
-                "SSM parameter not found",
-                extra={
-                    "ssm_path": ssm_path,
-                    "description": description,
-                    "service": "ssm",
-                    "operation": "parameter_loading",
-                    "note": (
-                        "Expected behavior - using environment variables or defaults"
-                    ),
-                },
-            )
-            # 🔄 GRACEFUL FALLBACK: No SSM config found is acceptable behavior
-            # The system will use environment variables or embedded defaults
-            return True
+        snapshots, failed_paths = load_snapshots_concurrently(
+            _get_config_ssm_client(), set(paths_by_key.values())
+        )
+        for ssm_path, snapshot in snapshots.items():
+            if snapshot is None and ssm_path not in failed_paths:
+                # 🔄 GRACEFUL FALLBACK: No SSM config found is acceptable behavior
+                # The system will use environment variables or embedded defaults
+                logger.info(
+                    "SSM parameter not found",
+                    extra={
+                        "ssm_path": ssm_path,
+                        "service": "ssm",
+                        "operation": "parameter_loading",
+                        "note": (
+                            "Expected behavior - using environment variables "
+                            "or defaults"
+                        ),
+                    },
+                )
 
-        # Store in shared cache
-        store_in_cache(dynamodb, table_name, cache_key, config_data)
+        published = {
+            ssm_path: snapshot
+            for ssm_path, snapshot in snapshots.items()
+            if snapshot is not None
+        }
+        rows_written, changed_paths = publish_snapshots(dynamodb, table_name, published)
         logger.info(
             "Configuration cached successfully",
             extra={
-                "description": description,
-                "cache_key": cache_key,
+                "paths_published": len(published),
+                "rows_written": rows_written,
+                "changed_paths": sorted(changed_paths),
                 "service": "dynamodb",
                 "operation": "cache_storage",
             },
         )
 
-        # 🛡️ SECURITY LOGGING (Phase 2c): Log successful configuration management
-        SecurityEventLogger.log_security_event(
-            "config_cache_success",
-            "configuration-manager",
-            f"Successfully cached configuration: {description} (key: {cache_key})",
-            "INFO",
-        )
-
-        return True
-
     except (ClientError, BotoCoreError, KeyError, ValueError, TypeError, OSError) as e:
         logger.error(
             "Configuration warming failed",
             extra={
-                "description": description,
+                "descriptions": list(descriptions.values()),
                 "error": str(e),
                 "error_type": type(e).__name__,
                 "operation": "configuration_warming",
@@ -917,12 +1160,66 @@ def warm_configuration(cache_key: str, ssm_path: str, description: str) -> bool:
         SecurityEventLogger.log_security_event(
             "config_cache_failure",
             "configuration-manager",
-            f"Configuration warming failed: {description} - {str(e)}",
+            f"Configuration warming failed: {', '.join(descriptions.values())} - "
+            f"{str(e)}",
             "WARNING",
         )
+        return outcomes
+
+    for cache_key, ssm_path in paths_by_key.items():
+        outcomes[cache_key] = ssm_path not in failed_paths
+        if outcomes[cache_key]:
+            # 🛡️ SECURITY LOGGING (Phase 2c): Log successful configuration management
+            SecurityEventLogger.log_security_event(
+                "config_cache_success",
+                "configuration-manager",
+                f"Successfully cached configuration: {descriptions[cache_key]} "
+                f"(key: {cache_key})",
+                "INFO",
+            )
+    return outcomes
 
+
+def _is_valid_warm_request(cache_key: str, ssm_path: str, description: str) -> bool:
+    """🛡️ INPUT VALIDATION (Phase 2c): Basic security for configuration parameters"""
+    if not cache_key or not ssm_path or not description:
+        SecurityEventLogger.log_validation_failure(
+            "configuration-manager",
+            "parameter_validation",
+            f"Missing required parameters: cache_key={bool(cache_key)}, "
+            f"ssm_path={bool(ssm_path)}, description={bool(description)}",
+        )
         return False
 
+    # Validate SSM path format (basic security against path injection)
+    # Accept Gen2 (/ha-alexa/) and Gen3 (/home-assistant/) path formats
+    valid_prefixes = ["/ha-alexa/", SSM_BASE_HOME_ASSISTANT + "/"]
+    if not any(ssm_path.startswith(prefix) for prefix in valid_prefixes):
+        SecurityEventLogger.log_validation_failure(
+            "configuration-manager",
+            "ssm_path_validation",
+            f"Invalid SSM path format: {ssm_path}. "
+            f"Must start with /ha-alexa/ or {SSM_BASE_HOME_ASSISTANT}/",
+        )
+        return False
+    return True
+
+
+def _get_manager_dynamodb_client() -> Any:
+    """Get the container's DynamoDB client with lazy initialization."""
+    global _manager_dynamodb_client  # pylint: disable=global-statement
+    if _manager_dynamodb_client is None:
+        _manager_dynamodb_client = create_aws_client("dynamodb")
+    return _manager_dynamodb_client
+
+
+def _get_config_ssm_client() -> Any:
+    """Get the container's SSM client with lazy initialization."""
+    global _config_ssm_client  # pylint: disable=global-statement
+    if _config_ssm_client is None:
+        _config_ssm_client = create_aws_client("ssm")
+    return _config_ssm_client
+
 
 def ensure_cache_table_exists(dynamodb: Any, table_name: str) -> None:
     """
@@ -959,8 +1256,10 @@ def ensure_cache_table_exists(dynamodb: Any, table_name: str) -> None:
             BillingMode="PAY_PER_REQUEST",
         )
 
-        # Enable TTL
-        time.sleep(2)  # Wait for table to be created
+        # Enable TTL once the table is active (polls instead of a fixed sleep)
+        dynamodb.get_waiter("table_exists").wait(
+            TableName=table_name, WaiterConfig={"Delay": 1, "MaxAttempts": 30}
+        )
         try:
             dynamodb.update_time_to_live(
                 TableName=table_name,
@@ -986,31 +1285,6 @@ def ensure_cache_table_exists(dynamodb: Any, table_name: str) -> None:
             )
 
 
-def is_cache_warm(dynamodb: Any, table_name: str, cache_key: str) -> bool:
-    """
-    🔍 PROFESSIONAL DOCUMENT FRESHNESS CHECK
-
-    Like a facilities manager checking expiration dates on important documents,
-    this function verifies whether cached configurations are still fresh and
-    ready for business use. Professional standards require current information.
-    """
-    try:
-        response: dict[str, Any] = dynamodb.get_item(
-            TableName=table_name, Key={"cache_key": {"S": cache_key}}
-        )
-
-        if "Item" in response:
-            item = response["Item"]
-            ttl = int(item.get("ttl", {}).get("N", "0"))
-            if ttl > int(time.time()):
-                return True
-
-        return False
-
-    except Exception:  # pylint: disable=broad-exception-caught # AWS service check
-        return False
-
-
 def load_from_ssm(ssm: Any, ssm_path: str) -> dict[str, Any] | None:
     """
     📋 SECURE DOCUMENT RETRIEVAL
@@ -1021,15 +1295,37 @@ def load_from_ssm(ssm: Any, ssm_path: str) -> dict[str, Any] | None:
     document management ensures all team members work with current information.
 
     Returns configuration data if successful, None if no documents found.
+    Empty paths are remembered briefly so repeated loads skip the SSM call.
     """
+    snapshot = load_snapshot_from_ssm(ssm, ssm_path)
+    return snapshot[0] if snapshot else None
+
+
+def load_snapshot_from_ssm(
+    ssm: Any, ssm_path: str
+) -> tuple[dict[str, Any], dict[str, tuple[int, float]]] | None:
+    """
+    Load a path's sections together with each parameter's SSM version.
+
+    Returns:
+        Tuple of ({section: config}, {section: (Version, LastModifiedDate
+        as epoch seconds)}), or None if the path has no parameters
+    """
+    if _missing_ssm_paths.contains(ssm_path):
+        logger.debug("Skipping SSM path known to be empty: %s", ssm_path)
+        return None
+
     try:
         response = ssm.get_parameters_by_path(
             Path=ssm_path, Recursive=False, WithDecryption=True
         )
 
         config_data: dict[str, Any] = {}
+        versions: dict[str, tuple[int, float]] = {}
         if "Parameters" in response and response.get("Parameters"):
-            for param in response.get("Parameters"):  # pylint: disable=duplicate-code # AWS parameter processing pattern
+            for param in response.get(
+                "Parameters"
+            ):  # pylint: disable=duplicate-code # AWS parameter processing pattern
                 param_name = param.get("Name")
                 param_value = param.get("Value")
                 if param_name and param_value:
@@ -1037,8 +1333,16 @@ def load_from_ssm(ssm: Any, ssm_path: str) -> dict[str, Any] | None:
                     section_name = param_path_array[-1]
                     config_values = json.loads(param_value)
                     config_data[section_name] = config_values
+                    last_modified = param.get("LastModifiedDate")
+                    versions[section_name] = (
+                        int(param.get("Version", 0)),
+                        last_modified.timestamp() if last_modified else 0.0,
+                    )
 
-        return config_data if config_data else None
+        if not config_data:
+            _missing_ssm_paths.add(ssm_path)
+            return None
+        return config_data, versions
     except (ClientError, BotoCoreError) as e:
         logger.error(
             "SSM parameter loading failed",
@@ -1053,46 +1357,275 @@ def load_from_ssm(ssm: Any, ssm_path: str) -> dict[str, Any] | None:
         return None
 
 
-def store_in_cache(
+def load_snapshots_concurrently(
+    ssm: Any, ssm_paths: set[str]
+) -> tuple[dict[str, Any], set[str]]:
+    """
+    Load several SSM paths' snapshots on a bounded thread pool.
+
+    Returns:
+        Tuple of ({ssm_path: snapshot or None}, paths whose parameters could
+        not be parsed)
+    """
+    if not ssm_paths:
+        return {}, set()
+    max_workers = max(1, min(WARM_SSM_MAX_WORKERS, len(ssm_paths)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            ssm_path: executor.submit(load_snapshot_from_ssm, ssm, ssm_path)
+            for ssm_path in sorted(ssm_paths)
+        }
+
+    snapshots: dict[str, Any] = {}
+    failed_paths: set[str] = set()
+    for ssm_path, future in futures.items():
+        try:
+            snapshots[ssm_path] = future.result()
+        except (ValueError, TypeError) as e:
+            logger.error(
+                "SSM parameter parsing failed",
+                extra={
+                    "ssm_path": ssm_path,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "service": "ssm",
+                    "operation": "parameter_loading",
+                },
+            )
+            snapshots[ssm_path] = None
+            failed_paths.add(ssm_path)
+    return snapshots, failed_paths
+
+
+def snapshot_fingerprint(versions: dict[str, tuple[int, float]]) -> str:
+    """Fingerprint of a path's parameter versions (changes with any edit)."""
+    canonical = json.dumps(sorted(versions.items()))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+
+def publish_snapshots(
     dynamodb: Any,
     table_name: str,
-    cache_key: str,
-    config_data: dict[str, Any],
+    snapshots: dict[str, tuple[dict[str, Any], dict[str, tuple[int, float]]]],
+) -> tuple[int, set[str]]:
+    """
+    🗗️ PROFESSIONAL CONFIGURATION MANAGEMENT SYSTEM
+
+    Publish SSM snapshots to the shared cache: rows whose path changed or whose
+    row is missing/expired are rewritten, then the config epoch is stamped.
+    Rows are written before the epoch moves, so readers that see the new
+    epoch also see the new rows.
+
+    Returns:
+        Tuple of (rows written, paths whose SSM versions changed)
+    """
+    if not snapshots:
+        return 0, set()
+    fingerprints = {
+        ssm_path: snapshot_fingerprint(versions)
+        for ssm_path, (_, versions) in snapshots.items()
+    }
+    row_keys = [
+        shared_cache_key(ssm_path, section)
+        for ssm_path, (config_data, _) in snapshots.items()
+        for section, config in config_data.items()
+        if isinstance(config, dict)
+    ]
+    published, warm_keys = read_freshness_markers(
+        dynamodb, table_name, list(snapshots), row_keys
+    )
+
+    changed_paths = {
+        ssm_path
+        for ssm_path, fingerprint in fingerprints.items()
+        if fingerprint != published.get(ssm_path)
+    }
+    items: list[dict[str, Any]] = []
+    for ssm_path, (config_data, versions) in snapshots.items():
+        stale = {
+            section: config
+            for section, config in config_data.items()
+            if ssm_path in changed_paths
+            or shared_cache_key(ssm_path, section) not in warm_keys
+        }
+        items.extend(cache_items(ssm_path, stale, versions))
+    write_cache_items(dynamodb, table_name, items)
+    stamp_config_epoch(dynamodb, table_name, fingerprints, bool(changed_paths))
+    return len(items), changed_paths
+
+
+def read_freshness_markers(
+    dynamodb: Any, table_name: str, ssm_paths: list[str], row_keys: list[str]
+) -> tuple[dict[str, str], set[str]]:
+    """
+    🔍 PROFESSIONAL DOCUMENT FRESHNESS CHECK
+
+    Like a facilities manager checking expiration dates on important documents,
+    this function verifies whether cached configurations are still fresh and
+    ready for business use. Professional standards require current information.
+
+    Every marker is read in one BatchGetItem (chunked at the 100-key limit):
+    the config epoch item with each path's published fingerprint, and the
+    ttl of each section row. Keys left unprocessed after a retry count as
+    stale, which only costs a rewrite.
+
+    Returns:
+        Tuple of ({ssm_path: published fingerprint}, row keys not yet expired)
+    """
+    fingerprint_names = {
+        f"#fp{index}": config_fingerprint_attribute(ssm_path)
+        for index, ssm_path in enumerate(ssm_paths)
+    }
+    keys = [CONFIG_EPOCH_KEY, *row_keys]
+    now = int(time.time())
+    published: dict[str, str] = {}
+    warm_keys: set[str] = set()
+
+    for start in range(0, len(keys), DYNAMODB_BATCH_GET_SIZE):
+        request_items: dict[str, Any] = {
+            table_name: {
+                "Keys": [
+                    {"cache_key": {"S": key}}
+                    for key in keys[start : start + DYNAMODB_BATCH_GET_SIZE]
+                ],
+                "ProjectionExpression": ", ".join(
+                    ["cache_key", "#ttl", *fingerprint_names]
+                ),
+                "ExpressionAttributeNames": {"#ttl": "ttl", **fingerprint_names},
+            }
+        }
+        # One retry for throttled keys
+        for _ in range(2):
+            response = dynamodb.batch_get_item(RequestItems=request_items)
+            for item in response.get("Responses", {}).get(table_name, []):
+                key = item["cache_key"]["S"]
+                if key == CONFIG_EPOCH_KEY:
+                    for ssm_path in ssm_paths:
+                        attribute = item.get(config_fingerprint_attribute(ssm_path))
+                        if attribute:
+                            published[ssm_path] = attribute["S"]
+                elif int(item.get("ttl", {}).get("N", "0")) > now:
+                    warm_keys.add(key)
+            request_items = response.get("UnprocessedKeys") or {}
+            if not request_items:
+                break
+    return published, warm_keys
+
+
+def stamp_config_epoch(
+    dynamodb: Any, table_name: str, fingerprints: dict[str, str], advance: bool
 ) -> None:
+    """
+    ⏱️ CONFIG EPOCH PUBLICATION
+
+    Records each path's fingerprint and the warm-run heartbeat (checked_at)
+    on the single config epoch item, in one UpdateItem. With advance=True the
+    epoch number moves, telling every Lambda container to reload its
+    configuration on its next epoch check instead of waiting for a TTL.
+    """
+    names = {
+        f"#fp{index}": config_fingerprint_attribute(ssm_path)
+        for index, ssm_path in enumerate(fingerprints)
+    }
+    values: dict[str, Any] = {
+        f":fp{index}": {"S": fingerprint}
+        for index, fingerprint in enumerate(fingerprints.values())
+    }
+    values[":now"] = {"N": str(int(time.time()))}
+    assignments = [f"#fp{index} = :fp{index}" for index in range(len(fingerprints))]
+    update_expression = "SET " + ", ".join([*assignments, "checked_at = :now"])
+    if advance:
+        update_expression += " ADD epoch :one"
+        values[":one"] = {"N": "1"}
+
+    dynamodb.update_item(
+        TableName=table_name,
+        Key={"cache_key": {"S": CONFIG_EPOCH_KEY}},
+        UpdateExpression=update_expression,
+        ExpressionAttributeNames=names,
+        ExpressionAttributeValues=values,
+    )
+    if advance:
+        logger.info(
+            "Config epoch advanced",
+            extra={
+                "ssm_paths": sorted(fingerprints),
+                "service": "dynamodb",
+                "operation": "config_epoch",
+            },
+        )
+
+
+def cache_items(
+    ssm_path: str,
+    config_data: dict[str, Any],
+    versions: dict[str, tuple[int, float]] | None = None,
+) -> list[dict[str, Any]]:
     """
     🗗️ PROFESSIONAL CONFIGURATION MANAGEMENT SYSTEM
 
     Like a professional IT administrator maintaining centralized configuration
-    services for independent systems, this function stores optimized configuration
-    data that enhances Lambda function performance without creating dependencies.
+    services for independent systems, this function prepares optimized
+    configuration data that enhances Lambda function performance without
+    creating dependencies.
 
     **INDEPENDENCE WITH OPTIMIZATION DESIGN:**
     The cache provides performance benefits while maintaining complete function
     independence. Each Lambda function can operate without this cache service
     but experiences 75% faster cold starts and sub-500ms responses when available.
 
-    **CONFIGURATION METADATA INCLUDES:**
-    - Configuration integrity validation timestamps
-    - Function-specific optimization flags
-    - Performance enhancement indicators
-    - Independence assurance markers (no dependencies created)
+    **SHARED SCHEMA:**
+    Each section is encoded under shared_cache_key(ssm_path, section) with
+    encode_shared_cache_item, the same key and item layout the Lambdas'
+    configuration loaders read, so a warmed row is a cold-start cache hit.
+    Rows carry the SSM Version/LastModifiedDate they were read at and live
+    for CONFIG_SNAPSHOT_TTL: freshness comes from the config epoch.
+
+    Returns:
+        Shared cache items, one per JSON object section
+    """
+    items: list[dict[str, Any]] = []
+    for section, config in config_data.items():
+        if not isinstance(config, dict):
+            continue  # Not a JSON object section; loaders would reject it too
+        ssm_version, ssm_last_modified = (versions or {}).get(section, (None, None))
+        items.append(
+            encode_shared_cache_item(
+                ssm_path,
+                section,
+                config,
+                writer="configuration_manager",
+                ttl_seconds=CONFIG_SNAPSHOT_TTL,
+                ssm_version=ssm_version,
+                ssm_last_modified=ssm_last_modified,
+            )
+        )
+    return items
+
+
+def write_cache_items(
+    dynamodb: Any, table_name: str, items: list[dict[str, Any]]
+) -> None:
     """
-    # Use standardized configuration constant (defined at module level)
-    ttl = int(time.time()) + SHARED_CACHE_TTL
-
-    # Enhanced metadata for independent function optimization
-    cache_metadata = {
-        "cache_key": {"S": cache_key},
-        "config_data": {"S": json.dumps(config_data)},
-        "ttl": {"N": str(ttl)},
-        "service": {"S": "configuration-management"},
-        "updated_at": {"S": str(int(time.time()))},
-        "config_version": {"S": "v2.0"},
-        "independence_assured": {"BOOL": True},  # Functions work without this cache
-        "optimization_level": {"S": "enhanced"},  # 75% performance improvement
-    }
+    Write shared cache rows with BatchWriteItem (chunked at the 25-item limit).
 
-    dynamodb.put_item(TableName=table_name, Item=cache_metadata)
+    Items still unprocessed after a retry are written one by one, so every
+    row is stored before the config epoch can move.
+    """
+    for start in range(0, len(items), DYNAMODB_BATCH_WRITE_SIZE):
+        request_items: dict[str, Any] = {
+            table_name: [
+                {"PutRequest": {"Item": item}}
+                for item in items[start : start + DYNAMODB_BATCH_WRITE_SIZE]
+            ]
+        }
+        for _ in range(2):
+            response = dynamodb.batch_write_item(RequestItems=request_items)
+            request_items = response.get("UnprocessedItems") or {}
+            if not request_items:
+                break
+        for request in request_items.get(table_name, []):
+            dynamodb.put_item(TableName=table_name, Item=request["PutRequest"]["Item"])
 
 
 # ╰─────────────────── FUNCTION_BLOCK_END ───────────────────╯
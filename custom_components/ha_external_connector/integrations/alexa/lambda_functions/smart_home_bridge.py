@@ -31,28 +31,43 @@ limitations under the License.
 
 # ╭─────────────────── IMPORT_BLOCK_START ───────────────────╮
 import configparser
+import itertools
 import json
 import logging
 import os
 from typing import Any
 
-import boto3
-
 # === SHARED CONFIGURATION IMPORTS ===
 from .shared_configuration import (
     AlexaRequestConfig,
     AlexaValidator,
-    ConnectionPoolManager,
+    CircuitBreakerOpenError,
+    CorrelationLoggerAdapter,
+    ParsedDirective,
     PerformanceMonitor,
     RateLimiter,
     ResponseCache,
     SecurityEventLogger,
+    bind_correlation_id,
+    build_directive_cache_key,
+    build_report_state_cache_key,
+    create_distributed_rate_limit_backend,
     create_home_assistant_retry_handler,
+    create_request_deadline,
     create_structured_logger,
     create_warmup_response,
     extract_correlation_id,
+    get_configuration_version,
+    get_connection_pool_stats,
     handle_warmup_request,
+    is_deep_warmup_request,
     load_configuration_as_configparser,
+    parse_directive,
+    prime_directive_processing,
+    refresh_cached_directive_response,
+    run_warmup_phases,
+    trace_span,
+    warm_connection,
 )
 
 # ╰─────────────────── IMPORT_BLOCK_END ───────────────────╯
@@ -65,18 +80,24 @@ _debug = bool(os.environ.get("DEBUG"))
 # Executive Receptionist logging setup
 _logger = create_structured_logger("SmartHomeBridge")
 _logger.setLevel(logging.DEBUG if _debug else logging.INFO)
+# Shared operations log through the same structured handler
+create_structured_logger("SharedConfiguration")
 
-# Initialize AWS SSM client for configuration access
-client = boto3.client("ssm")  # type: ignore[assignment]
 _default_app_config_path = os.environ.get("APP_CONFIG_PATH", "/alexa/auth/")
 
 # Initialize performance monitoring for voice command operations
-_performance_optimizer = PerformanceMonitor()
+_performance_optimizer = PerformanceMonitor(service_name="smart_home_bridge")
 _response_cache = ResponseCache()
-_connection_pool = ConnectionPoolManager()
+_completed_requests = itertools.count(1)  # Drives periodic stats logging
+
+# Initialize security components once so rate limits span invocations
+_rate_limiter = RateLimiter(distributed_backend=create_distributed_rate_limit_backend())
+_alexa_validator = AlexaValidator()
+_security_logger = SecurityEventLogger()
 
 # Initialize application instance for Lambda container reuse
 app = None  # pylint: disable=invalid-name  # Lambda container optimization
+_app_config_version = 0  # Configuration version the app was built from
 
 
 class HAConfig:
@@ -108,7 +129,7 @@ def _execute_alexa_request(
     Raises:
         ValueError: If HTTP request fails with client/server error after retries
     """
-    _logger.info(
+    _logger.debug(
         "🌐 Executing HA request with retry logic (correlation: %s)",
         request_config.correlation_id,
     )
@@ -125,13 +146,14 @@ def _execute_alexa_request(
             request_config.correlation_id,
         )
 
-    # Create retry handler for this request
+    # Create retry handler for this request (HTTP pool is container-scoped)
     retry_handler = create_home_assistant_retry_handler(
         base_url=request_config.base_url,
         token=request_config.token,
         correlation_id=request_config.correlation_id,
         max_retries=3,
         base_delay=0.5,
+        deadline=request_config.deadline,
     )
 
     try:
@@ -149,12 +171,31 @@ def _execute_alexa_request(
             additional_headers=request_config.cloudflare_headers,
         )
 
-        _logger.info(
+        _logger.debug(
             "Executive Receptionist: HA request successful (correlation: %s)",
             request_config.correlation_id,
         )
         return response
 
+    except CircuitBreakerOpenError as e:
+        # Fast-fail: HA is known to be down, skip the network and retries
+        _logger.warning(
+            "⚡ HA circuit breaker open, failing fast (correlation: %s)",
+            request_config.correlation_id,
+        )
+        raise ValueError(
+            json.dumps(
+                {
+                    "event": {
+                        "payload": {
+                            "type": "ENDPOINT_UNREACHABLE",
+                            "message": "Home Assistant is temporarily unreachable",
+                        }
+                    }
+                }
+            )
+        ) from e
+
     except Exception as e:
         _logger.error(
             "❌ HA request failed after retries (correlation: %s): %s",
@@ -184,13 +225,13 @@ def _execute_alexa_request(
 
 
 def _extract_and_validate_directive(
-    event: dict[str, Any], app_config: dict[str, Any]
+    parsed: ParsedDirective, app_config: dict[str, Any]
 ) -> tuple[dict[str, Any], str]:
     """
     Extract and validate Alexa directive with token extraction.
 
     Args:
-        event: Lambda event dictionary
+        parsed: Directive record from parse_directive for this event
         app_config: Application configuration dictionary
 
     Returns:
@@ -199,36 +240,24 @@ def _extract_and_validate_directive(
     Raises:
         ValueError: If directive validation fails or token is missing
     """
-    directive = event.get("directive")
-    if directive is None:
-        raise ValueError("Malformatted request - missing directive")
-    if directive.get("header", {}).get("payloadVersion") != "3":
-        raise ValueError("Only support payloadVersion == 3")
-
-    scope = directive.get("endpoint", {}).get("scope")
-    if scope is None:
-        # token is in grantee for Linking directive
-        scope = directive.get("payload", {}).get("grantee")
-    if scope is None:
-        # token is in payload for Discovery directive
-        scope = directive.get("payload", {}).get("scope")
-    if scope is None:
-        raise ValueError("Malformatted request - missing endpoint.scope")
-    if scope.get("type") != "BearerToken":
-        raise ValueError("Only support BearerToken")
-
-    token = scope.get("token")
+    if parsed.error is not None or parsed.directive is None:
+        raise ValueError(parsed.error or "Malformatted request - missing directive")
+    if parsed.scope_error is not None:
+        raise ValueError(parsed.scope_error)
+
+    token = parsed.token
     if token is None and _debug:
         token = app_config["HA_TOKEN"]  # only for debug purpose
 
     if token is None:
         raise ValueError("Missing bearer token")
 
-    return directive, token
+    return parsed.directive, token
 
 
 def _validate_request_security(
     event: dict[str, Any],
+    parsed: ParsedDirective,
     correlation_id: str,
     rate_limiter: Any,
     alexa_validator: Any,
@@ -239,6 +268,7 @@ def _validate_request_security(
 
     Args:
         event: Lambda event dictionary
+        parsed: Directive record from parse_directive for this event
         correlation_id: Request correlation ID for logging
         rate_limiter: Rate limiting service instance
         alexa_validator: Alexa validation service instance
@@ -264,17 +294,14 @@ def _validate_request_security(
         raise RuntimeError("Rate limit exceeded")
 
     # Security validation
-    directive, error_response = alexa_validator.validate_directive(event)
+    _, error_response = alexa_validator.validate_directive(event, parsed)
     if error_response is not None:
         raise ValueError(f"Directive validation failed: {error_response}")
 
-    directive_namespace = (
-        directive.get("header", {}).get("namespace") if directive else None
-    )
     security_logger.log_security_event(
         "request_validated",
         client_ip,
-        f"Request validated: namespace={directive_namespace}, "
+        f"Request validated: namespace={parsed.namespace}, "
         f"correlation_id={correlation_id}",
     )
 
@@ -341,45 +368,68 @@ def _setup_configuration() -> configparser.ConfigParser:
 
 
 def _handle_response_caching_and_performance(
-    request_hash: str, request_start: float, response: dict[str, Any]
+    event: dict[str, Any],
+    parsed: ParsedDirective,
+    cache_entry: tuple[str, int] | None,
+    request_start: float,
+    response: dict[str, Any],
+    request_logger: CorrelationLoggerAdapter,
 ) -> dict[str, Any]:
     """
     Handle response caching and performance logging for successful requests.
 
     Args:
-        request_hash: Hash of the request for caching
+        event: Alexa directive event that produced the response
+        parsed: Directive record from parse_directive for this event
+        cache_entry: (cache_key, ttl_seconds) for idempotent directives, else None
         request_start: Start time of the request for performance measurement
         response: Response dictionary to cache and return
+        request_logger: Logger bound to this request's correlation ID
 
     Returns:
         The response dictionary (pass-through)
     """
-    # 🚀 PHASE 4: Cache successful responses for 5 minutes
-    _response_cache.set(request_hash, response, ttl_seconds=300)
+    response_name = (response.get("event") or {}).get("header", {}).get("name")
+    if cache_entry is not None:
+        # 🚀 PHASE 4: Cache idempotent answers (Discovery, ReportState) only
+        if response_name != "ErrorResponse":
+            cache_key, ttl_seconds = cache_entry
+            _response_cache.set(cache_key, response, ttl_seconds=ttl_seconds)
+    else:
+        # Control directive may have changed device state: drop cached state
+        state_cache_key = build_report_state_cache_key(event, parsed)
+        if state_cache_key is not None:
+            _response_cache.invalidate(state_cache_key)
 
     # Log performance statistics
     total_duration = _performance_optimizer.end_timing("total_request", request_start)
-    _logger.info("✅ Request completed in %.1fms", total_duration * 1000)
+    request_logger.info("✅ Request completed in %.1fms", total_duration * 1000)
 
     # Log performance stats every 10 requests for monitoring
-    perf_stats = _performance_optimizer.get_performance_stats()
-    total_requests = perf_stats.get("cache_hits", 0) + perf_stats.get("cache_misses", 0)
-    if total_requests % 10 == 0:
+    if next(_completed_requests) % 10 == 0:
+        perf_stats = _performance_optimizer.get_performance_stats()
         _logger.info("📊 Performance stats: %s", perf_stats)
+        _logger.info("🔗 Connection pool stats: %s", get_connection_pool_stats())
+        _logger.info("💾 Response cache stats: %s", _response_cache.get_cache_stats())
 
     return response
 
 
-def _handle_api_error_caching(
-    request_error: ValueError, request_hash: str, request_start: float
+def _handle_api_error(
+    request_error: ValueError,
+    request_start: float,
+    request_logger: CorrelationLoggerAdapter,
 ) -> dict[str, Any]:
     """
-    Handle API error response caching and performance logging.
+    Handle API error responses and performance logging.
+
+    Errors are not cached: repeated failures are absorbed by the circuit
+    breaker, and a replayed error would outlive a transient outage.
 
     Args:
         request_error: ValueError containing JSON error response
-        request_hash: Hash of the request for caching
         request_start: Start time of the request for performance measurement
+        request_logger: Logger bound to this request's correlation ID
 
     Returns:
         Error response dictionary parsed from the exception
@@ -387,56 +437,56 @@ def _handle_api_error_caching(
     # _execute_alexa_request raises ValueError with JSON error response
     error_response = json.loads(str(request_error))
 
-    # Cache API errors for 1 minute to prevent repeated failures
-    _response_cache.set(request_hash, error_response, ttl_seconds=60)
-
     total_duration = _performance_optimizer.end_timing("total_request", request_start)
-    _logger.warning("⚠️ Request failed in %.1fms", total_duration * 1000)
+    request_logger.warning("⚠️ Request failed in %.1fms", total_duration * 1000)
 
     return error_response
 
 
 def _check_response_cache(
-    request_hash: str, request_start: float
+    event: dict[str, Any],
+    cache_key: str,
+    request_start: float,
+    request_logger: CorrelationLoggerAdapter,
 ) -> dict[str, Any] | None:
     """
-    Check response cache for identical requests and handle cache hits.
+    Check response cache for an equivalent directive and handle cache hits.
 
     Args:
-        request_hash: Hash of the request to check in cache
+        event: Current Alexa directive event (supplies the correlationToken)
+        cache_key: Semantic cache key from build_directive_cache_key
         request_start: Start time of the request for performance measurement
+        request_logger: Logger bound to this request's correlation ID
 
     Returns:
-        Cached response if found, None if cache miss
+        Re-stamped cached response if found, None if cache miss
     """
-    cached_response, cache_hit = _response_cache.get(request_hash)
+    cached_response, cache_hit = _response_cache.get(cache_key)
     if cache_hit:
         _performance_optimizer.record_cache_hit()
         duration = _performance_optimizer.end_timing("total_request", request_start)
-        _logger.info("✅ Cache HIT - Response served in %.1fms", duration * 1000)
-        return cached_response
+        request_logger.info("✅ Cache HIT - Response served in %.1fms", duration * 1000)
+        return refresh_cached_directive_response(cached_response, event)
 
     _performance_optimizer.record_cache_miss()
     return None
 
 
 def _create_security_error_response(
-    security_error: Exception, correlation_id: str, request_hash: str
+    security_error: Exception, correlation_id: str
 ) -> dict[str, Any]:
     """
-    Create and cache security validation error response.
+    Create security validation error response.
 
     Args:
         security_error: The security validation exception
         correlation_id: Request correlation ID for logging
-        request_hash: Hash of the request for caching
 
     Returns:
         Error response dictionary
     """
     _logger.error("Security validation failed: %s", security_error)
-    security_logger = SecurityEventLogger()
-    security_logger.log_security_event(
+    _security_logger.log_security_event(
         "validation_failure",
         "unknown",
         f"Security validation failed: {security_error}, "
@@ -451,17 +501,12 @@ def _create_security_error_response(
             }
         }
     }
-    # Cache security errors for 60 seconds
-    _response_cache.set(request_hash, error_response, ttl_seconds=60)
     return error_response
 
 
-def _create_rate_limit_error_response(request_hash: str) -> dict[str, Any]:
+def _create_rate_limit_error_response() -> dict[str, Any]:
     """
-    Create and cache rate limit exceeded error response.
-
-    Args:
-        request_hash: Hash of the request for caching
+    Create rate limit exceeded error response.
 
     Returns:
         Rate limit error response dictionary
@@ -474,35 +519,36 @@ def _create_rate_limit_error_response(request_hash: str) -> dict[str, Any]:
             }
         }
     }
-    # Cache rate limit responses for 60 seconds
-    _response_cache.set(request_hash, error_response, ttl_seconds=60)
     return error_response
 
 
 def _initialize_security_components_and_validate(
-    event: dict[str, Any], correlation_id: str
+    event: dict[str, Any], parsed: ParsedDirective, correlation_id: str
 ) -> tuple[float, Exception | None]:
     """
     Initialize security components and validate the request.
 
     Args:
         event: Lambda event dictionary
+        parsed: Directive record from parse_directive for this event
         correlation_id: Request correlation ID for logging
 
     Returns:
         Tuple of (security_start_time, exception_if_any)
         If exception is not None, caller should handle the error
     """
-    # Initialize security components
+    # Container-scoped security components (see module initialization)
     security_start = _performance_optimizer.start_timing("security_validation")
-    rate_limiter = RateLimiter()
-    alexa_validator = AlexaValidator()
-    security_logger = SecurityEventLogger()
 
     try:
         # Validate request security
         _validate_request_security(
-            event, correlation_id, rate_limiter, alexa_validator, security_logger
+            event,
+            parsed,
+            correlation_id,
+            _rate_limiter,
+            _alexa_validator,
+            _security_logger,
         )
         _performance_optimizer.end_timing("security_validation", security_start)
         return security_start, None
@@ -514,6 +560,48 @@ def _initialize_security_components_and_validate(
         return security_start, security_error  # Return error for caller to handle
 
 
+def _get_app() -> HAConfig:
+    """Get the container's app, (re)building it on first use or a config change."""
+    global app, _app_config_version  # pylint: disable=global-statement  # Required for Lambda container reuse
+
+    # Initialize app if it doesn't yet exist or the config epoch moved on
+    config_version = get_configuration_version()
+    if app is None or config_version != _app_config_version:
+        _logger.info("Loading config and creating persistence object...")
+        config = _setup_configuration()
+        app = HAConfig(config)
+        _app_config_version = get_configuration_version()
+    return app
+
+
+def _run_deep_warmup() -> dict[str, Any]:
+    """
+    Deep warmup: do the first directive's one-time work ahead of time.
+
+    Loads configuration, opens the pooled connection to Home Assistant (through
+    CloudFlare when configured) and exercises directive parsing/validation, so
+    the first voice command after a warmup only pays for the request itself.
+    """
+
+    def warm_ha_connection() -> None:
+        app_config = _get_app().get_config()["appConfig"]
+        request_config = AlexaRequestConfig(
+            base_url=app_config["HA_BASE_URL"],
+            token="",
+            cf_client_id=app_config.get("CF_CLIENT_ID", ""),
+            cf_client_secret=app_config.get("CF_CLIENT_SECRET", ""),
+        )
+        warm_connection(request_config.base_url, request_config.cloudflare_headers)
+
+    return run_warmup_phases(
+        [
+            ("configuration", _get_app),
+            ("ha_connection", warm_ha_connection),
+            ("directive_processing", prime_directive_processing),
+        ]
+    )
+
+
 def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """
     ⚡ PERFORMANCE-OPTIMIZED: Enhanced Lambda handler with response caching and timing.
@@ -526,79 +614,88 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
     TARGET: <300ms total response time for voice commands
     """
-    global app  # pylint: disable=global-statement  # Required for Lambda container reuse
-
     # 🚀 PHASE 4: Start performance timing for entire request
     request_start = _performance_optimizer.start_timing("total_request")
 
+    # Budget downstream calls against Lambda remaining time and Alexa's window
+    deadline = create_request_deadline(context)
+
     # Extract correlation ID for request tracking
     correlation_id = extract_correlation_id(context)
-    _logger.info("🎯 Processing request %s", correlation_id)
-
-    # 🔥 CONTAINER WARMING: Handle warmup requests from configuration manager
-    if handle_warmup_request(event, correlation_id, "smart_home_bridge"):
-        return create_warmup_response("smart_home_bridge", correlation_id)
-
-    # �🚀 PHASE 4: Check response cache for identical requests
-    request_hash = str(hash(str(event)))
-    cached_response = _check_response_cache(request_hash, request_start)
-    if cached_response is not None:
-        return cached_response
+    request_logger = bind_correlation_id(_logger, correlation_id)
+    request_logger.debug("🎯 Processing request")
+
+    # Root span: config_load, ha_request, ... nest under it for this request
+    with (
+        _performance_optimizer.flush_when_due(),
+        trace_span("smart_home_bridge", correlation_id=correlation_id),
+    ):
+        # 🔥 CONTAINER WARMING: Handle warmup requests from configuration manager
+        if handle_warmup_request(event, correlation_id, "smart_home_bridge"):
+            deep_warmup = _run_deep_warmup() if is_deep_warmup_request(event) else None
+            return create_warmup_response(
+                "smart_home_bridge", correlation_id, deep_warmup
+            )
 
-    # Initialize security components and validate request
-    _, security_error = _initialize_security_components_and_validate(
-        event, correlation_id
-    )
+        # One pass over the directive, shared by validation, caching and routing
+        parsed = parse_directive(event)
 
-    # Handle security validation errors
-    if security_error is not None:
-        if isinstance(security_error, RuntimeError) and "Rate limit exceeded" in str(
-            security_error
-        ):
-            return _create_rate_limit_error_response(request_hash)
-        return _create_security_error_response(
-            security_error, correlation_id, request_hash
+        # Initialize security components and validate request
+        _, security_error = _initialize_security_components_and_validate(
+            event, parsed, correlation_id
         )
 
-    # Initialize app if it doesn't yet exist
-    if app is None:
-        _logger.info("Loading config and creating persistence object...")
-        config = _setup_configuration()
-        app = HAConfig(config)
-
-    app_config = app.get_config()["appConfig"]
-
-    # Extract and validate directive with token
-    directive_start = _performance_optimizer.start_timing("directive_processing")
-    _, token = _extract_and_validate_directive(event, dict(app_config))
-    _performance_optimizer.end_timing("directive_processing", directive_start)
-
-    _logger.debug("Event: %s", event)
-
-    try:
-        # Create safe request configuration with optional CloudFlare parameters
-        request_config = AlexaRequestConfig(
-            base_url=app_config["HA_BASE_URL"],
-            token=token,
-            correlation_id=correlation_id,
-            cf_client_id=app_config.get("CF_CLIENT_ID", ""),
-            cf_client_secret=app_config.get("CF_CLIENT_SECRET", ""),
-        )
+        # Handle security validation errors
+        if security_error is not None:
+            if isinstance(
+                security_error, RuntimeError
+            ) and "Rate limit exceeded" in str(security_error):
+                return _create_rate_limit_error_response()
+            return _create_security_error_response(security_error, correlation_id)
+
+        # 🚀 PHASE 4: Answer idempotent directives (Discovery, ReportState) from cache
+        cache_entry = build_directive_cache_key(event, parsed)
+        if cache_entry is not None:
+            cached_response = _check_response_cache(
+                event, cache_entry[0], request_start, request_logger
+            )
+            if cached_response is not None:
+                return cached_response
+
+        app_config = _get_app().get_config()["appConfig"]
+
+        # Extract and validate directive with token
+        directive_start = _performance_optimizer.start_timing("directive_processing")
+        _, token = _extract_and_validate_directive(parsed, dict(app_config))
+        _performance_optimizer.end_timing("directive_processing", directive_start)
+
+        request_logger.debug("Event: %s", event)
+
+        try:
+            # Create safe request configuration with optional CloudFlare parameters
+            request_config = AlexaRequestConfig(
+                base_url=app_config["HA_BASE_URL"],
+                token=token,
+                correlation_id=correlation_id,
+                cf_client_id=app_config.get("CF_CLIENT_ID", ""),
+                cf_client_secret=app_config.get("CF_CLIENT_SECRET", ""),
+                deadline=deadline,
+            )
 
-        # Execute request to Home Assistant API
-        ha_request_start = _performance_optimizer.start_timing("ha_api_request")
-        response = _execute_alexa_request(
-            event,
-            request_config,
-        )
-        _performance_optimizer.end_timing("ha_api_request", ha_request_start)
+            # Execute request to Home Assistant API
+            ha_request_start = _performance_optimizer.start_timing("ha_api_request")
+            response = _execute_alexa_request(
+                event,
+                request_config,
+            )
+            _performance_optimizer.end_timing("ha_api_request", ha_request_start)
 
-        return _handle_response_caching_and_performance(
-            request_hash, request_start, response
-        )
+            return _handle_response_caching_and_performance(
+                event, parsed, cache_entry, request_start, response, request_logger
+            )
 
-    except ValueError as request_error:
-        return _handle_api_error_caching(request_error, request_hash, request_start)
+        except ValueError as request_error:
+            return _handle_api_error(request_error, request_start, request_logger)
 
 
 # ╰─────────────────── FUNCTION_BLOCK_END ───────────────────╯
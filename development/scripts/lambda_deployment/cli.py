@@ -115,6 +115,8 @@ class CLIHandler:
             epilog="""
 Examples:
   %(prog)s --build                                    Build deployment files
+  %(prog)s --build --cold-start                       Build without unused shared code
+  %(prog)s --profile-imports                          Report import (cold start) time
   %(prog)s --package                                  Package all functions
   %(prog)s --package --function smart_home_bridge     Package specific function
   %(prog)s --deploy                                   Deploy all functions
@@ -164,6 +166,11 @@ Notes:
             action="store_true",
             help="Reset to development mode (remove deployment files)",
         )
+        group.add_argument(
+            "--profile-imports",
+            action="store_true",
+            help="Report python -X importtime results for built deployment files",
+        )
 
         # Additional arguments
         parser.add_argument(
@@ -204,6 +211,11 @@ Notes:
                 "(overrides default 'ConfigurationManager')"
             ),
         )
+        parser.add_argument(
+            "--cold-start",
+            action="store_true",
+            help="With --build: tree-shake shared code each function never uses",
+        )
         parser.add_argument(
             "--dry-run",
             action="store_true",
@@ -279,12 +291,13 @@ Notes:
 
         # Define operation dispatch table
         operations = {
-            "build": manager.build_deployment,
+            "build": lambda: manager.build_deployment(cold_start=args.cold_start),
             "package": lambda: manager.package_function(args.function),
             "deploy": lambda: manager.deploy_function(args.function, args.dry_run),
             "test": lambda: manager.test_deployed_function(args.function),
             "validate": manager.validate_deployment,
             "clean": clean_operation,
+            "profile_imports": lambda: manager.profile_imports(args.function or "all"),
         }
 
         # Execute the first matching operation
@@ -16,9 +16,13 @@ Key Features:
 - Orchestrate packaging, deployment, and validation operations
 - Clean separation between development and deployment modes
 - Integration with specialized handlers for complex operations
+- Cold-start mode: tree-shake unused shared code out of each deployment file
+- Import-time profiling of built files with ``python -X importtime``
 
 Usage:
     python scripts/lambda_deployment/deployment_manager.py --build
+    python scripts/lambda_deployment/deployment_manager.py --build --cold-start
+    python scripts/lambda_deployment/deployment_manager.py --profile-imports
     python scripts/lambda_deployment/deployment_manager.py --package \
         --function smart_home_bridge
 """
@@ -38,7 +42,9 @@ if str(current_dir) not in sys.path:
 try:
     from aws_deployment_handler import AWSDeploymentHandler
     from import_manager import ImportManager
+    from import_profiler import ImportTimeProfiler
     from marker_system import DeploymentMarkerSystem, ExtractedContent
+    from tree_shaker import SharedCodeTreeShaker
     from validation_system import DeploymentValidationSystem
 except ImportError as e:
     # If running from VS Code or different context, provide helpful error
@@ -129,16 +135,24 @@ class DeploymentManager:
 
         # Initialize specialized handlers
         self.import_manager = ImportManager()
+        self.tree_shaker = SharedCodeTreeShaker(self._logger)
+        self.import_profiler = ImportTimeProfiler()
         self.aws_handler = AWSDeploymentHandler(self.config, self._logger)
 
-    def build_deployment(self) -> bool:
+    def build_deployment(self, cold_start: bool = False) -> bool:
         """
         Build standalone Lambda deployment files with embedded shared code.
 
+        Args:
+            cold_start: Tree-shake shared code each function never reaches
+
         Returns:
             True if deployment built successfully, False otherwise
         """
-        self._logger.info("🚀 Building Lambda deployment files...")
+        self._logger.info(
+            "🚀 Building Lambda deployment files%s...",
+            " (cold-start mode)" if cold_start else "",
+        )
 
         # Validate source files first
         if not self._validate_source_files():
@@ -147,7 +161,7 @@ class DeploymentManager:
         # Build each Lambda function
         success = True
         for source_file, deployment_dir in self.config.lambda_functions:
-            if not self._build_single_lambda(source_file, deployment_dir):
+            if not self._build_single_lambda(source_file, deployment_dir, cold_start):
                 success = False
 
         if success:
@@ -257,13 +271,43 @@ class DeploymentManager:
 
         return all_valid
 
-    def _build_single_lambda(self, source_file: str, deployment_dir: str) -> bool:
+    def profile_imports(self, function_name: str = "all") -> bool:
+        """
+        Report the import (cold start) time of built deployment files.
+
+        Args:
+            function_name: Function to profile (e.g., 'smart_home_bridge' or 'all')
+
+        Returns:
+            True if every profiled file imported successfully, False otherwise
+        """
+        success = True
+        for _, deployment_dir in self.config.lambda_functions:
+            if function_name not in ("all", deployment_dir):
+                continue
+            deployment_path = (
+                self.config.deployment_dir / deployment_dir / "lambda_function.py"
+            )
+            if not deployment_path.exists():
+                self._logger.error("❌ Not built yet: %s", deployment_path)
+                success = False
+                continue
+
+            profile = self.import_profiler.profile(deployment_path)
+            self._logger.info(self.import_profiler.format_report(profile))
+            success = success and not profile.error
+        return success
+
+    def _build_single_lambda(
+        self, source_file: str, deployment_dir: str, cold_start: bool = False
+    ) -> bool:
         """
         Build deployment file for a single Lambda function.
 
         Args:
             source_file: Name of the source Lambda file
             deployment_dir: Name of the deployment directory
+            cold_start: Tree-shake shared code the function never reaches
 
         Returns:
             True if build successful, False otherwise
@@ -283,6 +327,14 @@ class DeploymentManager:
         # Extract shared configuration
         shared_path = self.config.source_dir / f"{self.config.shared_module}.py"
         shared_content = self.marker_system.extract_content(shared_path)
+        if cold_start:
+            shared_content, report = self.tree_shaker.shake(content, shared_content)
+            self._logger.info(
+                "🌳 %s: kept %d shared definitions, removed %d",
+                deployment_dir,
+                len(report.kept),
+                len(report.removed),
+            )
 
         # Build deployment content
         deployment_content = self._build_deployment_content(content, shared_content)
@@ -392,6 +444,16 @@ def main() -> None:
     parser.add_argument("--package", help="Package specific function")
     parser.add_argument("--deploy", help="Deploy specific function")
     parser.add_argument("--function", help="Specify function name for package/deploy")
+    parser.add_argument(
+        "--cold-start",
+        action="store_true",
+        help="With --build: tree-shake unused shared code from each function",
+    )
+    parser.add_argument(
+        "--profile-imports",
+        action="store_true",
+        help="Report python -X importtime results for built files",
+    )
 
     args = parser.parse_args()
 
@@ -400,7 +462,10 @@ def main() -> None:
     manager = DeploymentManager(workspace_root)
 
     if args.build:
-        success = manager.build_deployment()
+        success = manager.build_deployment(cold_start=args.cold_start)
+        sys.exit(0 if success else 1)
+    elif args.profile_imports:
+        success = manager.profile_imports(args.function or "all")
         sys.exit(0 if success else 1)
     elif args.package:
         success = manager.package_function(args.package)
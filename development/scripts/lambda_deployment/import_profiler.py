@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+⏱️ IMPORT TIME PROFILER
+
+Measures what a built Lambda deployment file costs to import, using the
+interpreter's own ``python -X importtime`` instrumentation.
+
+Key Features:
+- Imports a deployment file in a fresh interpreter (a real cold start)
+- Parses the ``import time: self [us] | cumulative | imported package`` lines
+- Reports total import time and the slowest top-level imports
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+
+class ImportTiming(NamedTuple):
+    """One module from ``-X importtime`` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int  # Nesting level; the profiled module itself is at 0
+
+
+class ImportProfile(NamedTuple):
+    """Import-time profile of one deployment file."""
+
+    module_path: Path
+    timings: list[ImportTiming]
+    total_us: int  # Wall time of the whole import, including module body
+    error: str
+
+
+class ImportTimeProfiler:
+    """Profiles deployment file imports with ``python -X importtime``."""
+
+    def __init__(self, python_executable: str | None = None, timeout: float = 60.0):
+        self._python = python_executable or sys.executable
+        self._timeout = timeout
+
+    def profile(self, module_path: Path) -> ImportProfile:
+        """
+        Import a deployment file in a fresh interpreter and collect timings.
+
+        Args:
+            module_path: Path to the built lambda_function.py
+
+        Returns:
+            ImportProfile; ``error`` holds stderr when the import failed
+        """
+        environment = dict(os.environ)
+        environment.setdefault("AWS_REGION", "us-east-1")
+        environment.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+        script = (
+            "import time; _start = time.perf_counter_ns(); "
+            f"import {module_path.stem}; "
+            "print(time.perf_counter_ns() - _start)"
+        )
+        result = subprocess.run(
+            [self._python, "-X", "importtime", "-c", script],
+            cwd=module_path.parent,
+            env=environment,
+            capture_output=True,
+            text=True,
+            timeout=self._timeout,
+            check=False,
+        )
+        timings = self.parse(result.stderr)
+        if result.returncode != 0:
+            return ImportProfile(module_path, timings, 0, result.stderr.strip())
+        total_us = int(result.stdout.strip().splitlines()[-1]) // 1000
+        return ImportProfile(module_path, timings, total_us, "")
+
+    @staticmethod
+    def parse(importtime_output: str) -> list[ImportTiming]:
+        """Parse ``-X importtime`` stderr into timings (other lines ignored)."""
+        timings: list[ImportTiming] = []
+        for line in importtime_output.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            fields = line[len("import time:") :].split("|", 2)
+            if len(fields) != 3 or not fields[0].strip().isdigit():
+                continue  # Header line
+            name = fields[2].rstrip()
+            module = name.lstrip()
+            # Nesting is two spaces per level after the separator's own space
+            depth = (len(name) - len(module) - 1) // 2
+            timings.append(
+                ImportTiming(module, int(fields[0]), int(fields[1]), max(depth, 0))
+            )
+        return timings
+
+    @staticmethod
+    def format_report(profile: ImportProfile, top: int = 10) -> str:
+        """Summarize a profile: total time and the slowest top-level imports."""
+        if profile.error:
+            return f"❌ Import failed for {profile.module_path}:\n{profile.error}"
+
+        own_index = next(
+            (
+                index
+                for index, timing in enumerate(profile.timings)
+                if timing.module == profile.module_path.stem and timing.depth == 0
+            ),
+            None,
+        )
+        own_timing = profile.timings[own_index] if own_index is not None else None
+
+        # -X importtime prints children before their parent: the module's direct
+        # imports are the depth-1 lines right above it
+        direct_imports: list[ImportTiming] = []
+        for timing in reversed(profile.timings[: own_index or 0]):
+            if timing.depth == 0:
+                break
+            if timing.depth == 1:
+                direct_imports.append(timing)
+        direct_imports.sort(key=lambda timing: timing.cumulative_us, reverse=True)
+
+        lines = [
+            f"⏱️ {profile.module_path}: {profile.total_us / 1000:.1f}ms to import",
+        ]
+        if own_timing:
+            lines.append(
+                f"   module body: {own_timing.self_us / 1000:.1f}ms "
+                "(compiling and executing embedded code)"
+            )
+        for timing in direct_imports[:top]:
+            lines.append(f"   {timing.cumulative_us / 1000:8.1f}ms  {timing.module}")
+        return "\n".join(lines)
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+🌳 SHARED CODE TREE SHAKER
+
+Removes shared configuration code a Lambda function never reaches.
+Used by the cold-start build mode of deployment_manager.py.
+
+Every deployment file normally embeds all of shared_configuration.py, so the
+smart home bridge also carries the OAuth gateway's request processor, the
+token coalescer and the rest. Python compiles and executes every top-level
+statement on import, which is cold-start time spent on code that never runs.
+
+How It Works:
+- Each top-level statement of the shared blocks defines names (def, class,
+  assignment) or is kept unconditionally (calls, if/try blocks)
+- Roots are the names referenced by the Lambda's own code
+- Definitions reachable from the roots are kept, in original source order,
+  together with the comments directly above them
+- ``__all__`` is dropped; a deployment file is never star-imported
+
+The reachability walk is conservative: any matching identifier counts as a
+use (locals and attributes named like a shared definition included), so code
+is only removed when no identifier in the kept code could refer to it.
+"""
+
+import ast
+import logging
+import re
+from typing import NamedTuple
+
+from marker_system import ExtractedContent
+
+
+class TreeShakeReport(NamedTuple):
+    """Definitions kept and removed by one tree-shaking pass."""
+
+    kept: list[str]
+    removed: list[str]
+
+
+class _Statement(NamedTuple):
+    """A top-level statement of a shared block with its source lines."""
+
+    source: str
+    defines: frozenset[str]
+    references: frozenset[str]
+
+
+class SharedCodeTreeShaker:
+    """Drops shared definitions unreachable from a Lambda's own code."""
+
+    _IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+    def __init__(self, logger: logging.Logger | None = None):
+        self._logger = logger or logging.getLogger(__name__)
+
+    def shake(
+        self, lambda_content: ExtractedContent, shared_content: ExtractedContent
+    ) -> tuple[ExtractedContent, TreeShakeReport]:
+        """
+        Remove shared definitions the Lambda cannot reach.
+
+        Args:
+            lambda_content: Extracted content from the Lambda function
+            shared_content: Extracted content from shared configuration
+
+        Returns:
+            Tuple of (shared content with unused code removed, report).
+            On a parse error the shared content is returned unchanged.
+        """
+        try:
+            blocks = {
+                "configuration_classes": self._split_statements(
+                    shared_content.configuration_classes
+                ),
+                "functions": self._split_statements(shared_content.functions),
+            }
+        except SyntaxError as e:
+            self._logger.warning("⚠️ Tree shaking skipped, shared code: %s", e)
+            return shared_content, TreeShakeReport([], [])
+
+        statements = [stmt for block in blocks.values() for stmt in block]
+        roots = self._referenced_names(
+            "\n".join([lambda_content.configuration_classes, lambda_content.functions])
+        )
+        kept = self._reachable(statements, roots)
+
+        defined = sorted({name for stmt in statements for name in stmt.defines})
+        kept_names = sorted({name for stmt in kept for name in stmt.defines})
+        report = TreeShakeReport(
+            kept=kept_names,
+            removed=[name for name in defined if name not in set(kept_names)],
+        )
+        shaken = shared_content._replace(
+            **{
+                name: "\n".join(stmt.source for stmt in block if stmt in kept)
+                for name, block in blocks.items()
+            }
+        )
+        return shaken, report
+
+    def _split_statements(self, source: str) -> list[_Statement]:
+        """Split a block into top-level statements (with leading comments)."""
+        if not source.strip():
+            return []
+        lines = source.split("\n")
+        tree = ast.parse(source)
+
+        statements: list[_Statement] = []
+        start = 0
+        for node in tree.body:
+            end = node.end_lineno or node.lineno
+            segment = "\n".join(lines[start:end])
+            statements.append(
+                _Statement(
+                    source=segment,
+                    defines=frozenset(self._defined_names(node)),
+                    references=frozenset(self._node_references(node)),
+                )
+            )
+            start = end
+        return statements
+
+    @staticmethod
+    def _defined_names(node: ast.stmt) -> set[str]:
+        """Names a top-level statement binds (empty: always kept)."""
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            return {node.name}
+        if isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            return {
+                name.id
+                for target in targets
+                for name in ast.walk(target)
+                if isinstance(name, ast.Name)
+            }
+        return set()
+
+    @staticmethod
+    def _node_references(node: ast.AST) -> set[str]:
+        """Every identifier a statement mentions (names and attributes)."""
+        references: set[str] = set()
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name):
+                references.add(child.id)
+            elif isinstance(child, ast.Attribute):
+                references.add(child.attr)
+        return references
+
+    def _referenced_names(self, source: str) -> set[str]:
+        """Identifiers used by Lambda code (token scan if it doesn't parse)."""
+        try:
+            return self._node_references(ast.parse(source))
+        except SyntaxError:
+            return set(self._IDENTIFIER.findall(source))
+
+    @staticmethod
+    def _reachable(statements: list[_Statement], roots: set[str]) -> list[_Statement]:
+        """Statements reachable from the roots and the always-kept statements."""
+        definitions: dict[str, list[_Statement]] = {}
+        for stmt in statements:
+            for name in stmt.defines:
+                definitions.setdefault(name, []).append(stmt)
+        definitions.pop("__all__", None)
+
+        kept: set[_Statement] = set()
+        pending = list(roots)
+        for stmt in statements:
+            if not stmt.defines:
+                kept.add(stmt)
+                pending.extend(stmt.references)
+
+        seen: set[str] = set()
+        while pending:
+            name = pending.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            for stmt in definitions.get(name, []):
+                if stmt not in kept:
+                    kept.add(stmt)
+                    pending.extend(stmt.references)
+
+        return [stmt for stmt in statements if stmt in kept]
@@ -0,0 +1,142 @@
+"""
+Test Lambda Deployment Tools
+
+Tests for the cold-start build tooling: shared code tree shaking and
+``python -X importtime`` report parsing.
+"""
+
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = (
+    Path(__file__).resolve().parents[2] / "development/scripts/lambda_deployment"
+)
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+# pylint: disable=wrong-import-position
+from import_profiler import ImportProfile, ImportTimeProfiler  # noqa: E402
+from marker_system import ExtractedContent  # noqa: E402
+from tree_shaker import SharedCodeTreeShaker  # noqa: E402
+
+SHARED_FUNCTIONS = """
+TIMEOUT = 5
+_logger = make_logger()
+_logger.setLevel(10)
+
+__all__ = ["used_helper", "unused_helper"]
+
+
+def _private_dependency():
+    return TIMEOUT
+
+
+# Used by the Lambda
+def used_helper():
+    return _private_dependency()
+
+
+# Only the other Lambda needs this
+class UnusedProcessor:
+    def run(self):
+        return _logger
+"""
+
+
+def _content(functions: str, configuration_classes: str = "") -> ExtractedContent:
+    """Build extracted content holding the given blocks."""
+    return ExtractedContent("", "", configuration_classes, functions, [])
+
+
+class TestSharedCodeTreeShaker:
+    """Test removal of unreachable shared definitions"""
+
+    def test_keeps_reachable_definitions_only(self) -> None:
+        """Test that transitive dependencies stay and unused code is dropped"""
+        lambda_content = _content(
+            "def lambda_handler(event, context):\n" "    return used_helper()\n"
+        )
+
+        shaken, report = SharedCodeTreeShaker().shake(
+            lambda_content, _content(SHARED_FUNCTIONS)
+        )
+
+        assert "def used_helper" in shaken.functions
+        assert "def _private_dependency" in shaken.functions
+        assert "TIMEOUT = 5" in shaken.functions
+        assert "# Used by the Lambda" in shaken.functions
+        assert "UnusedProcessor" not in shaken.functions
+        assert "__all__" not in shaken.functions
+        # Module-level calls always run, so what they use is kept
+        assert "_logger.setLevel(10)" in shaken.functions
+        assert "_logger = make_logger()" in shaken.functions
+        assert report.removed == ["UnusedProcessor", "__all__"]
+        compile(shaken.functions, "shaken", "exec")
+
+    def test_unparseable_shared_code_is_left_alone(self) -> None:
+        """Test that a syntax error skips shaking instead of failing the build"""
+        shared = _content("def broken(:\n    pass\n")
+
+        shaken, report = SharedCodeTreeShaker().shake(_content("x = 1\n"), shared)
+
+        assert shaken == shared
+        assert not report.kept and not report.removed
+
+
+class TestImportTimeProfiler:
+    """Test parsing and reporting of -X importtime output"""
+
+    IMPORTTIME_OUTPUT = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 | site",
+            "import time:       300 |        300 |     botocore.vendored",
+            "import time:      2000 |       2300 |   botocore.exceptions",
+            "import time:      5000 |       5000 |   urllib3",
+            "import time:     40000 |      47300 | lambda_function",
+            "some unrelated stderr line",
+        ]
+    )
+
+    def test_parse_reads_depth_and_times(self) -> None:
+        """Test that nesting depth comes from the name's indentation"""
+        timings = ImportTimeProfiler.parse(self.IMPORTTIME_OUTPUT)
+
+        assert [(t.module, t.depth) for t in timings] == [
+            ("site", 0),
+            ("botocore.vendored", 2),
+            ("botocore.exceptions", 1),
+            ("urllib3", 1),
+            ("lambda_function", 0),
+        ]
+        assert timings[-1].self_us == 40000
+
+    def test_report_lists_direct_imports_by_cost(self) -> None:
+        """Test that the report ranks the module's own imports"""
+        profile = ImportProfile(
+            Path("/deploy/lambda_function.py"),
+            ImportTimeProfiler.parse(self.IMPORTTIME_OUTPUT),
+            48_000,
+            "",
+        )
+
+        report = ImportTimeProfiler.format_report(profile).splitlines()
+
+        assert "48.0ms to import" in report[0]
+        assert "module body: 40.0ms" in report[1]
+        assert report[2].endswith("urllib3")
+        assert report[3].endswith("botocore.exceptions")
+        assert len(report) == 4
+
+    def test_profile_imports_a_module_in_a_fresh_interpreter(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that profiling a real file reports its imports"""
+        module_path = tmp_path / "lambda_function.py"
+        module_path.write_text("import json\nVALUE = json.dumps([])\n")
+
+        profile = ImportTimeProfiler().profile(module_path)
+
+        assert not profile.error
+        assert profile.total_us > 0
+        assert any(t.module == "lambda_function" for t in profile.timings)
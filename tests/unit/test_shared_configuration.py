@@ -0,0 +1,2749 @@
+"""
+Unit Tests for Lambda Shared Configuration
+
+Tests the back-office support services embedded into every Lambda function:
+connection pooling, resilience and caching behaviour. HTTP behaviour is
+exercised against a local stand-in server instead of a real Home Assistant.
+"""
+
+import base64
+import dataclasses
+import datetime
+import io
+import ipaddress
+import json
+import logging
+import os
+import socket
+import ssl
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+import boto3
+import pytest
+import urllib3
+from botocore.exceptions import ClientError
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+from moto import mock_aws
+
+from custom_components.ha_external_connector.integrations.alexa.lambda_functions import (  # noqa: E501
+    shared_configuration,
+)
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive Home Assistant stand-in returning a JSON body."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Answer every POST with a small JSON document."""
+        length = int(self.headers.get("Content-Length", "0"))
+        self.rfile.read(length)
+        body = json.dumps({"status": "ok", "path": self.path}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self) -> None:  # pylint: disable=invalid-name
+        """Answer connection probes with an empty keep-alive response."""
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args: Any) -> None:  # pylint: disable=arguments-differ
+        """Silence request logging during tests."""
+
+
+@pytest.fixture(name="stand_in_url")
+def stand_in_server() -> Generator[str]:
+    """Run a local keep-alive HTTP server for the duration of a test."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def _write_self_signed_certificate(directory: Path) -> tuple[str, str]:
+    """Write a throwaway certificate for 127.0.0.1 and return (cert, key) paths."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.UTC)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(hours=1))
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]
+            ),
+            critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = directory / "stand_in_cert.pem"
+    key_path = directory / "stand_in_key.pem"
+    cert_path.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return str(cert_path), str(key_path)
+
+
+@pytest.fixture(name="https_stand_in")
+def https_stand_in_server(tmp_path: Path) -> Generator[tuple[str, str]]:
+    """Run a local keep-alive HTTPS server; yields (base_url, ca_bundle_path)."""
+    cert_path, key_path = _write_self_signed_certificate(tmp_path)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(cert_path, key_path)
+    server.socket = server_context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"https://127.0.0.1:{server.server_port}", cert_path
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def reset_container_registries() -> Generator[None]:
+    """Isolate the container-scoped pool and breaker registries between tests."""
+    # pylint: disable=protected-access
+    shared_configuration._connection_pools.clear()
+    shared_configuration._circuit_breakers.clear()
+    yield
+    shared_configuration._connection_pools.clear()
+    shared_configuration._circuit_breakers.clear()
+
+
+def _unused_local_url() -> str:
+    """Return a local URL on which nothing is listening."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+def _create_shared_cache_table(monkeypatch: pytest.MonkeyPatch) -> Any:
+    """Create the shared cache table in moto and route shared clients to it."""
+    dynamodb = boto3.client("dynamodb", region_name="us-east-1")
+    dynamodb.create_table(
+        TableName=shared_configuration.SHARED_CACHE_TABLE,
+        KeySchema=[{"AttributeName": "cache_key", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "cache_key", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    monkeypatch.setattr(shared_configuration, "_shared_dynamodb_client", dynamodb)
+    return dynamodb
+
+
+class TestConnectionPoolRegistry:
+    """Test container-scoped HTTP connection reuse"""
+
+    def test_registry_returns_same_pool_per_base_url(self) -> None:
+        """Test that trailing slashes map to the same pooled destination"""
+        first = shared_configuration.get_connection_pool("https://ha.example.com/")
+        second = shared_configuration.get_connection_pool("https://ha.example.com")
+        other = shared_configuration.get_connection_pool("https://other.example.com")
+
+        assert first is second
+        assert first is not other
+
+    def test_retry_handlers_share_keep_alive_connection(
+        self, stand_in_url: str
+    ) -> None:
+        """Test that per-request handlers reuse one socket across invocations"""
+        for request_number in range(4):
+            handler = shared_configuration.create_home_assistant_retry_handler(
+                base_url=stand_in_url,
+                token="test-token",
+                correlation_id=f"test-{request_number}",
+            )
+            response = handler.make_api_request(
+                endpoint="/api/alexa/smart_home", method="POST", data={"n": 1}
+            )
+            assert response["status"] == "ok"
+
+        stats = shared_configuration.get_connection_pool_stats()[stand_in_url]
+        assert stats["requests"] == 4
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 3
+        assert stats["reuse_ratio"] == pytest.approx(0.75)
+
+
+class TestCircuitBreaker:
+    """Test container-scoped circuit breaker state"""
+
+    def test_breaker_opens_at_threshold_and_probes_when_half_open(self) -> None:
+        """Test closed -> open -> half_open -> closed transitions"""
+        breaker = shared_configuration.CircuitBreaker(
+            "https://ha.example.com",
+            shared_configuration.CircuitBreakerConfig(
+                failure_threshold=2, reset_timeout=0.05
+            ),
+        )
+
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == shared_configuration.CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+
+        time.sleep(0.06)
+        assert breaker.allow_request()  # single half-open probe
+        assert breaker.state == shared_configuration.CircuitBreaker.HALF_OPEN
+        assert not breaker.allow_request()  # concurrent requests still fail fast
+
+        breaker.record_success()
+        assert breaker.state == shared_configuration.CircuitBreaker.CLOSED
+        assert breaker.get_stats()["times_opened"] == 1
+
+    def test_failed_probe_reopens_breaker(self) -> None:
+        """Test that a failing half-open probe re-opens the breaker"""
+        breaker = shared_configuration.CircuitBreaker(
+            "https://ha.example.com",
+            shared_configuration.CircuitBreakerConfig(
+                failure_threshold=1, reset_timeout=0.01
+            ),
+        )
+        breaker.record_failure()
+        time.sleep(0.02)
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+        assert breaker.state == shared_configuration.CircuitBreaker.OPEN
+
+    def test_breaker_state_survives_across_handlers(self) -> None:
+        """Test that an outage opens the breaker for later invocations"""
+        base_url = _unused_local_url()
+        connection_pool = shared_configuration.ConnectionPoolManager(
+            http=urllib3.PoolManager(retries=False)
+        )
+
+        def new_handler() -> shared_configuration.HomeAssistantRetryHandler:
+            api_config = shared_configuration.HomeAssistantApiConfig(
+                base_url=base_url,
+                token="test-token",
+                retry_config=shared_configuration.RetryConfig(max_retries=0),
+                circuit_breaker_config=shared_configuration.CircuitBreakerConfig(
+                    failure_threshold=1, reset_timeout=60.0
+                ),
+            )
+            return shared_configuration.HomeAssistantRetryHandler(
+                api_config, connection_pool=connection_pool
+            )
+
+        with pytest.raises(urllib3.exceptions.HTTPError):
+            new_handler().make_api_request("/api/")
+
+        connection_pool.make_request = Mock(wraps=connection_pool.make_request)
+        with pytest.raises(shared_configuration.CircuitBreakerOpenError):
+            new_handler().make_api_request("/api/")
+        connection_pool.make_request.assert_not_called()
+
+    def test_open_state_is_shared_through_dynamodb(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a second container adopts a published open window"""
+        with mock_aws():
+            _create_shared_cache_table(monkeypatch)
+            config = shared_configuration.CircuitBreakerConfig(
+                failure_threshold=1, reset_timeout=60.0, shared_state=True
+            )
+
+            first_container = shared_configuration.CircuitBreaker("https://ha", config)
+            second_container = shared_configuration.CircuitBreaker("https://ha", config)
+            first_container.record_failure()
+
+            assert not second_container.allow_request()
+            assert second_container.state == shared_configuration.CircuitBreaker.OPEN
+
+
+class _FakeLambdaContext:  # pylint: disable=too-few-public-methods
+    """Lambda context stand-in exposing only the remaining-time API."""
+
+    def __init__(self, remaining_ms: int) -> None:
+        self.remaining_ms = remaining_ms
+
+    def get_remaining_time_in_millis(self) -> int:
+        """Return the configured remaining execution time."""
+        return self.remaining_ms
+
+
+class TestRequestDeadline:
+    """Test deadline-aware retry budgeting"""
+
+    def test_deadline_uses_smaller_of_lambda_and_alexa_budget(self) -> None:
+        """Test that the deadline is clipped to the tighter budget"""
+        margin = shared_configuration.DEADLINE_SAFETY_MARGIN_SECONDS
+        now = time.monotonic()
+
+        short = shared_configuration.create_request_deadline(_FakeLambdaContext(2000))
+        long = shared_configuration.create_request_deadline(
+            _FakeLambdaContext(60000), response_window=3.0
+        )
+        unknown = shared_configuration.create_request_deadline(
+            None, response_window=3.0
+        )
+
+        assert short - now == pytest.approx(2.0 - margin, abs=0.05)
+        assert long - now == pytest.approx(3.0 - margin, abs=0.05)
+        assert unknown - now == pytest.approx(3.0 - margin, abs=0.05)
+
+    def test_retries_stop_before_deadline(self) -> None:
+        """Test that backoff never sleeps past the request deadline"""
+        attempts: list[float] = []
+
+        def always_fails() -> None:
+            attempts.append(time.monotonic())
+            raise ConnectionError("Home Assistant unreachable")
+
+        retrying = shared_configuration.retry_with_exponential_backoff(
+            always_fails,
+            shared_configuration.RetryConfig(
+                max_retries=5, base_delay=0.1, min_attempt_time=0.05
+            ),
+            deadline=time.monotonic() + 0.3,
+        )
+
+        start = time.monotonic()
+        with pytest.raises(ConnectionError):
+            retrying()
+
+        assert len(attempts) == 2  # 0.1s delay fits, the 0.2s one does not
+        assert time.monotonic() - start < 0.3
+
+    def test_expired_deadline_skips_network_call(self, stand_in_url: str) -> None:
+        """Test that no request is sent once the deadline has passed"""
+        handler = shared_configuration.create_home_assistant_retry_handler(
+            base_url=stand_in_url,
+            token="test-token",
+            deadline=time.monotonic() - 1.0,
+        )
+
+        with pytest.raises(urllib3.exceptions.TimeoutError):
+            handler.make_api_request("/api/alexa/smart_home", method="POST")
+
+        stats = shared_configuration.get_connection_pool_stats()[stand_in_url]
+        assert stats["requests"] == 0
+
+    def test_deadline_exhaustion_is_not_a_breaker_failure(
+        self, monkeypatch: pytest.MonkeyPatch, stand_in_url: str
+    ) -> None:
+        """Test that running out of budget leaves the circuit breaker alone"""
+        handler = shared_configuration.create_home_assistant_retry_handler(
+            base_url=stand_in_url, token="test-token", deadline=time.monotonic()
+        )
+        # Budget is left for the entry check, then gone before the attempt
+        remaining = iter([1.0, 0.0])
+        monkeypatch.setattr(
+            handler.api_config, "remaining_time", lambda: next(remaining, 0.0)
+        )
+
+        with pytest.raises(shared_configuration.RequestDeadlineExceededError):
+            handler.make_api_request("/api/alexa/smart_home", method="POST")
+
+        assert handler.get_retry_stats()["circuit_breaker_failures"] == 0
+
+    def test_request_within_budget_succeeds(self, stand_in_url: str) -> None:
+        """Test that a deadline-bounded request still reaches Home Assistant"""
+        handler = shared_configuration.create_home_assistant_retry_handler(
+            base_url=stand_in_url,
+            token="test-token",
+            deadline=shared_configuration.create_request_deadline(
+                _FakeLambdaContext(5000)
+            ),
+        )
+
+        response = handler.make_api_request(
+            "/api/alexa/smart_home", method="POST", data={"n": 1}
+        )
+        assert response["status"] == "ok"
+
+
+def _directive(
+    namespace: str, name: str, token: str = "token-a", endpoint_id: str = "light-1"
+) -> dict[str, Any]:
+    """Build a minimal Alexa directive with unique per-request identifiers."""
+    return {
+        "directive": {
+            "header": {
+                "namespace": namespace,
+                "name": name,
+                "messageId": f"msg-{time.perf_counter_ns()}",
+                "correlationToken": f"corr-{time.perf_counter_ns()}",
+                "payloadVersion": "3",
+            },
+            "endpoint": {
+                "scope": {"type": "BearerToken", "token": token},
+                "endpointId": endpoint_id,
+            },
+            "payload": {},
+        }
+    }
+
+
+class TestDirectiveCacheKey:
+    """Test semantic response cache keys for Alexa directives"""
+
+    def test_key_ignores_per_request_identifiers(self) -> None:
+        """Test that repeated ReportState directives share one cache key"""
+        first = shared_configuration.build_directive_cache_key(
+            _directive("Alexa", "ReportState")
+        )
+        second = shared_configuration.build_directive_cache_key(
+            _directive("Alexa", "ReportState")
+        )
+
+        assert first is not None
+        assert first == second
+        assert first[1] == shared_configuration.REPORT_STATE_CACHE_TTL
+        assert "token-a" not in first[0]
+
+    def test_key_separates_tokens_and_endpoints(self) -> None:
+        """Test that callers and endpoints never share cached responses"""
+        base = shared_configuration.build_directive_cache_key(
+            _directive("Alexa", "ReportState")
+        )
+        other_token = shared_configuration.build_directive_cache_key(
+            _directive("Alexa", "ReportState", token="token-b")
+        )
+        other_endpoint = shared_configuration.build_directive_cache_key(
+            _directive("Alexa", "ReportState", endpoint_id="light-2")
+        )
+
+        assert len({base, other_token, other_endpoint}) == 3
+
+    def test_control_directives_are_not_cacheable(self) -> None:
+        """Test that state-changing directives always reach Home Assistant"""
+        event = _directive("Alexa.PowerController", "TurnOn")
+
+        state_entry = shared_configuration.build_directive_cache_key(
+            _directive("Alexa", "ReportState")
+        )
+
+        assert shared_configuration.build_directive_cache_key(event) is None
+        assert state_entry is not None
+        assert shared_configuration.build_report_state_cache_key(event) == (
+            state_entry[0]
+        )
+
+    def test_discovery_uses_payload_scope_token(self) -> None:
+        """Test that Discovery is keyed on the token in its payload scope"""
+        event = {
+            "directive": {
+                "header": {"namespace": "Alexa.Discovery", "name": "Discover"},
+                "payload": {"scope": {"type": "BearerToken", "token": "token-a"}},
+            }
+        }
+
+        cache_entry = shared_configuration.build_directive_cache_key(event)
+        assert cache_entry is not None
+        assert cache_entry[1] == shared_configuration.DISCOVERY_CACHE_TTL
+
+    def test_cached_response_is_restamped_for_current_directive(self) -> None:
+        """Test that a cache hit carries a new messageId and correlationToken"""
+        cached = {
+            "event": {
+                "header": {"messageId": "old-msg", "correlationToken": "old-corr"},
+                "payload": {},
+            },
+            "context": {"properties": []},
+        }
+        event = _directive("Alexa", "ReportState")
+
+        refreshed = shared_configuration.refresh_cached_directive_response(
+            cached, event
+        )
+
+        header = refreshed["event"]["header"]
+        assert header["messageId"] != "old-msg"
+        assert header["correlationToken"] == (
+            event["directive"]["header"]["correlationToken"]
+        )
+        assert cached["event"]["header"]["messageId"] == "old-msg"
+        assert refreshed["context"] is cached["context"]
+
+
+class TestResponseCache:
+    """Test the bounded LRU+TTL response cache"""
+
+    def test_least_recently_used_entry_is_evicted_at_capacity(self) -> None:
+        """Test that reading an entry protects it from capacity eviction"""
+        cache = shared_configuration.ResponseCache(max_entries=2)
+        cache.set("Alexa:ReportState:a:t", {"n": 1}, ttl_seconds=60)
+        cache.set("Alexa:ReportState:b:t", {"n": 2}, ttl_seconds=60)
+        cache.get("Alexa:ReportState:a:t")
+        cache.set("Alexa:ReportState:c:t", {"n": 3}, ttl_seconds=60)
+
+        assert cache.get("Alexa:ReportState:a:t")[1]
+        assert not cache.get("Alexa:ReportState:b:t")[1]
+        stats = cache.get_cache_stats()
+        assert stats["size"] == 2
+        assert stats["evicted_capacity"] == 1
+
+    def test_byte_budget_bounds_memory(self) -> None:
+        """Test that the byte budget evicts old entries and rejects huge ones"""
+        cache = shared_configuration.ResponseCache(max_entries=100, max_bytes=1000)
+        for index in range(10):
+            cache.set(f"key-{index}", {"blob": "x" * 300}, ttl_seconds=60)
+        cache.set("too-big", {"blob": "x" * 2000}, ttl_seconds=60)
+
+        stats = cache.get_cache_stats()
+        assert stats["bytes"] <= 1000
+        assert stats["size"] == 3
+        assert stats["evicted_memory"] == 7
+        assert stats["rejected_oversize"] == 1
+
+    def test_periodic_sweep_expires_entries_without_reads(self) -> None:
+        """Test that expired entries are reclaimed even if never read again"""
+        cache = shared_configuration.ResponseCache(sweep_interval=4)
+        for index in range(3):
+            cache.set(f"stale-{index}", {"n": index}, ttl_seconds=1)
+        time.sleep(1.05)
+
+        cache.set("fresh", {"n": 0}, ttl_seconds=60)  # fourth operation sweeps
+
+        stats = cache.get_cache_stats()
+        assert stats["size"] == 1
+        assert stats["evicted_expired"] == 3
+
+    def test_sweep_reaches_recently_read_expired_entries(self) -> None:
+        """Test that the sweep follows expiry order, not LRU order"""
+        long_lived = shared_configuration.ResponseCache.SWEEP_BATCH_SIZE + 4
+        # One sweep after: the short entry, the long-lived ones and one read
+        cache = shared_configuration.ResponseCache(sweep_interval=long_lived + 3)
+        cache.set("short", {"n": 0}, ttl_seconds=1)
+        for index in range(long_lived):
+            cache.set(f"long-{index}", {"n": index}, ttl_seconds=60)
+        cache.get("short")  # Most recently used: last in LRU order
+        time.sleep(1.05)
+
+        cache.set("trigger", {"n": 0}, ttl_seconds=60)  # this operation sweeps
+
+        stats = cache.get_cache_stats()
+        assert stats["evicted_expired"] == 1
+        assert stats["size"] == long_lived + 1
+
+    def test_hit_ratio_is_reported_per_key_class(self) -> None:
+        """Test per-class hit ratios for directive cache keys"""
+        cache = shared_configuration.ResponseCache()
+        cache.set("Alexa.Discovery:Discover::fp", {"endpoints": []}, ttl_seconds=60)
+        cache.get("Alexa.Discovery:Discover::fp")
+        cache.get("Alexa:ReportState:light-1:fp")
+
+        key_classes = cache.get_cache_stats()["key_classes"]
+        assert key_classes["Alexa.Discovery:Discover"]["hit_ratio"] == 1.0
+        assert key_classes["Alexa:ReportState"]["hit_ratio"] == 0.0
+
+
+class TestRateLimiter:
+    """Test the container-scoped sliding-window rate limiter"""
+
+    def test_per_ip_limit_applies_across_checks(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that one instance enforces the per-IP limit and then blocks"""
+        monkeypatch.setattr(
+            shared_configuration.SecurityConfig, "MAX_REQUESTS_PER_IP_PER_MINUTE", 3
+        )
+        limiter = shared_configuration.RateLimiter()
+
+        results = [limiter.is_allowed("203.0.113.7")[0] for _ in range(4)]
+
+        assert results == [True, True, True, False]
+        assert limiter.is_allowed("203.0.113.8")[0]
+
+    def test_window_slides_by_bucket(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that requests older than the window stop counting"""
+        monkeypatch.setattr(
+            shared_configuration.SecurityConfig, "MAX_REQUESTS_PER_IP_PER_MINUTE", 2
+        )
+        monkeypatch.setattr(
+            shared_configuration.SecurityConfig, "SUSPICIOUS_REQUEST_THRESHOLD", 100
+        )
+        clock = {"now": 1000.0}
+        monkeypatch.setattr(shared_configuration.time, "time", lambda: clock["now"])
+        limiter = shared_configuration.RateLimiter()
+
+        assert limiter.is_allowed("203.0.113.7")[0]
+        assert limiter.is_allowed("203.0.113.7")[0]
+        assert not limiter.is_allowed("203.0.113.7")[0]
+
+        clock["now"] += shared_configuration.SecurityConfig.RATE_LIMIT_WINDOW_SECONDS
+        assert limiter.is_allowed("203.0.113.7")[0]
+
+    def test_tracked_ips_are_capped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a flood of distinct IPs cannot grow memory without bound"""
+        monkeypatch.setattr(
+            shared_configuration.SecurityConfig, "MAX_REQUESTS_PER_MINUTE", 10**9
+        )
+        limiter = shared_configuration.RateLimiter(max_tracked_ips=100)
+
+        for index in range(1000):
+            limiter.is_allowed(f"198.51.{index // 256}.{index % 256}")
+
+        assert limiter.get_stats()["tracked_ips"] == 100
+
+    def test_check_cost_does_not_grow_with_traffic(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a long burst never holds more than one window of buckets"""
+        monkeypatch.setattr(
+            shared_configuration.SecurityConfig, "MAX_REQUESTS_PER_MINUTE", 10**9
+        )
+        monkeypatch.setattr(
+            shared_configuration.SecurityConfig,
+            "MAX_REQUESTS_PER_IP_PER_MINUTE",
+            10**9,
+        )
+        clock = {"now": 1000.0}
+        monkeypatch.setattr(shared_configuration.time, "time", lambda: clock["now"])
+        limiter = shared_configuration.RateLimiter()
+        # pylint: disable=protected-access
+        counters = [limiter._global_requests]
+
+        peak_buckets = 0
+        for index in range(20000):
+            clock["now"] = 1000.0 + index * 0.01  # 200s: several windows
+            limiter.is_allowed("203.0.113.7")
+            if index == 0:
+                counters.append(limiter._requests["203.0.113.7"])
+            peak_buckets = max(peak_buckets, *(len(c._buckets) for c in counters))
+
+        assert peak_buckets == limiter.WINDOW_BUCKETS
+        assert [len(c._buckets) for c in counters] == [limiter.WINDOW_BUCKETS] * 2
+
+    def test_directives_without_source_ip_are_not_blocked(self) -> None:
+        """Test that Alexa directives (no requestContext) skip the per-IP limit"""
+        from custom_components.ha_external_connector.integrations.alexa.lambda_functions import (  # noqa: E501 pylint: disable=import-outside-toplevel
+            smart_home_bridge,
+        )
+
+        limiter = shared_configuration.RateLimiter()
+        limit = shared_configuration.SecurityConfig.MAX_REQUESTS_PER_IP_PER_MINUTE
+        event = _directive("Alexa.Discovery", "Discover")
+        for _ in range(limit + 5):
+            # pylint: disable=protected-access
+            smart_home_bridge._validate_request_security(
+                event,
+                shared_configuration.parse_directive(event),
+                "test",
+                limiter,
+                shared_configuration.AlexaValidator(),
+                shared_configuration.SecurityEventLogger(),
+            )
+
+        assert limiter.get_stats()["blocked_ips"] == 0
+        assert limiter.is_allowed("unknown")[0]
+
+
+class TestDistributedRateLimiting:
+    """Test rate limits shared across containers through DynamoDB"""
+
+    def test_limit_holds_across_containers(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that two containers together never exceed the per-IP limit"""
+        monkeypatch.setattr(
+            shared_configuration.SecurityConfig, "MAX_REQUESTS_PER_IP_PER_MINUTE", 10
+        )
+        monkeypatch.setattr(
+            shared_configuration.SecurityConfig, "SUSPICIOUS_REQUEST_THRESHOLD", 100
+        )
+        with mock_aws():
+            _create_shared_cache_table(monkeypatch)
+            containers = [
+                shared_configuration.RateLimiter(
+                    distributed_backend=(
+                        shared_configuration.DistributedRateLimitBackend(lease_size=3)
+                    )
+                )
+                for _ in range(2)
+            ]
+
+            allowed = sum(
+                containers[index % 2].is_allowed("203.0.113.7")[0]
+                for index in range(16)
+            )
+
+        assert allowed == 10
+
+    def test_leases_avoid_a_round_trip_per_request(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that most grants are served from the local token lease"""
+        with mock_aws():
+            dynamodb = _create_shared_cache_table(monkeypatch)
+            backend = shared_configuration.DistributedRateLimitBackend(lease_size=5)
+            now = time.time()
+
+            grants = [backend.acquire("global", 100, now) for _ in range(10)]
+            window_index = int(
+                now // shared_configuration.SecurityConfig.RATE_LIMIT_WINDOW_SECONDS
+            )
+            item = dynamodb.get_item(
+                TableName=shared_configuration.SHARED_CACHE_TABLE,
+                Key={"cache_key": {"S": f"rate_limit:global:{window_index}"}},
+            )["Item"]
+
+        assert all(grants)
+        assert backend.get_stats()["remote_grants"] == 2
+        assert backend.get_stats()["local_grants"] == 8
+        assert item["request_count"]["N"] == "10"
+        assert int(item["ttl"]["N"]) > now
+
+    def test_denial_is_cached_until_the_window_rolls_over(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a refused scope makes no DynamoDB calls for the window"""
+        with mock_aws():
+            dynamodb = _create_shared_cache_table(monkeypatch)
+            backend = shared_configuration.DistributedRateLimitBackend(lease_size=1)
+            window = shared_configuration.SecurityConfig.RATE_LIMIT_WINDOW_SECONDS
+            now = (time.time() // window) * window
+
+            assert backend.acquire("global", 1, now)
+            calls = _count_aws_calls(dynamodb)
+            denials = [backend.acquire("global", 1, now + 1) for _ in range(5)]
+            denied_calls = dict(calls)
+            next_window = backend.acquire("global", 1, now + window)
+
+        assert denials == [False] * 5
+        assert denied_calls == {"UpdateItem": 1}
+        assert backend.get_stats()["local_denials"] == 4
+        assert next_window
+
+    def test_global_denial_refunds_the_per_ip_token(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a request refused globally does not spend its IP's quota"""
+        monkeypatch.setattr(
+            shared_configuration.SecurityConfig, "MAX_REQUESTS_PER_MINUTE", 1
+        )
+        with mock_aws():
+            dynamodb = _create_shared_cache_table(monkeypatch)
+            backend = shared_configuration.DistributedRateLimitBackend(lease_size=1)
+            limiter = shared_configuration.RateLimiter(distributed_backend=backend)
+            now = time.time()
+
+            assert backend.acquire("global", 1, now)
+            allowed, reason = limiter.is_allowed("203.0.113.7")
+            calls = _count_aws_calls(dynamodb)
+            ip_grant = backend.acquire(
+                "ip:203.0.113.7",
+                shared_configuration.SecurityConfig.MAX_REQUESTS_PER_IP_PER_MINUTE,
+                now,
+            )
+
+        assert not allowed
+        assert reason == "Global rate limit exceeded"
+        assert ip_grant
+        assert not calls
+
+    def test_unavailable_table_falls_back_to_local_limits(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a DynamoDB outage does not reject traffic"""
+        with mock_aws():
+            monkeypatch.setattr(
+                shared_configuration,
+                "_shared_dynamodb_client",
+                boto3.client("dynamodb", region_name="us-east-1"),
+            )
+            limiter = shared_configuration.RateLimiter(
+                distributed_backend=shared_configuration.DistributedRateLimitBackend()
+            )
+
+            assert limiter.is_allowed("203.0.113.7")[0]
+
+
+def _count_aws_calls(client: Any) -> dict[str, int]:
+    """Count API operations made through a boto3 client."""
+    calls: dict[str, int] = {}
+
+    def _record(model: Any, **_: Any) -> None:
+        calls[model.name] = calls.get(model.name, 0) + 1
+
+    client.meta.events.register("before-call.*.*", _record)
+    return calls
+
+
+def _new_config_manager(
+    ssm: Any, dynamodb: Any
+) -> shared_configuration.ConfigurationManager:
+    """Create a configuration manager (a fresh container) bound to moto clients."""
+    manager = shared_configuration.ConfigurationManager()
+    # pylint: disable=protected-access
+    manager._ssm_client = ssm
+    manager._instance_dynamodb_client = dynamodb
+    return manager
+
+
+class TestBatchedConfigurationLoading:
+    """Test cold-start configuration loading with batched AWS calls"""
+
+    SECTIONS = (
+        "ha_config",
+        "cloudflare_config",
+        "security_config",
+        "aws_config",
+        "lambda_config",
+    )
+
+    def test_gen3_cold_load_uses_batched_calls(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that five Gen 3 sections need one probe plus batched reads"""
+        with mock_aws():
+            dynamodb = _create_shared_cache_table(monkeypatch)
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            for section in self.SECTIONS:
+                ssm.put_parameter(
+                    Name=f"/test/alexa/{section}",
+                    Value=json.dumps({"base_url": "https://ha.example.com"}),
+                    Type="SecureString",
+                )
+
+            monkeypatch.setattr(
+                shared_configuration,
+                "_config_manager",
+                _new_config_manager(ssm, dynamodb),
+            )
+            ssm_calls = _count_aws_calls(ssm)
+            dynamodb_calls = _count_aws_calls(dynamodb)
+
+            configs, generation, features = (
+                shared_configuration.load_comprehensive_configuration("/test/alexa/")
+            )
+
+        assert generation == (
+            shared_configuration.ConfigurationGeneration.GEN_3_MODULAR_SSM
+        )
+        assert set(configs) == set(self.SECTIONS)
+        assert features["core_available"]
+        assert ssm_calls == {"GetParametersByPath": 1, "GetParameters": 1}
+        assert dynamodb_calls == {"BatchGetItem": 1, "BatchWriteItem": 1}
+
+    def test_gen3_shared_cache_hit_skips_ssm(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a second container reads all sections from DynamoDB"""
+        with mock_aws():
+            dynamodb = _create_shared_cache_table(monkeypatch)
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            ssm.put_parameter(
+                Name="/test/alexa/ha_config",
+                Value=json.dumps({"base_url": "https://ha.example.com"}),
+                Type="SecureString",
+            )
+
+            _new_config_manager(ssm, dynamodb).load_sections(
+                ["ha_config"],
+                "/test/alexa/",
+                shared_configuration.ConfigurationGeneration.GEN_3_MODULAR_SSM,
+            )
+            ssm_calls = _count_aws_calls(ssm)
+            configs, _ = _new_config_manager(ssm, dynamodb).load_sections(
+                ["ha_config"],
+                "/test/alexa/",
+                shared_configuration.ConfigurationGeneration.GEN_3_MODULAR_SSM,
+            )
+
+        assert configs["ha_config"]["base_url"] == "https://ha.example.com"
+        assert not ssm_calls
+
+    def test_gen3_shared_cache_rows_exclude_environment_overrides(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that environment secrets never reach the shared cache rows"""
+        monkeypatch.setenv("HA_TOKEN", "env-only-token")
+        with mock_aws():
+            dynamodb = _create_shared_cache_table(monkeypatch)
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            ssm.put_parameter(
+                Name="/test/alexa/ha_config",
+                Value=json.dumps({"base_url": "https://ha.example.com"}),
+                Type="SecureString",
+            )
+
+            configs, _ = _new_config_manager(ssm, dynamodb).load_sections(
+                ["ha_config"],
+                "/test/alexa/",
+                shared_configuration.ConfigurationGeneration.GEN_3_MODULAR_SSM,
+            )
+            row = dynamodb.get_item(
+                TableName=shared_configuration.SHARED_CACHE_TABLE,
+                Key={
+                    "cache_key": {
+                        "S": shared_configuration.shared_cache_key(
+                            "/test/alexa/", "ha_config"
+                        )
+                    }
+                },
+            )["Item"]
+
+        assert configs["ha_config"]["token"] == "env-only-token"
+        assert json.loads(row["config"]["S"]) == {"base_url": "https://ha.example.com"}
+
+
+class TestGenerationDetectionMemo:
+    """Test memoized configuration generation detection"""
+
+    def test_detection_runs_once_per_path(self) -> None:
+        """Test that later loads reuse the detected generation"""
+        with mock_aws():
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            ssm.put_parameter(
+                Name="/test/alexa/ha_config",
+                Value=json.dumps({"base_url": "https://ha.example.com"}),
+                Type="SecureString",
+            )
+            manager = _new_config_manager(ssm, None)
+            ssm_calls = _count_aws_calls(ssm)
+
+            # pylint: disable=protected-access
+            first = manager._detect_configuration_generation("/test/alexa/")
+            second = manager._detect_configuration_generation("/test/alexa/")
+
+        assert first == second
+        assert first == shared_configuration.ConfigurationGeneration.GEN_3_MODULAR_SSM
+        assert ssm_calls == {"GetParametersByPath": 1}
+
+    def test_invalidation_hook_forces_reprobe(self) -> None:
+        """Test that invalidation picks up a changed SSM layout"""
+        with mock_aws():
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            manager = _new_config_manager(ssm, None)
+
+            # pylint: disable=protected-access
+            before = manager._detect_configuration_generation("/test/alexa/")
+            ssm.put_parameter(
+                Name="/test/alexa/appConfig",
+                Value=json.dumps({"HA_BASE_URL": "https://ha.example.com"}),
+                Type="SecureString",
+            )
+            memoized = manager._detect_configuration_generation("/test/alexa/")
+            manager.invalidate_generation("/test/alexa/")
+            after = manager._detect_configuration_generation("/test/alexa/")
+
+        generations = shared_configuration.ConfigurationGeneration
+        assert before == memoized == generations.GEN_1_ENV_ONLY
+        assert after == generations.GEN_2_ENV_SSM_JSON
+
+    def test_probe_misses_are_negative_cached(self) -> None:
+        """Test that known-missing Gen 2 candidates are not requested again"""
+        with mock_aws():
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            ssm.put_parameter(
+                Name="/test/alexa/appConfig",
+                Value=json.dumps({"HA_BASE_URL": "https://ha.example.com"}),
+                Type="SecureString",
+            )
+            manager = _new_config_manager(ssm, None)
+            requested: list[list[str]] = []
+            ssm.meta.events.register(
+                "provide-client-params.ssm.GetParameters",
+                lambda params, **_: requested.append(list(params["Names"])),
+            )
+
+            configs, _ = manager.load_sections(["ha_config"], "/test/alexa/")
+
+        assert configs["ha_config"]["base_url"] == "https://ha.example.com"
+        assert requested == [
+            ["/test/alexa/appConfig", "/test/alexa"],
+            ["/test/alexa/appConfig", "/test/alexa/config"],
+        ]
+
+
+class TestNegativeCaching:
+    """Test short-lived caching of missing parameters and cache rows"""
+
+    def test_negative_cache_is_bounded_and_expires(self) -> None:
+        """Test LRU bound and TTL expiry of known-missing entries"""
+        negative_cache = shared_configuration.NegativeCache(
+            ttl_seconds=0.05, max_entries=2
+        )
+        for key in ("/a", "/b", "/c"):
+            negative_cache.add(key)
+
+        assert not negative_cache.contains("/a")
+        assert negative_cache.contains("/c")
+        time.sleep(0.06)
+        assert not negative_cache.contains("/c")
+        assert negative_cache.get_stats()["evictions"] == 1
+
+    def test_missing_gen3_parameter_and_cache_row_are_not_refetched(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that repeated loads of an absent section skip AWS entirely"""
+        with mock_aws():
+            dynamodb = _create_shared_cache_table(monkeypatch)
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            manager = _new_config_manager(ssm, dynamodb)
+            ssm_calls = _count_aws_calls(ssm)
+            dynamodb_calls = _count_aws_calls(dynamodb)
+
+            for _ in range(3):
+                # pylint: disable=protected-access
+                manager._load_generation_3_modular_ssm("aws_config", "/test/alexa/")
+
+        stats = manager.get_stats()
+        assert ssm_calls == {"GetParameter": 1}
+        assert dynamodb_calls == {"GetItem": 1}
+        assert stats["round_trips_saved"] == 4
+        assert stats["negative_cache"]["ssm_parameters"]["hits"] == 2
+
+    def test_stats_report_round_trips_saved(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that get_configuration_stats exposes the savings"""
+        with mock_aws():
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            manager = _new_config_manager(ssm, None)
+            monkeypatch.setattr(shared_configuration, "_config_manager", manager)
+
+            manager.load_sections(["ha_config"], "/test/alexa/")
+            # Generation memo expired, known-missing Gen 2 candidates have not
+            manager._generation_cache.clear()  # pylint: disable=protected-access
+            manager.load_sections(["security_config"], "/test/alexa/")
+
+        stats = shared_configuration.get_configuration_stats()
+        assert stats["round_trips_saved"] >= 1
+        assert "shared_cache_rows" in stats["negative_cache"]
+
+
+class TestOAuthConnectionPool:
+    """Test the gateway's keep-alive pool for OAuth token exchange"""
+
+    @pytest.fixture(name="oauth_url")
+    def trusted_oauth_destination(
+        self, https_stand_in: tuple[str, str], monkeypatch: pytest.MonkeyPatch
+    ) -> str:
+        """Point the OAuth pool factory at the stand-in's CA bundle."""
+        base_url, ca_certs = https_stand_in
+        create_session = shared_configuration.create_oauth_http_session
+        monkeypatch.setattr(
+            shared_configuration,
+            "create_oauth_http_session",
+            lambda: create_session(ca_certs=ca_certs),
+        )
+        return base_url
+
+    @staticmethod
+    def _exchange(
+        destination_url: str,
+        performance_monitor: shared_configuration.PerformanceMonitor | None = None,
+    ) -> dict[str, Any] | None:
+        """Run one token exchange and return the parsed success response."""
+        processor = shared_configuration.OAuthRequestProcessor
+        success, error = processor.execute_oauth_request(
+            destination_url,
+            "cf-client-id",
+            "cf-client-secret",
+            b"grant_type=refresh_token&refresh_token=abc",
+            "test-correlation",
+            performance_monitor=performance_monitor,
+        )
+        assert error is None
+        return success
+
+    def test_token_exchanges_reuse_one_connection(self, oauth_url: str) -> None:
+        """Test that repeated exchanges share one socket and one TLS handshake"""
+        monitor = shared_configuration.PerformanceMonitor()
+        for _ in range(5):
+            response = self._exchange(oauth_url, monitor)
+            assert response == {"status": "ok", "path": "/auth/token"}
+
+        pool_stats = shared_configuration.get_connection_pool_stats()[
+            f"oauth:{oauth_url}"
+        ]
+        assert pool_stats["new_connections"] == 1
+        assert pool_stats["tls_handshakes"] == 1
+
+        performance_stats = monitor.get_performance_stats()
+        assert performance_stats["connection_reuse"] == 4
+        assert performance_stats["new_connections"] == 1
+        assert performance_stats["connection_reuse_ratio"] == pytest.approx(0.8)
+
+    def test_reconnect_resumes_tls_session(self, oauth_url: str) -> None:
+        """Test that a dropped keep-alive connection resumes the TLS session"""
+        self._exchange(oauth_url)
+        shared_configuration.get_oauth_connection_pool(oauth_url).clear()
+        self._exchange(oauth_url)
+
+        pool_stats = shared_configuration.get_connection_pool_stats()[
+            f"oauth:{oauth_url}"
+        ]
+        assert pool_stats["tls_handshakes"] == 2
+        assert pool_stats["tls_sessions_resumed"] == 1
+
+    def test_pooled_exchange_outperforms_per_call_pool(
+        self, oauth_url: str, https_stand_in: tuple[str, str]
+    ) -> None:
+        """Test that the container pool handshakes once where per-call pools repeat"""
+        _, ca_certs = https_stand_in
+        exchanges = 20
+
+        per_call_connections = 0
+        per_call_start = time.perf_counter()
+        for _ in range(exchanges):
+            http = urllib3.PoolManager(
+                cert_reqs="CERT_REQUIRED",
+                ca_certs=ca_certs,
+                timeout=urllib3.Timeout(connect=2.0, read=10.0),
+            )
+            response = http.request(
+                "POST",
+                f"{oauth_url}/auth/token",
+                body=b"grant_type=refresh_token&refresh_token=abc",
+            )
+            assert response.status == 200
+            per_call_connections += http.connection_from_url(oauth_url).num_connections
+            http.clear()
+        per_call_elapsed = time.perf_counter() - per_call_start
+
+        pooled_start = time.perf_counter()
+        for _ in range(exchanges):
+            self._exchange(oauth_url)
+        pooled_elapsed = time.perf_counter() - pooled_start
+        print(
+            f"{exchanges} exchanges: per-call pool {per_call_elapsed * 1000:.1f}ms, "
+            f"container pool {pooled_elapsed * 1000:.1f}ms"
+        )
+
+        pool_stats = shared_configuration.get_connection_pool_stats()[
+            f"oauth:{oauth_url}"
+        ]
+        assert per_call_connections == exchanges
+        assert pool_stats["new_connections"] == 1
+        assert pool_stats["tls_handshakes"] == 1
+
+
+class TestOAuthConfigSnapshot:
+    """Test the gateway's container-scoped OAuth configuration snapshot"""
+
+    class _Loader:  # pylint: disable=too-few-public-methods
+        """Counting loader returning whatever configuration is current."""
+
+        def __init__(self) -> None:
+            self.calls = 0
+            self.config = {
+                "destination_url": "https://ha.example.com",
+                "cf_client_id": "client-id",
+                "cf_client_secret": "client-secret",
+                "wrapper_secret": "wrapper-secret",
+            }
+            self.errors: list[str] = []
+
+        def __call__(self, correlation_id: str) -> tuple[dict[str, str], list[str]]:
+            self.calls += 1
+            return dict(self.config), list(self.errors)
+
+    @staticmethod
+    def _wait_for_refresh(cache: shared_configuration.OAuthConfigSnapshotCache) -> None:
+        """Join the background refresh thread, if one was started."""
+        thread = cache._refresh_thread  # pylint: disable=protected-access
+        if thread is not None:
+            thread.join(timeout=5)
+
+    def test_warm_requests_reuse_one_immutable_snapshot(self) -> None:
+        """Test that the loader runs once and the snapshot cannot be mutated"""
+        loader = self._Loader()
+        cache = shared_configuration.OAuthConfigSnapshotCache(
+            loader, ttl=60, version_source=lambda: 1
+        )
+
+        snapshots = [cache.get(f"test-{n}")[0] for n in range(5)]
+
+        assert loader.calls == 1
+        assert all(snapshot is snapshots[0] for snapshot in snapshots)
+        assert snapshots[0] is not None
+        assert snapshots[0].destination_url == "https://ha.example.com"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshots[0].wrapper_secret = "changed"  # type: ignore[misc]
+
+    def test_version_change_refreshes_in_background(self) -> None:
+        """Test that a new configuration version is picked up without blocking"""
+        loader = self._Loader()
+        version = [1]
+        cache = shared_configuration.OAuthConfigSnapshotCache(
+            loader, ttl=60, version_source=lambda: version[0]
+        )
+        first, _ = cache.get("test-cold")
+
+        version[0] = 2
+        loader.config["cf_client_secret"] = "rotated-secret"
+        stale, _ = cache.get("test-stale")
+        self._wait_for_refresh(cache)
+        fresh, _ = cache.get("test-fresh")
+
+        assert stale is first
+        assert fresh is not None and fresh.cf_client_secret == "rotated-secret"
+        assert fresh.version == 2
+        assert loader.calls == 2
+
+    def test_expired_snapshot_survives_invalid_refresh(self) -> None:
+        """Test that a rejected reload keeps serving the last good snapshot"""
+        loader = self._Loader()
+        cache = shared_configuration.OAuthConfigSnapshotCache(
+            loader, ttl=0, version_source=lambda: 1
+        )
+        first, _ = cache.get("test-cold")
+
+        loader.errors = ["CF_CLIENT_ID is missing from configuration"]
+        cache.get("test-expired")
+        self._wait_for_refresh(cache)
+        current, errors = cache.get("test-after")
+
+        assert current is first
+        assert not errors
+        assert cache.get_stats()["refresh_failures"] >= 1
+
+    def test_cold_start_reports_validation_errors(self) -> None:
+        """Test that invalid configuration on cold start is not cached"""
+        loader = self._Loader()
+        loader.errors = ["HA_BASE_URL is missing from configuration"]
+        cache = shared_configuration.OAuthConfigSnapshotCache(
+            loader, ttl=60, version_source=lambda: 1
+        )
+
+        assert cache.get("test-1") == (None, loader.errors)
+        assert cache.get("test-2") == (None, loader.errors)
+        assert loader.calls == 2
+
+    def test_configuration_version_tracks_content_changes(self) -> None:
+        """Test that only changed configuration content bumps the version"""
+        manager = shared_configuration.ConfigurationManager()
+        # pylint: disable=protected-access
+        manager._set_container_cache("ha_config:/test/", {"a": 1}, "gen")
+        manager._set_container_cache("ha_config:/test/", {"a": 1}, "gen")
+        assert manager.configuration_version == 0
+
+        manager._set_container_cache("ha_config:/test/", {"a": 2}, "gen")
+        assert manager.configuration_version == 1
+
+        manager.invalidate_generation("/test/")
+        assert manager.configuration_version == 2
+
+
+_REFRESH_BODY = b"grant_type=refresh_token&refresh_token=abc&client_id=alexa"
+
+
+class _CountingExchange:  # pylint: disable=too-few-public-methods
+    """Stand-in for the Home Assistant token exchange."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+
+    def __call__(self) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            return None, {"event": {"payload": {"type": "INTERNAL_ERROR"}}}
+        return {"access_token": f"token-{self.calls}", "expires_in": 1800}, None
+
+
+class TestOAuthRefreshCoalescing:
+    """Test refresh-grant coalescing in front of Home Assistant /auth/token"""
+
+    def test_only_refresh_grants_are_coalesced(self) -> None:
+        """Test that keys hide the token and ignore parameter order"""
+        coalescer = shared_configuration.OAuthRefreshCoalescer()
+        key = coalescer.cache_key(_REFRESH_BODY, "https://ha", "secret")
+        reordered = coalescer.cache_key(
+            b"client_id=alexa&refresh_token=abc&grant_type=refresh_token",
+            "https://ha",
+            "secret",
+        )
+
+        assert key is not None and key == reordered
+        assert "abc" not in key
+        assert key != coalescer.cache_key(_REFRESH_BODY, "https://ha", "other")
+        assert (
+            coalescer.cache_key(
+                b"grant_type=authorization_code&code=xyz", "https://ha", "secret"
+            )
+            is None
+        )
+
+    def test_repeated_refresh_within_window_calls_upstream_once(self) -> None:
+        """Test that a duplicate refresh is answered from the container cache"""
+        coalescer = shared_configuration.OAuthRefreshCoalescer(window_seconds=10)
+        exchange = _CountingExchange()
+        key = coalescer.cache_key(_REFRESH_BODY, "https://ha", "secret")
+        assert key is not None
+
+        first, _ = coalescer.execute(key, exchange, "test-1")
+        second, _ = coalescer.execute(key, exchange, "test-2")
+
+        assert exchange.calls == 1
+        assert first == second == {"access_token": "token-1", "expires_in": 1800}
+        assert coalescer.get_stats()["local_hits"] == 1
+
+    def test_concurrent_duplicates_share_one_exchange(self) -> None:
+        """Test that in-flight duplicates wait for the first exchange"""
+        coalescer = shared_configuration.OAuthRefreshCoalescer(window_seconds=10)
+        exchange = _CountingExchange(delay=0.2)
+        key = coalescer.cache_key(_REFRESH_BODY, "https://ha", "secret")
+        assert key is not None
+        results: list[Any] = []
+
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    coalescer.execute(key, exchange, "test")  # type: ignore[arg-type]
+                )
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert exchange.calls == 1
+        assert len(results) == 5
+        assert all(result == results[0] for result in results)
+
+    def test_errors_are_not_cached(self) -> None:
+        """Test that a failed refresh is retried upstream next time"""
+        coalescer = shared_configuration.OAuthRefreshCoalescer(window_seconds=10)
+        exchange = _CountingExchange(fail=True)
+        key = coalescer.cache_key(_REFRESH_BODY, "https://ha", "secret")
+        assert key is not None
+
+        coalescer.execute(key, exchange, "test-1")
+        coalescer.execute(key, exchange, "test-2")
+
+        assert exchange.calls == 2
+
+    def test_shared_cache_is_encrypted_and_spans_containers(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a second container reuses the encrypted DynamoDB row"""
+        with mock_aws():
+            dynamodb = boto3.client("dynamodb", region_name="us-east-1")
+            dynamodb.create_table(
+                TableName=shared_configuration.OAUTH_TOKEN_CACHE_TABLE,
+                KeySchema=[{"AttributeName": "token_key", "KeyType": "HASH"}],
+                AttributeDefinitions=[
+                    {"AttributeName": "token_key", "AttributeType": "S"}
+                ],
+                BillingMode="PAY_PER_REQUEST",
+            )
+            kms = boto3.client("kms", region_name="us-east-1")
+            key_id = kms.create_key()["KeyMetadata"]["KeyId"]
+            monkeypatch.setattr(
+                shared_configuration, "_shared_dynamodb_client", dynamodb
+            )
+            monkeypatch.setattr(shared_configuration, "_shared_kms_client", kms)
+
+            containers = [
+                shared_configuration.OAuthRefreshCoalescer(
+                    window_seconds=10,
+                    table_name=shared_configuration.OAUTH_TOKEN_CACHE_TABLE,
+                    kms_key_id=key_id,
+                )
+                for _ in range(2)
+            ]
+            exchange = _CountingExchange()
+            key = containers[0].cache_key(_REFRESH_BODY, "https://ha", "secret")
+            assert key is not None
+
+            first, _ = containers[0].execute(key, exchange, "test-1")
+            second, _ = containers[1].execute(key, exchange, "test-2")
+            stored = dynamodb.scan(
+                TableName=shared_configuration.OAUTH_TOKEN_CACHE_TABLE
+            )["Items"]
+
+        assert exchange.calls == 1
+        assert first == second
+        assert containers[1].get_stats()["shared_hits"] == 1
+        assert len(stored) == 1
+        assert b"token-1" not in stored[0]["token_data"]["B"]
+
+
+def _api_gateway_event(body: bytes) -> dict[str, Any]:
+    """Build an API Gateway proxy event shaped like an Alexa token request."""
+    headers = {f"X-Amzn-Trace-Header-{n}": "Root=1-" + "a" * 48 for n in range(20)}
+    headers.update(
+        {
+            "Content-Type": "application/x-www-form-urlencoded",
+            "Content-Length": str(len(body)),
+            "X-Forwarded-For": "203.0.113.10, 198.51.100.1",
+            "User-Agent": "Apache-HttpClient/UNAVAILABLE (Java/1.8.0_412)",
+        }
+    )
+    return {
+        "resource": "/auth/token",
+        "path": "/auth/token",
+        "httpMethod": "POST",
+        "headers": headers,
+        "multiValueHeaders": {key: [value] for key, value in headers.items()},
+        "requestContext": {
+            "accountId": "123456789012",
+            "requestId": "c6af9ac6-7b61-11e6-9a41-93e8deadbeef",
+            "identity": {"sourceIp": "203.0.113.10", "userAgent": "Alexa"},
+            "requestTimeEpoch": 1700000000000,
+        },
+        "body": base64.b64encode(body).decode("ascii"),
+        "isBase64Encoded": True,
+    }
+
+
+class TestRequestSizeValidation:
+    """Test request size checks that avoid re-serializing the event"""
+
+    _TOKEN_BODY = (
+        b"grant_type=refresh_token&refresh_token="
+        + b"r" * 200
+        + b"&client_id=https%3A%2F%2Fpitangui.amazon.com&client_secret=wrapper"
+    )
+
+    def test_base64_body_sized_without_decoding(self) -> None:
+        """Test that base64 bodies are sized exactly from their encoded length"""
+        for length in (1, 2, 3, 100, 101, 102):
+            event = {
+                "body": base64.b64encode(b"x" * length).decode(),
+                "isBase64Encoded": True,
+            }
+            assert (
+                shared_configuration.SecurityValidator.estimate_request_size(event)
+                == length
+            )
+
+    def test_declared_content_length_rejects_before_body(self) -> None:
+        """Test that an oversize Content-Length wins over a small body"""
+        event = {"headers": {"content-length": "999999"}, "body": "a=b"}
+        assert (
+            shared_configuration.SecurityValidator.estimate_request_size(event)
+            == 999999
+        )
+
+    def test_structured_body_estimate_is_bounded(self) -> None:
+        """Test that the fallback estimator stops just past the limit"""
+        event = {"body": {"items": ["x" * 100] * 10_000}}
+        size = shared_configuration.SecurityValidator.estimate_request_size(
+            event, limit=1000
+        )
+        assert 1000 < size < 1500
+
+    def test_oversize_oauth_request_is_rejected(self) -> None:
+        """Test that validate_oauth_request rejects an oversize body"""
+        validator = shared_configuration.OAuthSecurityValidator(
+            shared_configuration.RateLimiter(),
+            shared_configuration.SecurityValidator(),
+            shared_configuration.SecurityEventLogger(),
+        )
+        small = _api_gateway_event(self._TOKEN_BODY)
+        large = _api_gateway_event(
+            b"x" * (shared_configuration.SecurityConfig.MAX_REQUEST_SIZE_BYTES + 1)
+        )
+
+        assert validator.validate_oauth_request(small, "test-small")[0] is True
+        is_valid, error, _ = validator.validate_oauth_request(large, "test-large")
+        assert is_valid is False
+        assert error == "Request too large"
+
+    def test_size_check_never_serializes_the_event(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that sizing a realistic event never calls json.dumps"""
+        dumps_calls: list[Any] = []
+        real_dumps = shared_configuration.json.dumps
+
+        def counting_dumps(*args: Any, **kwargs: Any) -> str:
+            dumps_calls.append(args)
+            return real_dumps(*args, **kwargs)
+
+        monkeypatch.setattr(shared_configuration.json, "dumps", counting_dumps)
+        event = _api_gateway_event(self._TOKEN_BODY)
+
+        size = shared_configuration.SecurityValidator.estimate_request_size(event)
+
+        assert size == len(self._TOKEN_BODY)
+        assert not dumps_calls
+
+
+@pytest.fixture(name="json_log")
+def json_log_stream() -> Generator[tuple[logging.Logger, io.StringIO]]:
+    """Attach a JSON-formatted in-memory handler to a throwaway logger."""
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(shared_configuration.JsonLogFormatter())
+    logger = logging.getLogger(f"test.structured.{time.monotonic_ns()}")
+    logger.addHandler(handler)
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    yield logger, stream
+    logger.removeHandler(handler)
+
+
+def _json_lines(stream: io.StringIO) -> list[dict[str, Any]]:
+    """Parse each emitted log line as JSON."""
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+class TestStructuredLogging:
+    """Test JSON logging, lazy payloads, sampling and correlation IDs"""
+
+    def test_json_records_carry_correlation_and_payload(
+        self, json_log: tuple[logging.Logger, io.StringIO]
+    ) -> None:
+        """Test that adapter fields and payload land in one JSON object"""
+        logger, stream = json_log
+        request_logger = shared_configuration.bind_correlation_id(logger, "req-1")
+
+        shared_configuration.log_structured_event(
+            request_logger,
+            logging.INFO,
+            "oauth_success",
+            "Token issued for %s",
+            "alexa",
+            payload=lambda: {"client_ip": "203.0.113.10"},
+        )
+        request_logger.info("plain line", extra={"event_type": "custom"})
+
+        first, second = _json_lines(stream)
+        assert first["message"] == "Token issued for alexa"
+        assert first["correlation_id"] == "req-1"
+        assert first["event_type"] == "oauth_success"
+        assert first["payload"] == {"client_ip": "203.0.113.10"}
+        assert second["correlation_id"] == "req-1"
+        assert second["event_type"] == "custom"
+
+    def test_payload_not_built_for_disabled_level(
+        self, json_log: tuple[logging.Logger, io.StringIO]
+    ) -> None:
+        """Test that a filtered-out level never runs the payload builder"""
+        logger, stream = json_log
+        builds: list[int] = []
+
+        emitted = shared_configuration.log_structured_event(
+            logger,
+            logging.DEBUG,
+            "debug_event",
+            "debug",
+            payload=lambda: builds.append(1) or {},  # type: ignore[func-returns-value]
+        )
+
+        assert emitted is False
+        assert not builds
+        assert not stream.getvalue()
+
+    def test_routine_events_are_sampled(
+        self,
+        json_log: tuple[logging.Logger, io.StringIO],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that 1 in N routine events is written and warnings never sampled"""
+        logger, stream = json_log
+        sampler = shared_configuration.LogSampler(
+            shared_configuration.LogSampler.parse_rates("request_validated=5,bad")
+        )
+        monkeypatch.setattr(shared_configuration, "_log_sampler", sampler)
+
+        for _ in range(10):
+            shared_configuration.log_structured_event(
+                logger, logging.INFO, "request_validated", "validated"
+            )
+        shared_configuration.log_structured_event(
+            logger, logging.WARNING, "request_validated", "odd validation"
+        )
+
+        lines = _json_lines(stream)
+        assert len(lines) == 3
+        assert [line.get("sample_rate") for line in lines] == [5, 5, None]
+        assert sampler.get_stats()["suppressed"] == 8
+
+    def test_security_events_skip_work_when_info_disabled(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a disabled security event never serializes its payload"""
+        dumps_calls: list[Any] = []
+        real_dumps = shared_configuration.json.dumps
+
+        def counting_dumps(*args: Any, **kwargs: Any) -> str:
+            dumps_calls.append(args)
+            return real_dumps(*args, **kwargs)
+
+        monkeypatch.setattr(shared_configuration.json, "dumps", counting_dumps)
+        # pylint: disable=protected-access
+        shared_logger = shared_configuration._shared_logger
+        original_level = shared_logger.level
+        shared_logger.setLevel(logging.ERROR)
+        try:
+            shared_configuration.SecurityEventLogger.log_security_event(
+                "oauth_success", "203.0.113.10", "details"
+            )
+        finally:
+            shared_logger.setLevel(original_level)
+
+        assert not dumps_calls
+
+
+class TestLatencyHistograms:
+    """Test fixed-memory latency percentiles and EMF export"""
+
+    def test_percentiles_are_within_bucket_error(self) -> None:
+        """Test that p50/p90/p99 track the exact values within ~5%"""
+        histogram = shared_configuration.LatencyHistogram()
+        samples = [float(value) for value in range(1, 1001)]
+        for sample in samples:
+            histogram.record(sample)
+
+        for percentile, exact in ((50, 500.0), (90, 900.0), (99, 990.0)):
+            estimate = histogram.percentile(percentile)
+            assert estimate is not None
+            assert abs(estimate - exact) / exact < 0.05
+        assert histogram.summary()["min_ms"] == 1.0
+        assert histogram.summary()["max_ms"] == 1000.0
+
+    def test_memory_does_not_grow_with_samples(self) -> None:
+        """Test that recording many durations keeps a fixed bucket count"""
+        monitor = shared_configuration.PerformanceMonitor(emit=lambda _line: None)
+        for index in range(20000):
+            monitor.record_duration("ha_request", (index % 500) / 1000)
+
+        # pylint: disable=protected-access
+        histogram = monitor._histograms["ha_request"]
+        assert (
+            len(histogram._counts) == shared_configuration.LatencyHistogram.BUCKET_COUNT
+        )
+        stats = monitor.get_performance_stats()
+        assert stats["ha_request_count"] == 20000
+        assert stats["ha_request_p50_ms"] < stats["ha_request_p99_ms"]
+
+    def test_flush_writes_emf_lines_per_interval(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that due flushes emit EMF lines and reset interval percentiles"""
+        emitted: list[str] = []
+        monkeypatch.setattr(shared_configuration, "METRICS_FLUSH_INTERVAL_SECONDS", 60)
+        monitor = shared_configuration.PerformanceMonitor(
+            service_name="smart_home_bridge", emit=emitted.append
+        )
+        monitor.record_duration("total_request", 0.120)
+        assert not emitted
+
+        # pylint: disable=protected-access
+        monitor._next_flush = 0.0
+        monitor.record_duration("total_request", 0.080)
+
+        assert len(emitted) == 1
+        document = json.loads(emitted[0])
+        directive = document["_aws"]["CloudWatchMetrics"][0]
+        assert directive["Namespace"] == shared_configuration.METRICS_NAMESPACE
+        assert directive["Dimensions"] == [["Service", "Operation"]]
+        assert {metric["Name"] for metric in directive["Metrics"]} >= {
+            "LatencyP50",
+            "LatencyP99",
+        }
+        assert document["Service"] == "smart_home_bridge"
+        assert document["Operation"] == "total_request"
+        assert document["Count"] == 2
+        assert document["LatencyMax"] == pytest.approx(120.0)
+
+        # The interval restarts; lifetime stats keep both samples
+        assert monitor.flush_metrics() == 0
+        assert monitor.get_performance_stats()["total_request_count"] == 2
+
+    def test_due_interval_flushes_when_invocation_ends(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a handler invocation flushes without waiting for a sample"""
+        from custom_components.ha_external_connector.integrations.alexa.lambda_functions import (  # noqa: E501 pylint: disable=import-outside-toplevel
+            smart_home_bridge,
+        )
+
+        emitted: list[str] = []
+        monitor = shared_configuration.PerformanceMonitor(
+            service_name="smart_home_bridge", emit=emitted.append
+        )
+        monitor.record_duration("total_request", 0.120)
+        monkeypatch.setattr(smart_home_bridge, "_performance_optimizer", monitor)
+
+        smart_home_bridge.lambda_handler({"warmup": True}, None)
+        assert not emitted
+
+        # pylint: disable=protected-access
+        monitor._next_flush = 0.0
+        smart_home_bridge.lambda_handler({"warmup": True}, None)
+
+        assert [json.loads(line)["Count"] for line in emitted] == [1]
+
+
+class _CollectorHandler(BaseHTTPRequestHandler):
+    """OTLP/HTTP collector stand-in that keeps every posted JSON document."""
+
+    protocol_version = "HTTP/1.1"
+    received: list[dict[str, Any]] = []
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Store the posted document and acknowledge it."""
+        length = int(self.headers.get("Content-Length", "0"))
+        self.received.append(json.loads(self.rfile.read(length)))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args: Any) -> None:  # pylint: disable=arguments-differ
+        """Silence request logging during tests."""
+
+
+class TestSpanTracing:
+    """Test nested high-resolution spans and OTLP export"""
+
+    def test_config_load_records_cache_tier_spans(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that config_load nests shared_cache and ssm child spans"""
+        tracer = shared_configuration.SpanTracer(export_endpoint="")
+        monkeypatch.setattr(shared_configuration, "_tracer", tracer)
+        with mock_aws():
+            dynamodb = _create_shared_cache_table(monkeypatch)
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            ssm.put_parameter(
+                Name="/test/alexa/ha_config",
+                Value=json.dumps({"base_url": "https://ha.example.com"}),
+                Type="SecureString",
+            )
+            manager = _new_config_manager(ssm, dynamodb)
+
+            with shared_configuration.trace_span("request") as root:
+                manager.load_configuration("ha_config", "/test/alexa/")
+                manager.load_configuration("ha_config", "/test/alexa/")
+
+        spans = tracer.get_trace(root.trace_id)
+        by_id = {span.span_id: span for span in spans}
+        parents = {
+            span.name: by_id[span.parent_span_id].name
+            for span in spans
+            if span.parent_span_id in by_id
+        }
+        assert parents["config_load"] == "request"
+        assert parents["shared_cache"] == "config_load"
+        assert parents["ssm"] == "config_load"
+        config_loads = [span for span in spans if span.name == "config_load"]
+        assert config_loads[-1].attributes["cache_tier"] == "container"
+        assert all(span.end_ns is not None for span in spans)
+        assert all(span.duration_ms >= 0 for span in spans)
+
+    def test_failed_block_marks_span_as_error(self) -> None:
+        """Test that an exception inside a span is recorded and re-raised"""
+        tracer = shared_configuration.SpanTracer(export_endpoint="")
+
+        with pytest.raises(ValueError), tracer.span("ha_request"):
+            raise ValueError("boom")
+
+        assert tracer.current_span() is None
+        assert tracer.get_stats()["traces"] == 1
+        (span,) = list(tracer._finished)  # pylint: disable=protected-access
+        assert span.error is True
+
+    def test_root_span_exports_otlp_trace(self) -> None:
+        """Test that a finished trace is posted to the collector stand-in"""
+        _CollectorHandler.received = []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _CollectorHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            endpoint = f"http://127.0.0.1:{server.server_port}/v1/traces"
+            tracer = shared_configuration.SpanTracer(
+                export_endpoint=endpoint, service_name="smart_home_bridge"
+            )
+            with (
+                tracer.span("smart_home_bridge", correlation_id="abc"),
+                tracer.span("ha_request", status=200),
+            ):
+                pass
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert tracer.get_stats()["exported"] == 1
+        (document,) = _CollectorHandler.received
+        resource_spans = document["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"][0]["value"] == {
+            "stringValue": "smart_home_bridge"
+        }
+        spans = {s["name"]: s for s in resource_spans["scopeSpans"][0]["spans"]}
+        assert (
+            spans["ha_request"]["parentSpanId"] == spans["smart_home_bridge"]["spanId"]
+        )
+        assert "parentSpanId" not in spans["smart_home_bridge"]
+        assert int(spans["ha_request"]["startTimeUnixNano"]) > 0
+        assert spans["ha_request"]["attributes"] == [
+            {"key": "status", "value": {"intValue": "200"}}
+        ]
+
+    def test_export_failure_does_not_raise(self) -> None:
+        """Test that an unreachable collector only counts a failed export"""
+        tracer = shared_configuration.SpanTracer(
+            export_endpoint=f"{_unused_local_url()}/v1/traces"
+        )
+
+        with tracer.span("smart_home_bridge"):
+            pass
+
+        assert tracer.get_stats()["export_failures"] == 1
+
+
+class TestRequestBatcher:
+    """Test concurrent fan-out of batched Home Assistant requests"""
+
+    def test_batch_runs_concurrently_and_keeps_order(self) -> None:
+        """Test that N calls are in flight together and results keep order"""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+        # Every call waits until all four are running at once
+        all_running = threading.Barrier(4)
+
+        def slow_call(request_data: dict[str, Any]) -> dict[str, Any]:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            all_running.wait(timeout=5)
+            with lock:
+                active -= 1
+            return {"entity": request_data["data"]["entity_id"]}
+
+        batcher = shared_configuration.RequestBatcher(
+            max_batch_size=8, max_workers=4, request_executor=slow_call
+        )
+        requests = [
+            {
+                "endpoint": "/api/services/light/turn_on",
+                "method": "POST",
+                "data": {"entity_id": f"light.{index}"},
+            }
+            for index in range(4)
+        ]
+
+        results = batcher.execute(requests)
+
+        assert [result["response"]["entity"] for result in results] == [
+            f"light.{index}" for index in range(4)
+        ]
+        assert peak == 4
+
+    def test_identical_gets_are_sent_once(self) -> None:
+        """Test that duplicate GETs share a single call and response"""
+        calls: list[str] = []
+
+        def record(request_data: dict[str, Any]) -> dict[str, Any]:
+            calls.append(request_data["endpoint"])
+            return {"state": "on", "attributes": {"brightness": 255}}
+
+        batcher = shared_configuration.RequestBatcher(request_executor=record)
+        results = batcher.execute(
+            [
+                {"endpoint": "/api/states/light.kitchen"},
+                {"endpoint": "/api/states/light.kitchen", "method": "get"},
+                {"endpoint": "/api/states/light.hall"},
+                {"endpoint": "/api/services/light/toggle", "method": "POST"},
+                {"endpoint": "/api/services/light/toggle", "method": "POST"},
+            ]
+        )
+
+        assert sorted(calls) == sorted(
+            [
+                "/api/states/light.kitchen",
+                "/api/states/light.hall",
+                "/api/services/light/toggle",
+                "/api/services/light/toggle",
+            ]
+        )
+        assert [result["deduplicated"] for result in results] == [
+            False,
+            True,
+            False,
+            False,
+            False,
+        ]
+        results[0]["response"]["state"] = "mutated"
+        results[0]["response"]["attributes"]["brightness"] = 0
+        assert results[1]["response"] == {
+            "state": "on",
+            "attributes": {"brightness": 255},
+        }
+        assert batcher.get_batch_stats()["deduplicated_requests"] == 1
+
+    def test_failures_are_isolated_per_request(self) -> None:
+        """Test that one failing call does not fail its batch"""
+
+        def flaky(request_data: dict[str, Any]) -> dict[str, Any]:
+            if request_data["endpoint"].endswith("broken"):
+                raise ValueError("HTTP 500: boom")
+            return {"ok": True}
+
+        batcher = shared_configuration.RequestBatcher(request_executor=flaky)
+        results = batcher.execute(
+            [{"endpoint": "/api/states/broken"}, {"endpoint": "/api/states/fine"}]
+        )
+
+        assert [result["success"] for result in results] == [False, True]
+        assert results[0]["error"] == "HTTP 500: boom"
+        assert results[0]["response"] is None
+        assert batcher.get_batch_stats()["failed_requests"] == 1
+
+    def test_batches_respect_size_and_wait_time(self) -> None:
+        """Test that batches are capped at max_batch_size and flush on wait"""
+        batcher = shared_configuration.RequestBatcher(
+            max_batch_size=2, max_wait_time=0.05, request_executor=lambda r: {}
+        )
+        batcher.add_request({"endpoint": "/api/states/a"})
+        assert not batcher.should_process_batch()
+        time.sleep(0.06)
+        assert batcher.should_process_batch()
+
+        batcher.add_request({"endpoint": "/api/states/b"})
+        batcher.add_request({"endpoint": "/api/states/c"})
+        assert len(batcher.process_batch()) == 2
+        assert len(batcher.process_batch()) == 1
+        assert batcher.process_batch() == []
+        assert batcher.get_batch_stats()["batches_processed"] == 2
+
+    def test_batch_uses_shared_pool_against_stand_in(self, stand_in_url: str) -> None:
+        """Test that batched calls run through the retry handler and pool"""
+        handler = shared_configuration.create_home_assistant_retry_handler(
+            base_url=stand_in_url, token="test-token"
+        )
+        batcher = shared_configuration.RequestBatcher(retry_handler=handler)
+
+        results = batcher.execute(
+            [
+                {"endpoint": f"/api/services/scene/{index}", "method": "POST"}
+                for index in range(3)
+            ]
+        )
+
+        assert all(result["success"] for result in results)
+        assert [result["response"]["path"] for result in results] == [
+            f"/api/services/scene/{index}" for index in range(3)
+        ]
+        pool = shared_configuration.get_connection_pool(stand_in_url)
+        assert pool.get_connection_stats()["requests"] == 3
+
+
+class TestLazyAwsClients:
+    """Test that boto3 stays off the cold-start import path"""
+
+    def test_importing_lambdas_does_not_import_boto3(self, tmp_path: Path) -> None:
+        """Test that the built bridge and gateway import without loading boto3"""
+        # Build the deployed lambda_function.py files: importing through the
+        # custom_components package would also run its integration imports
+        scripts_dir = Path(__file__).resolve().parents[2] / (
+            "development/scripts/lambda_deployment"
+        )
+        sys.path.insert(0, str(scripts_dir))
+        try:
+            # pylint: disable-next=import-outside-toplevel,import-error
+            from deployment_manager import DeploymentManager
+        finally:
+            sys.path.remove(str(scripts_dir))
+
+        manager = DeploymentManager(
+            str(tmp_path), logger=logging.getLogger("test.deployment")
+        )
+        manager.config.source_dir = Path(shared_configuration.__file__).parent
+        manager.config.deployment_dir = tmp_path
+        assert manager.build_deployment()
+
+        for function in ("smart_home_bridge", "cloudflare_security_gateway"):
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    "-c",
+                    "import sys, lambda_function; print('boto3' in sys.modules)",
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=tmp_path / function,
+                env={**os.environ, "AWS_DEFAULT_REGION": "us-east-1"},
+            )
+
+            assert result.stdout.strip() == "False", function
+
+    def test_clients_are_created_on_first_use(self) -> None:
+        """Test that create_aws_client builds a client for the configured region"""
+        with mock_aws():
+            client = shared_configuration.create_aws_client("ssm")
+
+        assert client.meta.service_model.service_name == "ssm"
+        assert client.meta.region_name == os.environ.get("AWS_REGION", "us-east-1")
+
+
+class TestDirectiveParser:
+    """Test the single-pass directive parser and its consumers"""
+
+    def test_power_controller_directive_is_parsed_in_one_pass(self) -> None:
+        """Test that header, endpoint and token come from one parse"""
+        event = _directive("Alexa.PowerController", "TurnOn")
+
+        parsed = shared_configuration.parse_directive(event)
+
+        assert parsed.directive is event["directive"]
+        assert (parsed.namespace, parsed.name) == ("Alexa.PowerController", "TurnOn")
+        assert parsed.endpoint_id == "light-1"
+        assert parsed.token == "token-a"
+        assert parsed.token_source == "endpoint.scope"
+        assert parsed.correlation_token == (
+            event["directive"]["header"]["correlationToken"]
+        )
+        assert parsed.error is None and parsed.scope_error is None
+        assert not parsed.is_cacheable
+        assert not hasattr(parsed, "__dict__")
+
+    def test_discovery_and_accept_grant_use_payload_tokens(self) -> None:
+        """Test the namespace fast paths for payload scope and grantee tokens"""
+        discovery = shared_configuration.parse_directive(
+            {
+                "directive": {
+                    "header": {
+                        "namespace": "Alexa.Discovery",
+                        "name": "Discover",
+                        "payloadVersion": "3",
+                    },
+                    "payload": {"scope": {"type": "BearerToken", "token": "disc"}},
+                }
+            }
+        )
+        accept_grant = shared_configuration.parse_directive(
+            {
+                "directive": {
+                    "header": {
+                        "namespace": "Alexa.Authorization",
+                        "name": "AcceptGrant",
+                        "payloadVersion": "3",
+                    },
+                    "payload": {
+                        "grant": {"type": "OAuth2.AuthorizationCode", "code": "c"},
+                        "grantee": {"type": "BearerToken", "token": "grantee"},
+                    },
+                }
+            }
+        )
+
+        assert (discovery.token, discovery.token_source) == ("disc", "payload.scope")
+        assert discovery.cache_ttl == shared_configuration.DISCOVERY_CACHE_TTL
+        assert (accept_grant.token, accept_grant.token_source) == (
+            "grantee",
+            "payload.grantee",
+        )
+
+    def test_validator_reports_parse_errors(self) -> None:
+        """Test that validation failures keep their Alexa error types"""
+        validator = shared_configuration.AlexaValidator
+        old_version = _directive("Alexa", "ReportState")
+        old_version["directive"]["header"]["payloadVersion"] = "2"
+        wrong_scope = _directive("Alexa", "ReportState")
+        wrong_scope["directive"]["endpoint"]["scope"]["type"] = "Basic"
+
+        _, missing = validator.validate_directive({})
+        _, version_error = validator.validate_directive(old_version)
+        _, scope_error = validator.extract_auth_token(wrong_scope["directive"], {})
+
+        assert missing is not None and version_error is not None
+        assert missing["event"]["payload"]["type"] == "INVALID_DIRECTIVE"
+        assert version_error["event"]["payload"]["message"] == (
+            "Only support payloadVersion == 3"
+        )
+        assert scope_error is not None
+        assert scope_error["event"]["payload"] == {
+            "type": "INVALID_AUTHORIZATION_CREDENTIAL",
+            "message": "Only support BearerToken",
+        }
+
+    def test_token_extraction_never_logs_token_contents(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that only the token's source and length reach the logs"""
+        event = _directive("Alexa", "ReportState", token="secret-token-value")
+
+        with caplog.at_level(logging.DEBUG):
+            token, error = shared_configuration.AlexaValidator.extract_auth_token(
+                event["directive"], {}
+            )
+
+        assert (token, error) == ("secret-token-value", None)
+        assert "secret-tok" not in caplog.text
+
+    def test_parsed_record_is_reused_by_cache_keys(self) -> None:
+        """Test that cache keys from a parsed record match event-based keys"""
+        event = _directive("Alexa", "ReportState")
+        parsed = shared_configuration.parse_directive(event)
+
+        assert shared_configuration.build_directive_cache_key(
+            event, parsed
+        ) == shared_configuration.build_directive_cache_key(event)
+        assert shared_configuration.build_report_state_cache_key(
+            event, parsed
+        ) == shared_configuration.build_report_state_cache_key(event)
+
+
+def _bind_warmer_clients(
+    monkeypatch: pytest.MonkeyPatch, ssm: Any, dynamodb: Any
+) -> Any:
+    """Route the configuration manager's container clients to moto clients."""
+    from custom_components.ha_external_connector.integrations.alexa.lambda_functions import (  # noqa: E501 pylint: disable=import-outside-toplevel
+        configuration_manager,
+    )
+
+    monkeypatch.setattr(configuration_manager, "_config_ssm_client", ssm)
+    monkeypatch.setattr(configuration_manager, "_manager_dynamodb_client", dynamodb)
+    monkeypatch.setattr(
+        configuration_manager,
+        "_missing_ssm_paths",
+        shared_configuration.NegativeCache(),
+    )
+    return configuration_manager
+
+
+class TestSharedCacheSchema:
+    """Test the versioned shared-cache schema shared by warmer and Lambdas"""
+
+    GEN_3 = shared_configuration.ConfigurationGeneration.GEN_3_MODULAR_SSM
+
+    def test_item_round_trip_and_version_guard(self) -> None:
+        """Test that items decode under their schema and expire on TTL"""
+        item = shared_configuration.encode_shared_cache_item(
+            "/test/alexa/", "ha_config", {"base_url": "https://ha"}, writer="test"
+        )
+        newer = {**item, "schema_version": {"N": "99"}}
+        expired = {**item, "ttl": {"N": str(int(time.time()) - 1)}}
+
+        assert item["cache_key"]["S"] == "config:v1:/test/alexa:ha_config"
+        assert shared_configuration.shared_cache_key("/test/alexa", "ha_config") == (
+            item["cache_key"]["S"]
+        )
+        assert shared_configuration.decode_shared_cache_item(item, "ha_config") == {
+            "base_url": "https://ha"
+        }
+        assert shared_configuration.decode_shared_cache_item(newer, "ha_config") is None
+        assert (
+            shared_configuration.decode_shared_cache_item(expired, "ha_config") is None
+        )
+
+    def test_warmed_rows_serve_lambda_cold_start(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that rows written by the warmer are read without touching SSM"""
+        with mock_aws():
+            dynamodb = _create_shared_cache_table(monkeypatch)
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            configuration_manager = _bind_warmer_clients(monkeypatch, ssm, dynamodb)
+            for section in ("ha_config", "cloudflare_config"):
+                ssm.put_parameter(
+                    Name=f"/home-assistant/test/{section}",
+                    Value=json.dumps({"base_url": "https://ha.example.com"}),
+                    Type="SecureString",
+                )
+
+            warmed = configuration_manager.warm_configuration(
+                "alexa_bridge_config", "/home-assistant/test", "bridge config"
+            )
+            manager = _new_config_manager(ssm, dynamodb)
+            ssm_calls = _count_aws_calls(ssm)
+            dynamodb_calls = _count_aws_calls(dynamodb)
+            configs, _ = manager.load_sections(
+                ["ha_config", "cloudflare_config"], "/home-assistant/test/", self.GEN_3
+            )
+
+        assert warmed
+        assert configs["ha_config"]["base_url"] == "https://ha.example.com"
+        assert not ssm_calls
+        assert dynamodb_calls == {"BatchGetItem": 1}
+        assert manager.get_stats()["shared_cache"]["hit_rate"] == 1.0
+
+    def test_legacy_rows_are_read_and_migrated(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that pre-versioned rows are served once, then rewritten"""
+        with mock_aws():
+            dynamodb = _create_shared_cache_table(monkeypatch)
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            expires = str(int(time.time()) + 600)
+            dynamodb.put_item(
+                TableName=shared_configuration.SHARED_CACHE_TABLE,
+                Item={
+                    "cache_key": {"S": "/test/alexa/:ha_config"},
+                    "config": {"S": json.dumps({"base_url": "https://legacy"})},
+                    "ttl": {"N": expires},
+                },
+            )
+            dynamodb.put_item(
+                TableName=shared_configuration.SHARED_CACHE_TABLE,
+                Item={
+                    "cache_key": {"S": "alexa_bridge_config"},
+                    "config_data": {
+                        "S": json.dumps({"oauth_config": {"client_id": "warm"}})
+                    },
+                    "ttl": {"N": expires},
+                },
+            )
+            monkeypatch.setattr(
+                shared_configuration,
+                "_LEGACY_WARMER_CACHE_KEYS",
+                {"/test/alexa": "alexa_bridge_config"},
+            )
+
+            first = _new_config_manager(ssm, dynamodb)
+            configs, _ = first.load_sections(
+                ["ha_config", "oauth_config"], "/test/alexa/", self.GEN_3
+            )
+            migrated = dynamodb.get_item(
+                TableName=shared_configuration.SHARED_CACHE_TABLE,
+                Key={"cache_key": {"S": "config:v1:/test/alexa:ha_config"}},
+            )
+
+        assert configs["ha_config"]["base_url"] == "https://legacy"
+        assert configs["oauth_config"]["client_id"] == "warm"
+        assert migrated["Item"]["schema_version"]["N"] == "1"
+        stats = first.get_shared_cache_stats()
+        assert (stats["legacy_hits"], stats["rows_migrated"]) == (2, 2)
+
+    def test_lookups_emit_hit_rate_metric(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that each shared cache lookup writes an EMF hit/miss line"""
+        with mock_aws():
+            dynamodb = _create_shared_cache_table(monkeypatch)
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            manager = _new_config_manager(ssm, dynamodb)
+            emitted: list[str] = []
+            manager._emit_metric = emitted.append  # pylint: disable=protected-access
+
+            manager.load_sections(["ha_config"], "/test/alexa/", self.GEN_3)
+
+        document = json.loads(emitted[0])
+        assert document["SharedCacheHits"] == 0
+        assert document["SharedCacheMisses"] == 1
+        assert manager.get_shared_cache_stats()["hit_rate"] == 0.0
+
+
+class TestConfigSnapshotEpoch:
+    """Test epoch-invalidated configuration snapshots"""
+
+    GEN_3 = shared_configuration.ConfigurationGeneration.GEN_3_MODULAR_SSM
+    PATH = "/home-assistant/epoch"
+
+    @staticmethod
+    def _put_config(ssm: Any, base_url: str, overwrite: bool = False) -> None:
+        """Write the ha_config parameter the warmer snapshots."""
+        ssm.put_parameter(
+            Name=f"{TestConfigSnapshotEpoch.PATH}/ha_config",
+            Value=json.dumps({"base_url": base_url}),
+            Type="SecureString",
+            Overwrite=overwrite,
+        )
+
+    @staticmethod
+    def _epoch_item(dynamodb: Any) -> dict[str, Any]:
+        """Read the config epoch item written by the warmer."""
+        return dynamodb.get_item(
+            TableName=shared_configuration.SHARED_CACHE_TABLE,
+            Key={"cache_key": {"S": shared_configuration.CONFIG_EPOCH_KEY}},
+        )["Item"]
+
+    def test_warmer_advances_epoch_only_on_ssm_change(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that reruns only heartbeat and a parameter write moves the epoch"""
+        with mock_aws():
+            dynamodb = _create_shared_cache_table(monkeypatch)
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            configuration_manager = _bind_warmer_clients(monkeypatch, ssm, dynamodb)
+            self._put_config(ssm, "https://first")
+
+            epochs = []
+            for base_url in (None, None, "https://second"):
+                if base_url:
+                    self._put_config(ssm, base_url, overwrite=True)
+                configuration_manager.warm_configuration(
+                    "alexa_bridge_config", self.PATH, "bridge config"
+                )
+                epochs.append(self._epoch_item(dynamodb)["epoch"]["N"])
+            row = dynamodb.get_item(
+                TableName=shared_configuration.SHARED_CACHE_TABLE,
+                Key={"cache_key": {"S": f"config:v1:{self.PATH}:ha_config"}},
+            )["Item"]
+
+        assert epochs == ["1", "1", "2"]
+        assert row["ssm_version"]["N"] == "2"
+        assert json.loads(row["config"]["S"])["base_url"] == "https://second"
+
+    def test_reader_keeps_snapshot_until_epoch_moves(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that snapshots outlive the TTL and reload when the epoch moves"""
+        monkeypatch.setattr(shared_configuration, "CONFIG_EPOCH_CHECK_INTERVAL", 0.0)
+        with mock_aws():
+            dynamodb = _create_shared_cache_table(monkeypatch)
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            configuration_manager = _bind_warmer_clients(monkeypatch, ssm, dynamodb)
+            self._put_config(ssm, "https://first")
+            configuration_manager.warm_configuration(
+                "alexa_bridge_config", self.PATH, "bridge config"
+            )
+
+            manager = _new_config_manager(ssm, dynamodb)
+            manager._cache_ttl = 0  # pylint: disable=protected-access
+            manager.load_sections(["ha_config"], f"{self.PATH}/", self.GEN_3)
+            version = manager.configuration_version
+            dynamodb_calls = _count_aws_calls(dynamodb)
+            unchanged, _ = manager.load_sections(
+                ["ha_config"], f"{self.PATH}/", self.GEN_3
+            )
+            calls_while_unchanged = dict(dynamodb_calls)
+
+            self._put_config(ssm, "https://second", overwrite=True)
+            configuration_manager.warm_configuration(
+                "alexa_bridge_config", self.PATH, "bridge config"
+            )
+            reloaded, _ = manager.load_sections(
+                ["ha_config"], f"{self.PATH}/", self.GEN_3
+            )
+            reloaded_version = manager.configuration_version
+
+        assert unchanged["ha_config"]["base_url"] == "https://first"
+        assert calls_while_unchanged == {"GetItem": 1}
+        assert reloaded["ha_config"]["base_url"] == "https://second"
+        assert reloaded_version > version
+        assert manager.get_stats()["config_epoch"]["epoch"] == 2
+
+    def test_stale_heartbeat_falls_back_to_ttl(self) -> None:
+        """Test that an epoch not stamped within the max age is ignored"""
+        now = int(time.time())
+        fresh = {"epoch": {"N": "3"}, "checked_at": {"N": str(now)}}
+        stale = {
+            "epoch": {"N": "3"},
+            "checked_at": {
+                "N": str(now - shared_configuration.CONFIG_EPOCH_MAX_AGE - 1)
+            },
+        }
+
+        assert shared_configuration.decode_config_epoch(fresh) == 3
+        assert shared_configuration.decode_config_epoch(stale) is None
+        assert shared_configuration.decode_config_epoch(None) is None
+
+    def test_stale_heartbeat_ages_snapshot_rows_by_written_at(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that without a valid epoch rows older than the TTL miss"""
+        with mock_aws():
+            dynamodb = _create_shared_cache_table(monkeypatch)
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            configuration_manager = _bind_warmer_clients(monkeypatch, ssm, dynamodb)
+            self._put_config(ssm, "https://first")
+            configuration_manager.warm_configuration(
+                "alexa_bridge_config", self.PATH, "bridge config"
+            )
+            # The warmer stopped: SSM moved on, the row and heartbeat aged
+            self._put_config(ssm, "https://second", overwrite=True)
+            written_at = int(time.time()) - shared_configuration.SHARED_CACHE_TTL - 1
+            dynamodb.update_item(
+                TableName=shared_configuration.SHARED_CACHE_TABLE,
+                Key={"cache_key": {"S": f"config:v1:{self.PATH}:ha_config"}},
+                UpdateExpression="SET written_at = :w",
+                ExpressionAttributeValues={":w": {"N": str(written_at)}},
+            )
+            row = dynamodb.get_item(
+                TableName=shared_configuration.SHARED_CACHE_TABLE,
+                Key={"cache_key": {"S": f"config:v1:{self.PATH}:ha_config"}},
+            )["Item"]
+            checked_at = int(time.time()) - shared_configuration.CONFIG_EPOCH_MAX_AGE
+            dynamodb.update_item(
+                TableName=shared_configuration.SHARED_CACHE_TABLE,
+                Key={"cache_key": {"S": shared_configuration.CONFIG_EPOCH_KEY}},
+                UpdateExpression="SET checked_at = :c",
+                ExpressionAttributeValues={":c": {"N": str(checked_at - 1)}},
+            )
+
+            manager = _new_config_manager(ssm, dynamodb)
+            loaded, _ = manager.load_sections(
+                ["ha_config"], f"{self.PATH}/", self.GEN_3
+            )
+
+        assert loaded["ha_config"]["base_url"] == "https://second"
+        assert manager.get_stats()["config_epoch"]["epoch"] is None
+        # The same row is still served while an epoch vouches for it
+        assert shared_configuration.decode_shared_cache_item(row, "ha_config") == {
+            "base_url": "https://first"
+        }
+
+
+class TestBatchWarmingPipeline:
+    """Test the configuration manager's batched warming pass"""
+
+    CONFIGS = [
+        {
+            "cache_key": "alexa_bridge_config",
+            "ssm_path": "/home-assistant/alexa",
+            "description": "bridge config",
+        },
+        {
+            "cache_key": "oauth_config",
+            "ssm_path": "/home-assistant/oauth",
+            "description": "gateway config",
+        },
+        {
+            "cache_key": "aws_runtime_config",
+            "ssm_path": "/home-assistant/aws/runtime",
+            "description": "runtime config",
+        },
+    ]
+
+    def test_one_batched_pass_per_run(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a run costs one batch read and writes only stale rows"""
+        with mock_aws():
+            dynamodb = _create_shared_cache_table(monkeypatch)
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            configuration_manager = _bind_warmer_clients(monkeypatch, ssm, dynamodb)
+            for path in ("/home-assistant/alexa", "/home-assistant/oauth"):
+                for section in ("ha_config", "cloudflare_config"):
+                    ssm.put_parameter(
+                        Name=f"{path}/{section}",
+                        Value=json.dumps({"base_url": "https://ha"}),
+                        Type="SecureString",
+                    )
+
+            ssm_calls = _count_aws_calls(ssm)
+            dynamodb_calls = _count_aws_calls(dynamodb)
+            first = configuration_manager.warm_configurations(self.CONFIGS)
+            first_calls = dict(dynamodb_calls)
+            dynamodb_calls.clear()
+            configuration_manager.warm_configurations(self.CONFIGS)
+
+        assert all(first.values())
+        # The empty runtime path is remembered, so the second run skips it
+        assert ssm_calls == {"GetParametersByPath": 5}
+        assert first_calls == {
+            "DescribeTable": 1,
+            "BatchGetItem": 1,
+            "BatchWriteItem": 1,
+            "UpdateItem": 1,
+        }
+        assert dynamodb_calls == {
+            "DescribeTable": 1,
+            "BatchGetItem": 1,
+            "UpdateItem": 1,
+        }
+
+    def test_invalid_path_fails_only_its_config(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that path validation is applied per configuration"""
+        with mock_aws():
+            dynamodb = _create_shared_cache_table(monkeypatch)
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            configuration_manager = _bind_warmer_clients(monkeypatch, ssm, dynamodb)
+            outcomes = configuration_manager.warm_configurations(
+                [
+                    *self.CONFIGS[:1],
+                    {
+                        "cache_key": "bad",
+                        "ssm_path": "/etc/passwd",
+                        "description": "invalid",
+                    },
+                ]
+            )
+
+        assert outcomes == {"alexa_bridge_config": True, "bad": False}
+
+
+class _FakeWarmLambdaClient:
+    """Lambda client stand-in answering warm invocations from new containers."""
+
+    def __init__(self, provisioned: dict[str, int] | None = None) -> None:
+        self.invocations: list[dict[str, Any]] = []
+        self._provisioned = provisioned or {}
+        self._lock = threading.Lock()
+
+    def invoke(self, **kwargs: Any) -> dict[str, Any]:
+        """Record the invocation and answer like a freshly warmed container."""
+        with self._lock:
+            self.invocations.append(kwargs)
+            container_id = f"container-{len(self.invocations)}"
+        body = json.dumps({"status": "warm", "container_id": container_id})
+        return {"Payload": io.BytesIO(json.dumps({"body": body}).encode())}
+
+    def get_provisioned_concurrency_config(self, **kwargs: Any) -> dict[str, Any]:
+        """Report provisioned concurrency configured for a qualified target."""
+        allocated = self._provisioned.get(kwargs["Qualifier"], 0)
+        return {
+            "Status": "READY",
+            "AllocatedProvisionedConcurrentExecutions": allocated,
+        }
+
+
+class TestContainerWarmingFanOut:
+    """Test concurrent container warming from the configuration manager"""
+
+    GATEWAY_ARN = "arn:aws:lambda:us-east-1:123456789012:function:gateway"
+    BRIDGE_ARN = "arn:aws:lambda:us-east-1:123456789012:function:bridge:live"
+
+    def _warm(
+        self, monkeypatch: pytest.MonkeyPatch, client: _FakeWarmLambdaClient
+    ) -> dict[str, Any]:
+        """Run container warming against the fake client."""
+        from custom_components.ha_external_connector.integrations.alexa.lambda_functions import (  # noqa: E501 pylint: disable=import-outside-toplevel
+            configuration_manager,
+        )
+
+        monkeypatch.setenv("CLOUDFLARE_SECURITY_GATEWAY_FUNCTION_ARN", self.GATEWAY_ARN)
+        monkeypatch.setenv("SMART_HOME_BRIDGE_FUNCTION_ARN", self.BRIDGE_ARN)
+        monkeypatch.setattr(configuration_manager, "_manager_lambda_client", client)
+        results: dict[str, Any] = {"errors": []}
+        configuration_manager._warm_lambda_containers(  # pylint: disable=protected-access
+            results
+        )
+        return results
+
+    def test_fan_out_reaches_distinct_containers(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that N held synchronous invocations report full coverage"""
+        from custom_components.ha_external_connector.integrations.alexa.lambda_functions import (  # noqa: E501 pylint: disable=import-outside-toplevel
+            configuration_manager,
+        )
+
+        monkeypatch.setattr(configuration_manager, "CONTAINER_WARM_CONCURRENCY", "3")
+        client = _FakeWarmLambdaClient()
+        results = self._warm(monkeypatch, client)
+
+        coverage = results["container_coverage"]["Smart Home Bridge Container"]
+        payload = json.loads(client.invocations[0]["Payload"])
+        assert len(client.invocations) == 6
+        assert {call["InvocationType"] for call in client.invocations} == {
+            "RequestResponse"
+        }
+        assert payload["hold_ms"] == configuration_manager.CONTAINER_WARM_HOLD_MS
+        assert (coverage["distinct_containers"], coverage["coverage"]) == (3, 1.0)
+        assert results["containers_warmed"] == 2
+
+    def test_provisioned_target_is_skipped(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an alias with provisioned concurrency is not invoked"""
+        client = _FakeWarmLambdaClient(provisioned={"live": 5})
+        results = self._warm(monkeypatch, client)
+
+        bridge = results["container_coverage"]["Smart Home Bridge Container"]
+        assert [call["FunctionName"] for call in client.invocations] == [
+            self.GATEWAY_ARN
+        ]
+        assert client.invocations[0]["InvocationType"] == "Event"
+        assert bridge["skipped"] == "provisioned_concurrency"
+        assert results["containers_warmed"] == 2
+
+    def test_arn_lookups_are_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that repeated runs resolve a target ARN from SSM once"""
+        with mock_aws():
+            ssm = boto3.client("ssm", region_name="us-east-1")
+            dynamodb = boto3.client("dynamodb", region_name="us-east-1")
+            configuration_manager = _bind_warmer_clients(monkeypatch, ssm, dynamodb)
+            monkeypatch.setattr(configuration_manager, "_lambda_arn_cache", {})
+            ssm.put_parameter(
+                Name=configuration_manager.SSM_SMART_HOME_BRIDGE_ARN,
+                Value=self.BRIDGE_ARN,
+                Type="String",
+            )
+            ssm_calls = _count_aws_calls(ssm)
+            arns = [
+                configuration_manager._get_lambda_arn_from_ssm(  # pylint: disable=protected-access
+                    "smart_home_bridge"
+                )
+                for _ in range(3)
+            ]
+
+        assert arns == [self.BRIDGE_ARN] * 3
+        assert ssm_calls == {"GetParameter": 1}
+
+    def test_warmup_hold_and_container_id(self) -> None:
+        """Test that warmups hold the container and identify it"""
+        start = time.perf_counter()
+        handled = shared_configuration.handle_warmup_request(
+            {"warmup": True, "hold_ms": 50}, "test", "smart_home_bridge"
+        )
+        held = time.perf_counter() - start
+        response = shared_configuration.create_warmup_response(
+            "smart_home_bridge", "test"
+        )
+        # pylint: disable=protected-access
+        container_id = shared_configuration._CONTAINER_ID
+
+        assert handled
+        assert held >= 0.05
+        assert json.loads(response["body"])["container_id"] == container_id
+
+
+class _FailingAwsClient:
+    """AWS client stand-in whose every operation is denied."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def __getattr__(self, operation: str) -> Any:
+        def _deny(*_args: Any, **_kwargs: Any) -> Any:
+            self.calls.append(operation)
+            raise ClientError(
+                {"Error": {"Code": "AccessDeniedException", "Message": "denied"}},
+                operation,
+            )
+
+        return _deny
+
+
+class TestConfigurationManagerHandler:
+    """Test the configuration manager Lambda handler end to end"""
+
+    def test_aws_outage_still_warms_containers(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that failing SSM and DynamoDB fall back and still warm containers"""
+        dynamodb = _FailingAwsClient()
+        configuration_manager = _bind_warmer_clients(
+            monkeypatch, _FailingAwsClient(), dynamodb
+        )
+        monkeypatch.setenv(
+            "CLOUDFLARE_SECURITY_GATEWAY_FUNCTION_ARN",
+            TestContainerWarmingFanOut.GATEWAY_ARN,
+        )
+        monkeypatch.setenv(
+            "SMART_HOME_BRIDGE_FUNCTION_ARN", TestContainerWarmingFanOut.BRIDGE_ARN
+        )
+        lambda_client = _FakeWarmLambdaClient()
+        monkeypatch.setattr(
+            configuration_manager, "_manager_lambda_client", lambda_client
+        )
+
+        response = configuration_manager.lambda_handler({}, None)
+
+        body = json.loads(response["body"])
+        assert response["statusCode"] == 200
+        assert body["configs_warmed"] == body["configs_attempted"] == 4
+        assert body["containers_warmed"] == 2
+        assert lambda_client.invocations
+        # The Gen 2 fallback pass does not check the cache table again
+        assert dynamodb.calls.count("describe_table") == 1
+
+
+class TestDeepWarmup:
+    """Test deep warmups that prepare a container for its first request"""
+
+    def test_phases_are_timed_and_failures_recorded(self) -> None:
+        """Test that a failing phase is recorded without stopping later phases"""
+        ran: list[str] = []
+
+        def failing() -> None:
+            raise ValueError("no config")
+
+        result = shared_configuration.run_warmup_phases(
+            [
+                ("configuration", failing),
+                ("directive_processing", lambda: ran.append("parser")),
+            ]
+        )
+
+        assert ran == ["parser"]
+        assert set(result["phases_ms"]) == {"configuration", "directive_processing"}
+        assert result["phase_errors"] == {"configuration": "ValueError"}
+
+    def test_connection_probe_leaves_pooled_connection(self, stand_in_url: str) -> None:
+        """Test that the first request after a probe reuses its connection"""
+        status = shared_configuration.warm_connection(stand_in_url)
+        pool = shared_configuration.get_connection_pool(stand_in_url)
+        pool.make_request("POST", f"{stand_in_url}/api/alexa/smart_home", body=b"{}")
+
+        assert status == 200
+        assert pool.last_request_reused
+
+    def test_bridge_deep_warmup_reports_phases(
+        self, monkeypatch: pytest.MonkeyPatch, stand_in_url: str
+    ) -> None:
+        """Test that a deep warmup loads config, connects and primes the parser"""
+        from custom_components.ha_external_connector.integrations.alexa.lambda_functions import (  # noqa: E501 pylint: disable=import-outside-toplevel
+            smart_home_bridge,
+        )
+
+        config = smart_home_bridge.configparser.ConfigParser()
+        config["appConfig"] = {"HA_BASE_URL": stand_in_url}
+        monkeypatch.setattr(smart_home_bridge, "_setup_configuration", lambda: config)
+        monkeypatch.setattr(smart_home_bridge, "app", None)
+
+        response = smart_home_bridge.lambda_handler(
+            {"warmup": True, "deep": True}, None
+        )
+        body = json.loads(response["body"])
+        pool_stats = shared_configuration.get_connection_pool_stats()
+
+        assert body["deep"] is True
+        assert set(body["phases_ms"]) == {
+            "configuration",
+            "ha_connection",
+            "directive_processing",
+        }
+        assert body["phase_errors"] == {}
+        assert pool_stats[stand_in_url]["requests"] == 1
+
+    def test_gateway_deep_warmup_probes_destination_host(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the gateway warms the destination host, not its token path"""
+        from custom_components.ha_external_connector.integrations.alexa.lambda_functions import (  # noqa: E501 pylint: disable=import-outside-toplevel
+            cloudflare_security_gateway,
+        )
+
+        snapshot = shared_configuration.OAuthConfigSnapshot(
+            destination_url="https://ha.example.com:8443/auth/token",
+            cf_client_id="client-id",
+            cf_client_secret="client-secret",
+            wrapper_secret="wrapper-secret",
+        )
+        monkeypatch.setattr(
+            cloudflare_security_gateway._oauth_config_snapshots,  # pylint: disable=protected-access
+            "get",
+            lambda _correlation_id: (snapshot, None),
+        )
+        probed: list[str] = []
+        monkeypatch.setattr(
+            cloudflare_security_gateway,
+            "warm_connection",
+            lambda base_url, *_args: probed.append(base_url),
+        )
+
+        # pylint: disable=protected-access
+        result = cloudflare_security_gateway._run_deep_warmup("test")
+
+        assert result["phase_errors"] == {}
+        assert probed == ["https://ha.example.com:8443"]
@@ -20,6 +20,7 @@ Usage:
     python alexa_smart_home_testing_suite.py --test <ID>       # Test endpoint
     python alexa_smart_home_testing_suite.py --save-files      # Save files permanently
     python alexa_smart_home_testing_suite.py --cleanup         # Clean up artifacts
+    python alexa_smart_home_testing_suite.py --benchmark       # Time directive parsing
 """
 
 import argparse
@@ -29,6 +30,7 @@ import logging
 import os
 import sys
 import tempfile
+import time
 import uuid
 from pathlib import Path
 from typing import Any
@@ -285,6 +287,15 @@ Examples:
         help="Clean up existing test artifacts and exit",
     )
 
+    parser.add_argument(
+        "--benchmark",
+        metavar="ITERATIONS",
+        type=int,
+        nargs="?",
+        const=100_000,
+        help="Benchmark local directive parsing (default: 100000 iterations)",
+    )
+
     return parser.parse_args()
 
 
@@ -408,6 +419,70 @@ def run_full_endpoint_test(
     logger.info("✅ Full test completed for %s", endpoint_id)
 
 
+def run_parser_benchmark(iterations: int) -> dict[str, dict[str, float]]:
+    """
+    Benchmark the Lambda's single-pass directive parser on suite directives.
+
+    Runs locally, no AWS calls: times parse_directive alone and the full
+    per-request path in smart_home_bridge (parse, validate, token, cache key)
+    for each directive type this suite sends.
+
+    Args:
+        iterations: Number of timed repetitions per directive type
+
+    Returns:
+        {directive_type: {"parse_ns": ..., "request_path_ns": ...}} per call
+    """
+    # Import the Lambda source from the repository checkout
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+    # pylint: disable-next=import-outside-toplevel
+    from custom_components.ha_external_connector.integrations.alexa.lambda_functions import (  # noqa: E501
+        shared_configuration,
+    )
+
+    parse_directive = shared_configuration.parse_directive
+    validator = shared_configuration.AlexaValidator
+    build_cache_key = shared_configuration.build_directive_cache_key
+
+    directives = {
+        "Alexa.PowerController.TurnOn": create_power_controller_directive(
+            "fan#guest_fan", "TurnOn"
+        ),
+        "Alexa.PowerController.TurnOff": create_power_controller_directive(
+            "fan#guest_fan", "TurnOff"
+        ),
+        "Alexa.Discovery.Discover": create_discovery_directive(),
+    }
+
+    logger.info("⏱️ Directive parser benchmark (%d iterations)", iterations)
+    results: dict[str, dict[str, float]] = {}
+    for directive_type, event in directives.items():
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            parse_directive(event)
+        parse_ns = (time.perf_counter_ns() - start) / iterations
+
+        start = time.perf_counter_ns()
+        for _ in range(iterations):
+            parsed = parse_directive(event)
+            validator.validate_directive(event, parsed)
+            validator.extract_auth_token(parsed.directive or {}, {}, parsed=parsed)
+            build_cache_key(event, parsed)
+        request_path_ns = (time.perf_counter_ns() - start) / iterations
+
+        results[directive_type] = {
+            "parse_ns": parse_ns,
+            "request_path_ns": request_path_ns,
+        }
+        logger.info(
+            "  %-32s parse %7.0f ns   request path %7.0f ns",
+            directive_type,
+            parse_ns,
+            request_path_ns,
+        )
+    return results
+
+
 def main():
     """Run comprehensive Alexa Smart Home testing or individual commands."""
     args = parse_arguments()
@@ -418,6 +493,10 @@ def main():
         cleanup_temp_files()
         return
 
+    if args.benchmark is not None:
+        run_parser_benchmark(args.benchmark)
+        return
+
     # Check if any individual command was specified
     if args.discovery:
         run_discovery_test(args.function, args.save_files)